@@ -3,17 +3,35 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+from collections.abc import Iterator
+from datetime import timedelta
+from typing import TYPE_CHECKING
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.helpers.typing import ConfigType
-
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_COUNTDOWN_MODE,
+    CONF_EVENT_LEAD_TIMES,
+    CONF_SCHEDULE_FORMAT,
+    COUNTDOWN_MODE_DURATION,
+    DEFAULT_EVENT_LEAD_TIMES,
+    SCHEDULE_FORMAT_LIST,
+)
 from .frontend import CezHdoCardRegistration
 
+if TYPE_CHECKING:
+    from .coordinator import CezHdoCoordinator
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "cez_hdo"
@@ -25,9 +43,44 @@ DATA_COORDINATOR = "coordinator"
 CONFIG_SCHEMA = vol.Schema({DOMAIN: cv.empty_config_schema}, extra=vol.ALLOW_EXTRA)
 
 
-def get_cache_dir(hass: HomeAssistant) -> Path:
-    """Get path to data directory using hass.config.path()."""
-    return Path(hass.config.path("custom_components", "cez_hdo", "data"))
+def iter_coordinators(hass: HomeAssistant) -> Iterator[CezHdoCoordinator]:
+    """Iterate over YAML and config entry coordinators."""
+    from .coordinator import yaml_coordinators
+
+    yield from yaml_coordinators(hass)
+    domain_data = hass.data.get(DOMAIN, {})
+    for value in domain_data.values():
+        if isinstance(value, dict) and DATA_COORDINATOR in value:
+            yield value[DATA_COORDINATOR]
+
+
+def find_coordinator(hass: HomeAssistant, ean: str | None, signal: str | None) -> CezHdoCoordinator:
+    """Return the first coordinator matching optional EAN/signal filters.
+
+    Raises:
+        ServiceValidationError: If no coordinator matches.
+    """
+    coordinator = next(
+        (c for c in iter_coordinators(hass) if (not ean or c.ean == ean) and (not signal or c.signal == signal)),
+        None,
+    )
+    if coordinator is None:
+        raise ServiceValidationError("No ČEZ HDO instance found for the given EAN/signal")
+    return coordinator
+
+
+def coordinator_for_entity(hass: HomeAssistant, entity_id: str) -> CezHdoCoordinator:
+    """Return the coordinator behind an entity of the integration.
+
+    Raises:
+        ServiceValidationError: If the entity does not belong to a loaded instance.
+    """
+    # Works for config entry and YAML entities alike (YAML unique IDs carry no signal)
+    for platform in async_get_platforms(hass, DOMAIN):
+        entity = platform.entities.get(entity_id)
+        if entity is not None and hasattr(entity, "coordinator"):
+            return entity.coordinator
+    raise ServiceValidationError(f"{entity_id} is not a loaded ČEZ HDO entity")
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -37,10 +90,6 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     # Initialize domain data storage
     hass.data.setdefault(DOMAIN, {})
 
-    # Ensure data directory exists
-    cache_dir = get_cache_dir(hass)
-    await hass.async_add_executor_job(lambda: cache_dir.mkdir(parents=True, exist_ok=True))
-
     # Register service to reload frontend card
     async def reload_frontend_card(call):
         """Service to reload frontend card."""
@@ -56,54 +105,32 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             _LOGGER.error("EAN parameter is required for list_signals service")
             return
 
-        from . import downloader
-        import requests
+        from . import api
 
         try:
-            url = downloader.BASE_URL
-            data = downloader.get_request_data(ean)
-
-            response = await hass.async_add_executor_job(
-                lambda: requests.post(
-                    url,
-                    json=data,
-                    timeout=10,
-                    headers={
-                        "Accept": "application/json, text/plain, */*",
-                        "Content-Type": "application/json",
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    },
+            json_data = await api.async_fetch_signals(async_get_clientsession(hass), ean)
+            signals = json_data.get("data", {}).get("signals", [])
+
+            # Group signals by signal name
+            signal_groups = {}
+            for signal in signals:
+                signal_name = signal.get("signal", "unknown")
+                if signal_name not in signal_groups:
+                    signal_groups[signal_name] = []
+                signal_groups[signal_name].append(
+                    {
+                        "den": signal.get("den", ""),
+                        "datum": signal.get("datum", ""),
+                        "casy": signal.get("casy", ""),
+                    }
                 )
-            )
 
-            if response.status_code == 200:
-                json_data = response.json()
-                signals = json_data.get("data", {}).get("signals", [])
-
-                # Group signals by signal name
-                signal_groups = {}
-                for signal in signals:
-                    signal_name = signal.get("signal", "unknown")
-                    if signal_name not in signal_groups:
-                        signal_groups[signal_name] = []
-                    signal_groups[signal_name].append(
-                        {
-                            "den": signal.get("den", ""),
-                            "datum": signal.get("datum", ""),
-                            "casy": signal.get("casy", ""),
-                        }
-                    )
-
-                # Log results - simplified
-                signal_names = list(signal_groups.keys())
-                _LOGGER.debug("CEZ HDO: Found signals: %s", ", ".join(signal_names))
-
-            else:
-                _LOGGER.error(
-                    "CEZ HDO: Failed to fetch signals, HTTP status: %s",
-                    response.status_code,
-                )
+            # Log results - simplified
+            signal_names = list(signal_groups.keys())
+            _LOGGER.debug("CEZ HDO: Found signals: %s", ", ".join(signal_names))
 
+        except aiohttp.ClientResponseError as e:
+            _LOGGER.error("CEZ HDO: Failed to fetch signals, HTTP status: %s", e.status)
         except Exception as e:
             _LOGGER.error("CEZ HDO: Error fetching signals: %s", e)
 
@@ -125,20 +152,18 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         low_price = call.data.get("low_tariff_price", 0.0)
         high_price = call.data.get("high_tariff_price", 0.0)
 
-        coordinators_updated = 0
-
-        # Check YAML coordinator (stored under DATA_COORDINATOR key)
-        coordinator = hass.data[DOMAIN].get(DATA_COORDINATOR)
-        if coordinator:
+        # YAML coordinators and config entry coordinators (stored under entry_id keys)
+        coordinators = list(iter_coordinators(hass))
+        coordinators_updated = len(coordinators)
+
+        # Prices live in the payload store shared by all coordinators of an EAN,
+        # which notifies all of them - set them once per store
+        stores_updated: set[int] = set()
+        for coordinator in coordinators:
+            if id(coordinator.payloads) in stores_updated:
+                continue
+            stores_updated.add(id(coordinator.payloads))
             await coordinator.async_set_prices(low_price, high_price)
-            coordinators_updated += 1
-
-        # Check config entry coordinators (stored under entry_id keys)
-        for key, value in hass.data[DOMAIN].items():
-            if isinstance(value, dict) and DATA_COORDINATOR in value:
-                entry_coordinator = value[DATA_COORDINATOR]
-                await entry_coordinator.async_set_prices(low_price, high_price)
-                coordinators_updated += 1
 
         if coordinators_updated == 0:
             # Fallback for when coordinator not yet initialized
@@ -152,8 +177,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             )
         else:
             _LOGGER.debug(
-                "CEZ HDO: Prices set on %d coordinator(s): NT=%.2f, VT=%.2f",
+                "CEZ HDO: Prices set on %d coordinator(s) of %d EAN(s): NT=%.2f, VT=%.2f",
                 coordinators_updated,
+                len(stores_updated),
                 low_price,
                 high_price,
             )
@@ -170,6 +196,131 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ),
     )
 
+    # Register service to find the cheapest run window for appliances
+    async def find_cheapest_window(call: ServiceCall) -> ServiceResponse:
+        """Service returning run windows with the most NT minutes or the lowest cost."""
+        coordinator = find_coordinator(hass, call.data.get("ean"), call.data.get("signal"))
+
+        duration: timedelta = call.data["duration"]
+        earliest_start = dt_util.as_local(call.data.get("earliest_start") or dt_util.now())
+        latest_end = dt_util.as_local(call.data.get("latest_end") or earliest_start + timedelta(days=7))
+        if latest_end <= earliest_start:
+            raise ServiceValidationError("latest_end must be after earliest_start")
+
+        windows = coordinator.find_cheapest_windows(
+            duration,
+            earliest_start,
+            latest_end,
+            objective=call.data["objective"],
+            power=call.data["power"],
+            max_results=call.data["max_results"],
+        )
+        duration_minutes = windows[0].nt_minutes + windows[0].vt_minutes if windows else 0
+
+        return {
+            "signal": coordinator.signal,
+            "windows": [
+                {
+                    "start": window.start.isoformat(),
+                    "end": window.end.isoformat(),
+                    "nt_minutes": window.nt_minutes,
+                    "vt_minutes": window.vt_minutes,
+                    "nt_ratio": round(window.nt_minutes / duration_minutes, 3),
+                    "cost": window.cost,
+                }
+                for window in windows
+            ],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        "find_cheapest_window",
+        find_cheapest_window,
+        schema=vol.Schema(
+            {
+                vol.Required("duration"): cv.positive_time_period,
+                vol.Optional("earliest_start"): cv.datetime,
+                vol.Optional("latest_end"): cv.datetime,
+                vol.Optional("ean"): cv.string,
+                vol.Optional("signal"): cv.string,
+                vol.Optional("objective", default="coverage"): vol.In(["coverage", "cost"]),
+                vol.Optional("power", default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional("max_results", default=3): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # Register service answering which tariff applied at a past (archived) time
+    async def tariff_at(call: ServiceCall) -> ServiceResponse:
+        """Service returning the archived tariff at the given time."""
+        coordinator = find_coordinator(hass, call.data.get("ean"), call.data.get("signal"))
+
+        moment = dt_util.as_local(call.data["time"])
+        low_tariff = await hass.async_add_executor_job(coordinator.archive.tariff_at, moment, coordinator.signal)
+        if low_tariff is None:
+            raise ServiceValidationError(f"No archived HDO schedule for {moment.date().isoformat()}")
+
+        return {
+            "time": moment.isoformat(),
+            "signal": coordinator.signal,
+            "tariff": "NT" if low_tariff else "VT",
+            "low_tariff_active": low_tariff,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        "tariff_at",
+        tariff_at,
+        schema=vol.Schema(
+            {
+                vol.Required("time"): cv.datetime,
+                vol.Optional("ean"): cv.string,
+                vol.Optional("signal"): cv.string,
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # Register service returning the full schedule (large attributes are not recorded)
+    async def get_schedule(call: ServiceCall) -> ServiceResponse:
+        """Service returning the graph schedule and optionally the raw payload."""
+        coordinator = find_coordinator(hass, call.data.get("ean"), call.data.get("signal"))
+
+        data = coordinator.data
+        response: dict = {
+            "signal": coordinator.signal,
+            "last_update": data.last_update.isoformat() if data.last_update else None,
+            "schedule": data.schedule,
+        }
+        if call.data["include_raw_data"]:
+            response["raw_json"] = data.raw_data
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        "get_schedule",
+        get_schedule,
+        schema=vol.Schema(
+            {
+                vol.Optional("ean"): cv.string,
+                vol.Optional("signal"): cv.string,
+                vol.Optional("include_raw_data", default=False): cv.boolean,
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # Register websocket commands used by the card
+    from .websocket import async_register_websocket_commands
+
+    async_register_websocket_commands(hass)
+
+    # Register HTTP endpoint serving the schedule with ETag revalidation
+    from .views import CezHdoScheduleView
+
+    hass.http.register_view(CezHdoScheduleView())
+
     # Register frontend card during setup
     cards = CezHdoCardRegistration(hass)
     await cards.async_register()
@@ -201,7 +352,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create coordinator
     from .coordinator import CezHdoCoordinator
 
-    coordinator = CezHdoCoordinator(hass, ean, signal)
+    coordinator = CezHdoCoordinator(
+        hass, ean, signal, event_lead_times=entry.data.get(CONF_EVENT_LEAD_TIMES, DEFAULT_EVENT_LEAD_TIMES)
+    )
     await coordinator.async_initialize()
 
     # Check for initial prices from config flow
@@ -220,6 +373,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "ean": ean,
         "signal": signal,
         "entity_suffix": entity_suffix,
+        CONF_COUNTDOWN_MODE: entry.data.get(CONF_COUNTDOWN_MODE, COUNTDOWN_MODE_DURATION),
+        CONF_SCHEDULE_FORMAT: entry.data.get(CONF_SCHEDULE_FORMAT, SCHEDULE_FORMAT_LIST),
     }
 
     # Forward setup to platforms
@@ -237,7 +392,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry_data = hass.data[DOMAIN].get(entry.entry_id, {})
     coordinator = entry_data.get(DATA_COORDINATOR)
     if coordinator:
-        coordinator.stop_state_updates()
+        await coordinator.async_unload()
 
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -246,10 +401,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Remove coordinator from hass.data
         hass.data[DOMAIN].pop(entry.entry_id, None)
 
-    # Unregister frontend card if no more entries
-    if not hass.data[DOMAIN]:
+    # Unregister frontend card and drop shared state once no coordinator is left
+    if not any(iter_coordinators(hass)):
         cards = CezHdoCardRegistration(hass)
         await cards.async_unregister()
 
+        from . import downloader
+        from .coordinator import DATA_YAML_COORDINATORS
+        from .timer_wheel import DATA_TIMER_WHEEL
+
+        downloader.clear_parse_caches()
+        hass.data[DOMAIN].pop(DATA_TIMER_WHEEL, None)
+        hass.data[DOMAIN].pop(DATA_YAML_COORDINATORS, None)
+
     _LOGGER.debug("async_unload_entry Done for %s", entry.entry_id)
     return unload_ok
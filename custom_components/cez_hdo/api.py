@@ -0,0 +1,152 @@
+"""Client for the ČEZ Distribuce portal API (CAPTCHA, EAN validation, signals)."""
+
+from __future__ import annotations
+
+import base64
+import logging
+from datetime import datetime
+from typing import Any
+
+import aiohttp
+
+from . import downloader
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTCHA_URL = "https://dip.cezdistribuce.cz/irj/portal/anonymous/captcha"
+
+# HTTP headers for CEZ API requests
+CEZ_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Content-Type": "application/json",
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+}
+
+# Per-request timeout for CEZ portal calls
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+class CaptchaSession:
+    """Class to hold CAPTCHA session data."""
+
+    def __init__(self, image_base64: str, cookies: dict[str, str]) -> None:
+        """Initialize CAPTCHA session.
+
+        Args:
+            image_base64: Base64 encoded CAPTCHA image (PNG).
+            cookies: Session cookies from CAPTCHA request.
+        """
+        self.image_base64 = image_base64
+        self.cookies = cookies
+
+
+def _cookies_to_dict(response: aiohttp.ClientResponse) -> dict[str, str]:
+    """Return cookies set by a response as a plain dictionary."""
+    return {name: morsel.value for name, morsel in response.cookies.items()}
+
+
+async def async_fetch_captcha(session: aiohttp.ClientSession) -> CaptchaSession:
+    """Fetch CAPTCHA image and session cookies from CEZ API.
+
+    Args:
+        session: Session of the flow, with a cookie jar that stores nothing.
+
+    Returns:
+        CaptchaSession with base64 encoded image and cookies.
+
+    Raises:
+        aiohttp.ClientError: If the request fails.
+        TimeoutError: If the request times out.
+    """
+    timestamp = int(datetime.now().timestamp() * 1000)
+    url = f"{CAPTCHA_URL}?t={timestamp}"
+
+    async with session.get(
+        url,
+        headers={
+            "User-Agent": CEZ_HEADERS["User-Agent"],
+            "Accept": "image/webp,image/png,*/*",
+        },
+        timeout=REQUEST_TIMEOUT,
+    ) as response:
+        response.raise_for_status()
+        content = await response.read()
+        # The CAPTCHA is bound to JSESSIONID; keep it with the CAPTCHA, not in a cookie jar
+        cookies = _cookies_to_dict(response)
+
+    # Encode image to base64
+    image_base64 = base64.b64encode(content).decode("utf-8")
+
+    _LOGGER.debug("CAPTCHA fetched successfully, cookies: %s", list(cookies.keys()))
+
+    return CaptchaSession(image_base64=image_base64, cookies=cookies)
+
+
+async def async_validate_ean_with_captcha(
+    session: aiohttp.ClientSession, ean: str, captcha_code: str, cookies: dict[str, str]
+) -> dict[str, Any]:
+    """Validate EAN with CAPTCHA code using session cookies.
+
+    Args:
+        session: Session of the flow, with a cookie jar that stores nothing.
+        ean: EAN number to validate.
+        captcha_code: CAPTCHA code entered by user.
+        cookies: Session cookies from CAPTCHA request.
+
+    Returns:
+        API response as dictionary.
+
+    Raises:
+        aiohttp.ClientError: If the request fails.
+        TimeoutError: If the request times out.
+        ValueError: If the API returns an error.
+    """
+    request_data = {"ean": ean, "captcha": captcha_code}
+
+    async with session.post(
+        downloader.BASE_URL,
+        json=request_data,
+        headers=CEZ_HEADERS,
+        cookies=cookies,
+        timeout=REQUEST_TIMEOUT,
+    ) as response:
+        status = response.status
+        json_data = await response.json(content_type=None)
+
+    # Check for CAPTCHA error
+    flash_messages = json_data.get("flashMessages", [])
+    for msg in flash_messages:
+        if msg.get("key") == "CPT-002":
+            raise ValueError("invalid_captcha")
+
+    if status != 200:
+        raise ValueError(f"API returned status {status}")
+
+    return json_data
+
+
+async def async_fetch_signals(session: aiohttp.ClientSession, ean: str) -> dict[str, Any]:
+    """Fetch switch times for an EAN without CAPTCHA.
+
+    Args:
+        session: Shared aiohttp session.
+        ean: EAN number.
+
+    Returns:
+        API response as dictionary.
+
+    Raises:
+        aiohttp.ClientError: If the request fails or returns an error status.
+        TimeoutError: If the request times out.
+    """
+    async with session.post(
+        downloader.BASE_URL,
+        json=downloader.get_request_data(ean),
+        headers=CEZ_HEADERS,
+        timeout=REQUEST_TIMEOUT,
+    ) as response:
+        response.raise_for_status()
+        return await response.json(content_type=None)
@@ -0,0 +1,281 @@
+"""Append-only archive of historical ČEZ HDO schedules."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from . import downloader
+from .const import DOMAIN, ean_suffix
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key for hass.data[DOMAIN] - archives shared by all coordinators of the same EAN
+DATA_ARCHIVES = "archives"
+
+# Keep archived days for a bit more than a year (yearly cost reconciliation)
+ARCHIVE_RETENTION_DAYS = 400
+# Compaction runs when expired days exceed this slack or there are too many small blocks
+COMPACT_SLACK_DAYS = 30
+COMPACT_MAX_BLOCKS = 256
+
+# Block header: magic, first day ordinal, last day ordinal, data length, CRC32 of data
+_MAGIC = b"HDOA"
+_HEADER = struct.Struct("<4sIIII")
+
+
+class ScheduleArchive:
+    """Append-only, compressed archive of every distinct day/signal schedule.
+
+    The file is a sequence of blocks. Each block is a header followed by
+    zlib-compressed JSON rows ``[signal, "YYYY-MM-DD", casy]`` and covers the
+    day range stored in its header. On open only the headers are read to build
+    a date index (day ordinal -> block offsets), so a day lookup decompresses
+    just the few blocks containing that day.
+
+    All methods are blocking and must run in the executor.
+    """
+
+    def __init__(self, path: Path, retention_days: int = ARCHIVE_RETENTION_DAYS) -> None:
+        """Initialize the archive.
+
+        Args:
+            path: Archive file path.
+            retention_days: Number of past days kept by compaction.
+        """
+        self.path = path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._blocks: list[tuple[int, int, int, int]] = []  # (offset, first, last, length)
+        self._index: dict[int, list[int]] = {}  # day ordinal -> block offsets
+        self._size = 0
+
+    def _load(self) -> None:
+        """Scan block headers and build the date index; drop a torn tail."""
+        if self._loaded:
+            return
+        self._blocks = []
+        self._index = {}
+        self._size = 0
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                total = os.fstat(f.fileno()).st_size
+                offset = 0
+                while offset + _HEADER.size <= total:
+                    magic, first, last, length, crc = _HEADER.unpack(f.read(_HEADER.size))
+                    if magic != _MAGIC or offset + _HEADER.size + length > total:
+                        break
+                    if zlib.crc32(f.read(length)) != crc:
+                        break
+                    self._add_block(offset, first, last, length)
+                    offset += _HEADER.size + length
+            self._size = offset
+            if offset != total:
+                _LOGGER.warning("ScheduleArchive: Dropping %d corrupted bytes from %s", total - offset, self.path)
+                with open(self.path, "r+b") as f:
+                    f.truncate(offset)
+        self._loaded = True
+
+    def _add_block(self, offset: int, first: int, last: int, length: int) -> None:
+        self._blocks.append((offset, first, last, length))
+        for ordinal in range(first, last + 1):
+            self._index.setdefault(ordinal, []).append(offset)
+
+    def _read_block(self, f: Any, offset: int) -> list[list[str]]:
+        f.seek(offset)
+        _magic, _first, _last, length, _crc = _HEADER.unpack(f.read(_HEADER.size))
+        return json.loads(zlib.decompress(f.read(length)))
+
+    def _rows_for_ordinals(self, ordinals: list[int]) -> list[list[str]]:
+        """Return archived rows of the given days, in append order."""
+        offsets = sorted({offset for ordinal in ordinals for offset in self._index.get(ordinal, ())})
+        if not offsets:
+            return []
+        wanted = {date.fromordinal(ordinal).isoformat() for ordinal in ordinals}
+        rows: list[list[str]] = []
+        with open(self.path, "rb") as f:
+            for offset in offsets:
+                rows.extend(row for row in self._read_block(f, offset) if row[1] in wanted)
+        return rows
+
+    @staticmethod
+    def _encode_block(rows: list[list[str]]) -> bytes:
+        ordinals = [date.fromisoformat(row[1]).toordinal() for row in rows]
+        data = zlib.compress(json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 9)
+        return _HEADER.pack(_MAGIC, min(ordinals), max(ordinals), len(data), zlib.crc32(data)) + data
+
+    def append(self, json_data: dict[str, Any], today: date | None = None) -> int:
+        """Append schedules of a payload that differ from their latest archived revision.
+
+        Args:
+            json_data: API response (or cache payload) with signals.
+            today: Current date used for retention (default: today in Prague).
+
+        Returns:
+            Number of newly archived day/signal schedules.
+        """
+        new_rows: list[list[str]] = []
+        for entry in downloader.extract_signals(json_data):
+            day = downloader.parse_signal_date(entry.get("datum"))
+            signal = entry.get("signal")
+            if day is None or not signal:
+                continue
+            row = [str(signal), day.isoformat(), str(entry.get("casy") or "")]
+            if row not in new_rows:
+                new_rows.append(row)
+
+        with self._lock:
+            self._load()
+            if new_rows:
+                ordinals = sorted({date.fromisoformat(row[1]).toordinal() for row in new_rows})
+                # Compare with the latest revision only, so a revision back to an
+                # older schedule (A -> B -> A) is archived again
+                latest = {(row[0], row[1]): row[2] for row in self._rows_for_ordinals(ordinals)}
+                new_rows = [row for row in new_rows if latest.get((row[0], row[1])) != row[2]]
+            if new_rows:
+                block = self._encode_block(new_rows)
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "ab") as f:
+                    f.write(block)
+                    f.flush()
+                    os.fsync(f.fileno())
+                _magic, first, last, length, _crc = _HEADER.unpack_from(block)
+                self._add_block(self._size, first, last, length)
+                self._size += len(block)
+
+            today = today or datetime.now(tz=downloader.CEZ_TIMEZONE).date()
+            if self._needs_compaction(today):
+                self._compact(today)
+        return len(new_rows)
+
+    def _needs_compaction(self, today: date) -> bool:
+        if not self._blocks:
+            return False
+        cutoff = today.toordinal() - self.retention_days - COMPACT_SLACK_DAYS
+        return min(block[1] for block in self._blocks) < cutoff or len(self._blocks) > COMPACT_MAX_BLOCKS
+
+    def compact(self, today: date | None = None) -> None:
+        """Drop days older than the retention period and merge small blocks."""
+        with self._lock:
+            self._load()
+            self._compact(today or datetime.now(tz=downloader.CEZ_TIMEZONE).date())
+
+    def _compact(self, today: date) -> None:
+        cutoff = today.toordinal() - self.retention_days
+        ordinals = sorted(ordinal for ordinal in self._index if ordinal >= cutoff)
+        rows = self._rows_for_ordinals(ordinals)
+        rows.sort(key=lambda row: row[1])  # stable - keeps append order within a day
+
+        # One block per month keeps blocks large enough to compress well
+        blocks: list[bytes] = []
+        month_rows: list[list[str]] = []
+        for row in rows:
+            if month_rows and month_rows[-1][1][:7] != row[1][:7]:
+                blocks.append(self._encode_block(month_rows))
+                month_rows = []
+            month_rows.append(row)
+        if month_rows:
+            blocks.append(self._encode_block(month_rows))
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for block in blocks:
+                    f.write(block)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+        _LOGGER.debug(
+            "ScheduleArchive: Compacted %s to %d blocks (%d rows)",
+            self.path,
+            len(blocks),
+            len(rows),
+        )
+        self._loaded = False
+        self._load()
+
+    def rows_for_day(self, day: date) -> list[tuple[str, str]]:
+        """Return archived (signal, casy) schedules of a day, latest last."""
+        with self._lock:
+            self._load()
+            return [(row[0], row[2]) for row in self._rows_for_ordinals([day.toordinal()])]
+
+    def iter_range(self, start: date, end: date) -> Iterator[tuple[date, str, str]]:
+        """Yield archived (day, signal, casy) schedules for days in [start, end]."""
+        with self._lock:
+            self._load()
+            ordinals = [o for o in range(start.toordinal(), end.toordinal() + 1) if o in self._index]
+            rows = self._rows_for_ordinals(ordinals)
+        rows.sort(key=lambda row: row[1])
+        for signal, day, casy in rows:
+            yield date.fromisoformat(day), signal, casy
+
+    @property
+    def days(self) -> list[date]:
+        """Return sorted archived days."""
+        with self._lock:
+            self._load()
+            return [date.fromordinal(ordinal) for ordinal in sorted(self._index)]
+
+    def timeline_for(self, day: date, preferred_signal: str | None = None) -> downloader.TariffTimeline:
+        """Compile a timeline of the archived day and its neighbours.
+
+        When a day/signal schedule was revised, the latest archived version wins.
+        """
+        latest: dict[tuple[date, str], str] = {}
+        for archived_day, signal, casy in self.iter_range(day - timedelta(days=1), day + timedelta(days=1)):
+            latest[(archived_day, signal)] = casy
+        payload = {
+            "data": {
+                "signals": [
+                    {"signal": signal, "datum": archived_day.strftime("%d.%m.%Y"), "casy": casy}
+                    for (archived_day, signal), casy in latest.items()
+                ]
+            }
+        }
+        return downloader.compile_timeline(payload, preferred_signal)
+
+    def tariff_at(self, moment: datetime, preferred_signal: str | None = None) -> bool | None:
+        """Return True if low tariff applied at the aware datetime, None if not archived."""
+        day = moment.astimezone(downloader.CEZ_TIMEZONE).date()
+        with self._lock:
+            self._load()
+            if day.toordinal() not in self._index:
+                return None
+        return self.timeline_for(day, preferred_signal).is_low_tariff(moment.timestamp())
+
+
+def get_archive(hass: HomeAssistant, ean: str) -> ScheduleArchive:
+    """Return the shared schedule archive of an EAN."""
+    archives: dict[str, ScheduleArchive] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_ARCHIVES, {})
+    ean_short = ean_suffix(ean)
+    if ean_short not in archives:
+        path = Path(hass.config.path(STORAGE_DIR, f"cez_hdo_archive.{ean_short}"))
+        archives[ean_short] = ScheduleArchive(path)
+    return archives[ean_short]
+
+
+@callback
+def async_release_archive(hass: HomeAssistant, ean: str) -> None:
+    """Forget the archive of an EAN once its payload store is released."""
+    hass.data.get(DOMAIN, {}).get(DATA_ARCHIVES, {}).pop(ean_suffix(ean), None)
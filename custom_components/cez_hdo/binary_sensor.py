@@ -12,15 +12,15 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.components.sensor import PLATFORM_SCHEMA as BASE_PLATFORM_SCHEMA
 from homeassistant.config_entries import ConfigEntry
 import homeassistant.helpers.config_validation as cv
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DOMAIN, DATA_COORDINATOR
-from .coordinator import CezHdoCoordinator, CezHdoData
-from .const import mask_ean, ean_short, sanitize_signal
+from .coordinator import CezHdoCoordinator, CezHdoData, async_get_yaml_coordinator
+from .const import ean_short, sanitize_signal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,8 +93,8 @@ async def async_setup_platform(
 
     await async_cleanup_entity_registry_if_ean_changed(hass, ean)
 
-    # Get or create coordinator (sensor platform creates it first usually)
-    coordinator = await _async_get_coordinator(hass, ean, signal)
+    # Get or create coordinator (shared with the sensor platform of the same EAN/signal)
+    coordinator = await async_get_yaml_coordinator(hass, ean, signal)
 
     # Create entities
     entities = [
@@ -114,32 +114,12 @@ def setup_platform(
     _LOGGER.warning("Synchronous setup_platform is deprecated. Use async_setup_platform instead.")
 
 
-async def _async_get_coordinator(hass: HomeAssistant, ean: str, signal: str | None) -> CezHdoCoordinator:
-    """Get or create coordinator instance."""
-    # Check if coordinator already exists (sensor platform usually creates it first)
-    if DOMAIN in hass.data and DATA_COORDINATOR in hass.data[DOMAIN]:
-        coordinator = hass.data[DOMAIN][DATA_COORDINATOR]
-        _LOGGER.debug("Using existing coordinator")
-        return coordinator
-
-    # Create new coordinator
-    coordinator = CezHdoCoordinator(hass, ean, signal)
-
-    # Initialize - this loads cache and triggers first refresh
-    # Use async_initialize() for YAML platforms (not async_config_entry_first_refresh)
-    await coordinator.async_initialize()
-
-    # Store in hass.data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][DATA_COORDINATOR] = coordinator
-
-    _LOGGER.debug("Created new coordinator for EAN: %s", mask_ean(ean))
-    return coordinator
-
-
 class CezHdoBinarySensor(CoordinatorEntity[CezHdoCoordinator], BinarySensorEntity):
     """Base class for CEZ HDO binary sensors using CoordinatorEntity."""
 
+    # Coordinator data fields this entity depends on; empty means any change
+    _watched_fields: frozenset[str] = frozenset()
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -213,6 +193,14 @@ class CezHdoBinarySensor(CoordinatorEntity[CezHdoCoordinator], BinarySensorEntit
         """Return the device class of the sensor."""
         return None
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a watched field changed in the coordinator update."""
+        changed = self.coordinator.changed_fields
+        if self._watched_fields and "last_update_success" not in changed and self._watched_fields.isdisjoint(changed):
+            return
+        super()._handle_coordinator_update()
+
     @property
     def data(self) -> CezHdoData:
         """Get coordinator data."""
@@ -222,6 +210,8 @@ class CezHdoBinarySensor(CoordinatorEntity[CezHdoCoordinator], BinarySensorEntit
 class LowTariffActive(CezHdoBinarySensor):
     """Binary sensor for low tariff active state."""
 
+    _watched_fields = frozenset({"low_tariff_active"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -241,6 +231,8 @@ class LowTariffActive(CezHdoBinarySensor):
 class HighTariffActive(CezHdoBinarySensor):
     """Binary sensor for high tariff active state."""
 
+    _watched_fields = frozenset({"high_tariff_active"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -260,6 +252,8 @@ class HighTariffActive(CezHdoBinarySensor):
 class DataValid(CezHdoBinarySensor):
     """Binary sensor indicating if cached HDO data is still valid."""
 
+    _watched_fields = frozenset({"data_is_valid"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
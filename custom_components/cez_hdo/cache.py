@@ -0,0 +1,98 @@
+"""Cache format for ČEZ HDO payloads."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any
+
+from .downloader import extract_signals
+
+try:
+    # orjson is optional - it is only a faster parser for the same JSON.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Version of the compact cache layout written by encode_cache()
+CACHE_FORMAT_VERSION = 2
+
+# Fields of a signal entry needed to rebuild the schedule, in row order
+SIGNAL_FIELDS = ("signal", "datum", "casy")
+
+
+def loads(content: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def encode_cache(raw_data: dict[str, Any], timestamp: datetime) -> dict[str, Any]:
+    """Encode a payload into the compact versioned cache layout.
+
+    Only the fields the parser uses are kept, as ``[signal, datum, casy]`` rows.
+    """
+    rows = [[str(s.get(field) or "") for field in SIGNAL_FIELDS] for s in extract_signals(raw_data)]
+    return {
+        "version": CACHE_FORMAT_VERSION,
+        "timestamp": timestamp.isoformat(),
+        "signals": rows,
+    }
+
+
+def payload_digest(cache_data: dict[str, Any]) -> str:
+    """Return a digest of the signal rows of encode_cache() output.
+
+    The timestamp is not included, so re-downloading identical switch times
+    keeps the digest.
+    """
+    rows = json.dumps(cache_data.get("signals") or [], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(rows.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def expand_rows(rows: list[list[str]]) -> dict[str, Any]:
+    """Rebuild an API-shaped payload from compact signal rows."""
+    return {"data": {"signals": [dict(zip(SIGNAL_FIELDS, row)) for row in rows]}}
+
+
+def decode_cache(content: bytes) -> tuple[dict[str, Any], datetime | None, int]:
+    """Decode cache file content of any known layout, see decode_cache_data()."""
+    return decode_cache_data(loads(content))
+
+
+def decode_cache_data(cache_data: Any) -> tuple[dict[str, Any], datetime | None, int]:
+    """Decode deserialized cache content of any known layout.
+
+    Supported layouts:
+    - version 2: ``{"version": 2, "timestamp": ..., "signals": [[signal, datum, casy], ...]}``
+    - version 1: ``{"timestamp": ..., "data": <API response>}``
+    - legacy: the API response stored directly
+
+    Returns:
+        Tuple of (payload in API shape, timestamp or None if unknown, layout
+        version where 0 is the legacy layout).
+
+    Raises:
+        ValueError: If the content is not a valid cache file.
+    """
+    if not isinstance(cache_data, dict):
+        raise ValueError("Cache content is not an object")
+
+    version = cache_data.get("version")
+    if version == CACHE_FORMAT_VERSION:
+        raw_data = expand_rows(cache_data.get("signals") or [])
+    elif version is not None:
+        raise ValueError(f"Unsupported cache version {version}")
+    elif "data" in cache_data and "timestamp" in cache_data:
+        raw_data = cache_data["data"]
+        version = 1
+    else:
+        return cache_data, None, 0
+
+    try:
+        timestamp = datetime.fromisoformat(cache_data["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        timestamp = None
+    return raw_data, timestamp, version
@@ -5,16 +5,29 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 import homeassistant.helpers.config_validation as cv
 
-from . import downloader
-from .const import mask_ean
+from . import api, payload_store
+from .const import (
+    CONF_COUNTDOWN_MODE,
+    CONF_EVENT_LEAD_TIMES,
+    CONF_SCHEDULE_FORMAT,
+    COUNTDOWN_MODE_DURATION,
+    COUNTDOWN_MODES,
+    DEFAULT_EVENT_LEAD_TIMES,
+    SCHEDULE_FORMAT_LIST,
+    SCHEDULE_FORMATS,
+    mask_ean,
+    parse_lead_times,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,13 +44,24 @@ CONF_LOW_TARIFF_PRICE = "low_tariff_price"
 CONF_HIGH_TARIFF_PRICE = "high_tariff_price"
 
 
+def _async_create_portal_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return a session for the CAPTCHA exchange of one flow.
+
+    The portal binds the CAPTCHA to the JSESSIONID cookie. Home Assistant's
+    shared session would store it in its cookie jar and send it with the
+    requests of other flows, so every flow gets its own session whose jar
+    stores nothing and passes the CAPTCHA cookies explicitly.
+    """
+    return async_create_clientsession(hass, auto_cleanup=False, cookie_jar=aiohttp.DummyCookieJar())
+
+
 async def validate_input_with_captcha(
-    hass: HomeAssistant, ean: str, captcha_code: str, cookies: dict[str, str]
+    session: aiohttp.ClientSession, ean: str, captcha_code: str, cookies: dict[str, str]
 ) -> dict[str, Any]:
     """Validate the user input with CAPTCHA.
 
     Args:
-        hass: Home Assistant instance.
+        session: Portal session of the flow.
         ean: EAN number to validate.
         captcha_code: CAPTCHA code entered by user.
         cookies: Session cookies from CAPTCHA request.
@@ -51,7 +75,7 @@ async def validate_input_with_captcha(
         InvalidCaptcha: If CAPTCHA code is invalid.
     """
     try:
-        json_data = await hass.async_add_executor_job(downloader.validate_ean_with_captcha, ean, captcha_code, cookies)
+        json_data = await api.async_validate_ean_with_captcha(session, ean, captcha_code, cookies)
 
         signals = json_data.get("data", {}).get("signals", [])
 
@@ -90,8 +114,28 @@ class CezHdoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
         self._signal: str | None = None
         self._entity_suffix: str | None = None
         self._available_signals: list[str] = []
-        self._captcha_session: downloader.CaptchaSession | None = None
+        self._captcha_session: api.CaptchaSession | None = None
         self._raw_data: dict[str, Any] | None = None
+        self._portal_session: aiohttp.ClientSession | None = None
+
+    @property
+    def portal_session(self) -> aiohttp.ClientSession:
+        """Return the portal session of this flow, created on first use."""
+        if self._portal_session is None:
+            self._portal_session = _async_create_portal_session(self.hass)
+        return self._portal_session
+
+    @callback
+    def _async_close_portal_session(self) -> None:
+        """Close the portal session once the CAPTCHA exchange is over."""
+        if self._portal_session is not None:
+            self.hass.async_create_task(self._portal_session.close())
+            self._portal_session = None
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the portal session when the flow is finished or aborted."""
+        self._async_close_portal_session()
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step - EAN input."""
@@ -131,7 +175,7 @@ class CezHdoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
             else:
                 try:
                     info = await validate_input_with_captcha(
-                        self.hass,
+                        self.portal_session,
                         self._ean,
                         captcha_code,
                         self._captcha_session.cookies,
@@ -141,6 +185,7 @@ class CezHdoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
 
                     # Clear CAPTCHA session after successful validation
                     self._captcha_session = None
+                    self._async_close_portal_session()
 
                     # Proceed to signal selection
                     return await self.async_step_signal()
@@ -160,7 +205,7 @@ class CezHdoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
         # Fetch CAPTCHA image if not already fetched or on error
         if self._captcha_session is None:
             try:
-                self._captcha_session = await self.hass.async_add_executor_job(downloader.fetch_captcha)
+                self._captcha_session = await api.async_fetch_captcha(self.portal_session)
             except Exception as err:
                 _LOGGER.error("Failed to fetch CAPTCHA: %s", err)
                 errors["base"] = "captcha_fetch_failed"
@@ -316,8 +361,28 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
         self._ean: str | None = None
         self._signal: str | None = None
         self._available_signals: list[str] = []
-        self._captcha_session: downloader.CaptchaSession | None = None
+        self._captcha_session: api.CaptchaSession | None = None
         self._raw_data: dict[str, Any] | None = None
+        self._portal_session: aiohttp.ClientSession | None = None
+
+    @property
+    def portal_session(self) -> aiohttp.ClientSession:
+        """Return the portal session of this flow, created on first use."""
+        if self._portal_session is None:
+            self._portal_session = _async_create_portal_session(self.hass)
+        return self._portal_session
+
+    @callback
+    def _async_close_portal_session(self) -> None:
+        """Close the portal session once the CAPTCHA exchange is over."""
+        if self._portal_session is not None:
+            self.hass.async_create_task(self._portal_session.close())
+            self._portal_session = None
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the portal session when the flow is finished or aborted."""
+        self._async_close_portal_session()
 
     @property
     def config_entry(self) -> config_entries.ConfigEntry:
@@ -360,7 +425,7 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
             else:
                 try:
                     info = await validate_input_with_captcha(
-                        self.hass,
+                        self.portal_session,
                         self._ean or "",
                         captcha_code,
                         self._captcha_session.cookies,
@@ -370,6 +435,7 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
 
                     # Clear CAPTCHA session after successful validation
                     self._captcha_session = None
+                    self._async_close_portal_session()
 
                     # Proceed to signal selection
                     return await self.async_step_signal()
@@ -389,7 +455,7 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
         # Fetch CAPTCHA image if not already fetched or on error
         if self._captcha_session is None:
             try:
-                self._captcha_session = await self.hass.async_add_executor_job(downloader.fetch_captcha)
+                self._captcha_session = await api.async_fetch_captcha(self.portal_session)
             except Exception as err:
                 _LOGGER.error("Failed to fetch CAPTCHA: %s", err)
                 errors["base"] = "captcha_fetch_failed"
@@ -446,9 +512,22 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_prices(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle prices configuration step."""
+        errors: dict[str, str] = {}
+        current_lead_times = self._config_entry.data.get(CONF_EVENT_LEAD_TIMES, DEFAULT_EVENT_LEAD_TIMES)
         if user_input is not None:
+            try:
+                lead_times = parse_lead_times(user_input.get(CONF_EVENT_LEAD_TIMES, ""))
+            except ValueError:
+                errors[CONF_EVENT_LEAD_TIMES] = "invalid_lead_times"
+
+        if user_input is not None and not errors:
             low_price = user_input.get(CONF_LOW_TARIFF_PRICE, 0.0)
             high_price = user_input.get(CONF_HIGH_TARIFF_PRICE, 0.0)
+            entity_options = {
+                CONF_COUNTDOWN_MODE: user_input.get(CONF_COUNTDOWN_MODE, COUNTDOWN_MODE_DURATION),
+                CONF_SCHEDULE_FORMAT: user_input.get(CONF_SCHEDULE_FORMAT, SCHEDULE_FORMAT_LIST),
+                CONF_EVENT_LEAD_TIMES: lead_times,
+            }
 
             # Ensure EAN is set (should always be at this point)
             if self._ean is None:
@@ -458,11 +537,19 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
             new_data = {
                 CONF_EAN: self._ean,
                 CONF_SIGNAL: self._signal,
+                **entity_options,
+            }
+            old_entity_options = {
+                CONF_COUNTDOWN_MODE: self._config_entry.data.get(CONF_COUNTDOWN_MODE, COUNTDOWN_MODE_DURATION),
+                CONF_SCHEDULE_FORMAT: self._config_entry.data.get(CONF_SCHEDULE_FORMAT, SCHEDULE_FORMAT_LIST),
+                CONF_EVENT_LEAD_TIMES: current_lead_times,
             }
 
             # Update unique_id if EAN changed
             old_ean = self._config_entry.data.get(CONF_EAN)
-            if self._ean != old_ean:
+            old_signal = self._config_entry.data.get(CONF_SIGNAL)
+            ean_changed = self._ean != old_ean
+            if ean_changed:
                 # Update title and unique_id
                 self.hass.config_entries.async_update_entry(
                     self._config_entry,
@@ -478,11 +565,16 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
                 )
 
             # Save prices to coordinator
-            await self._save_prices(low_price, high_price)
+            await self._save_prices(low_price, high_price, ean_changed)
 
             # Save raw data to coordinator cache if we have it
             if self._raw_data:
-                await self._save_raw_data_to_cache()
+                await self._save_raw_data_to_cache(ean_changed)
+
+            # The coordinator is bound to its EAN and signal, entities pick their countdown mode /
+            # schedule format and the coordinator its event lead times on creation - reload to recreate them
+            if ean_changed or self._signal != old_signal or entity_options != old_entity_options:
+                self.hass.config_entries.async_schedule_reload(self._config_entry.entry_id)
 
             # Return empty options - all config is in data
             return self.async_create_entry(title="", data={})
@@ -505,12 +597,40 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
                 {
                     vol.Optional(CONF_LOW_TARIFF_PRICE, default=current_low_price): vol.Coerce(float),
                     vol.Optional(CONF_HIGH_TARIFF_PRICE, default=current_high_price): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_COUNTDOWN_MODE,
+                        default=self._config_entry.data.get(CONF_COUNTDOWN_MODE, COUNTDOWN_MODE_DURATION),
+                    ): vol.In(COUNTDOWN_MODES),
+                    vol.Optional(
+                        CONF_SCHEDULE_FORMAT,
+                        default=self._config_entry.data.get(CONF_SCHEDULE_FORMAT, SCHEDULE_FORMAT_LIST),
+                    ): vol.In(SCHEDULE_FORMATS),
+                    vol.Optional(
+                        CONF_EVENT_LEAD_TIMES,
+                        default=", ".join(str(minutes) for minutes in current_lead_times),
+                    ): cv.string,
                 }
             ),
+            errors=errors,
         )
 
-    async def _save_prices(self, low_price: float, high_price: float) -> None:
+    async def _async_load_new_payload_store(self) -> payload_store.PayloadStore:
+        """Return the loaded payload store of the newly selected EAN.
+
+        The coordinator still uses the store shared by all entries of the old
+        EAN until the entry reloads, so data of a changed EAN must not go
+        through it.
+        """
+        store = payload_store.get_payload_store(self.hass, self._ean or "")
+        await store.async_load()
+        return store
+
+    async def _save_prices(self, low_price: float, high_price: float, ean_changed: bool) -> None:
         """Save prices to coordinator."""
+        if ean_changed:
+            (await self._async_load_new_payload_store()).async_set_prices(low_price, high_price)
+            return
+
         from . import DOMAIN, DATA_COORDINATOR
 
         entry_data = self.hass.data.get(DOMAIN, {}).get(self._config_entry.entry_id, {})
@@ -519,10 +639,17 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
         if coordinator:
             await coordinator.async_set_prices(low_price, high_price)
 
-    async def _save_raw_data_to_cache(self) -> None:
+    async def _save_raw_data_to_cache(self, ean_changed: bool) -> None:
         """Save raw data from CAPTCHA validation to coordinator cache."""
+        if ean_changed and self._raw_data:
+            (await self._async_load_new_payload_store()).async_set_payload(self._raw_data)
+            _LOGGER.info(
+                "OptionsFlow: Saved raw data to storage for new EAN %s",
+                mask_ean(self._ean or ""),
+            )
+            return
+
         from . import DOMAIN, DATA_COORDINATOR
-        from datetime import datetime
 
         entry_data = self.hass.data.get(DOMAIN, {}).get(self._config_entry.entry_id, {})
         coordinator = entry_data.get(DATA_COORDINATOR)
@@ -535,16 +662,10 @@ class CezHdoOptionsFlow(config_entries.OptionsFlow):
         )
 
         if coordinator and self._raw_data:
-            # Save to cache file
-            await self.hass.async_add_executor_job(coordinator._save_to_cache, self._raw_data)
-            # Update coordinator data
-            coordinator._parse_data(self._raw_data)
-            coordinator.data.raw_data = self._raw_data
-            coordinator.data.last_update = datetime.now()
-            # Notify listeners
-            coordinator.async_set_updated_data(coordinator.data)
+            # Update coordinator data (persisted by a delayed storage save)
+            coordinator.async_set_payload(self._raw_data)
             _LOGGER.info(
-                "OptionsFlow: Saved raw data to cache for EAN %s",
+                "OptionsFlow: Saved raw data to storage for EAN %s",
                 mask_ean(self._ean or ""),
             )
         elif not coordinator:
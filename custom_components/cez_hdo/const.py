@@ -2,6 +2,25 @@
 
 DOMAIN = "cez_hdo"
 
+# How remaining-time sensors publish their state: an HH:MM string updated every
+# minute, or the end of the current window as a timestamp (changes only at switches)
+CONF_COUNTDOWN_MODE = "countdown_mode"
+COUNTDOWN_MODE_DURATION = "duration"
+COUNTDOWN_MODE_TIMESTAMP = "timestamp"
+COUNTDOWN_MODES = [COUNTDOWN_MODE_DURATION, COUNTDOWN_MODE_TIMESTAMP]
+
+# How the schedule sensor publishes the 7-day schedule: the ApexCharts-friendly
+# interval list, or the compact run-length encoding (an order of magnitude smaller)
+CONF_SCHEDULE_FORMAT = "schedule_format"
+SCHEDULE_FORMAT_LIST = "list"
+SCHEDULE_FORMAT_COMPACT = "compact"
+SCHEDULE_FORMATS = [SCHEDULE_FORMAT_LIST, SCHEDULE_FORMAT_COMPACT]
+
+# Bus event fired at every NT/VT switch and the configured minutes before it
+EVENT_TARIFF_CHANGE = "cez_hdo_tariff_change"
+CONF_EVENT_LEAD_TIMES = "event_lead_times"
+DEFAULT_EVENT_LEAD_TIMES = [15, 60]
+
 
 def mask_ean(ean: str) -> str:
     """Mask EAN for logging - show only last 6 digits.
@@ -48,3 +67,23 @@ def sanitize_signal(signal: str) -> str:
     for char in '|/\\:*?"<>':
         sanitized = sanitized.replace(char, "_")
     return sanitized
+
+
+def parse_lead_times(value: str | list[int]) -> list[int]:
+    """Parse event lead times in minutes, e.g. "15, 60" -> [15, 60].
+
+    Raises:
+        ValueError: If a value is not a positive whole number of minutes.
+    """
+    items = value.replace(";", ",").split(",") if isinstance(value, str) else value
+    lead_times = set()
+    for item in items:
+        if isinstance(item, str):
+            item = item.strip()
+            if not item:
+                continue
+        minutes = int(item)
+        if minutes <= 0:
+            raise ValueError(f"Lead time must be positive: {minutes}")
+        lead_times.add(minutes)
+    return sorted(lead_times)
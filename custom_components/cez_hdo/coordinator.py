@@ -2,21 +2,21 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+from bisect import bisect_right
 import logging
-from datetime import datetime, time, timedelta
-from pathlib import Path
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Any, Callable
 
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from . import downloader
-from .const import ean_suffix, mask_ean
+from . import downloader, payload_store, statistics, timer_wheel
+from .const import DEFAULT_EVENT_LEAD_TIMES, DOMAIN, EVENT_TARIFF_CHANGE, ean_suffix, mask_ean
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,15 +24,17 @@ _LOGGER = logging.getLogger(__name__)
 DATA_VALIDITY_DAYS = 6
 DATA_WARNING_DAYS = 5  # Show warning 1 day before expiry
 
-# Update interval for state recalculation - needs to be frequent for countdown
-STATE_UPDATE_INTERVAL = timedelta(seconds=5)
+# Number of days shown in the schedule graph
+SCHEDULE_DAYS = 7
 
-# Update interval for data expiry check
-DATA_CHECK_INTERVAL = timedelta(hours=1)
+# Names of the coordinator's timers on the shared timer wheel
+TIMER_BOUNDARY = "boundary"
+TIMER_COUNTDOWN = "countdown"
+TIMER_EXPIRY = "expiry"
+TIMER_TARIFF_EVENT = "tariff_event"
 
-# Cache directory and file - stored in custom_components/cez_hdo/data/
-CACHE_SUBDIR = "custom_components/cez_hdo/data"
-# File names are per-EAN: cache_{ean}.json, prices_{ean}.json
+# Key for hass.data[DOMAIN] - YAML coordinator tasks keyed by (EAN, signal)
+DATA_YAML_COORDINATORS = "yaml_coordinators"
 
 
 class CezHdoData:
@@ -48,11 +50,15 @@ class CezHdoData:
         self.low_tariff_start: time | None = None
         self.low_tariff_end: time | None = None
         self.low_tariff_duration: timedelta | None = None
+        # End of the current low tariff window (aware), None outside low tariff
+        self.low_tariff_ends_at: datetime | None = None
 
         self.high_tariff_active: bool = False
         self.high_tariff_start: time | None = None
         self.high_tariff_end: time | None = None
         self.high_tariff_duration: timedelta | None = None
+        # End of the current high tariff window (aware), None outside high tariff
+        self.high_tariff_ends_at: datetime | None = None
 
         # Schedule for card
         self.schedule: list[dict[str, Any]] = []
@@ -70,35 +76,79 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
         hass: HomeAssistant,
         ean: str,
         signal: str | None = None,
+        event_lead_times: list[int] | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name="ČEZ HDO",
-            update_interval=DATA_CHECK_INTERVAL,
         )
         self.ean = ean
         self.signal = signal
-        self._state_update_unsub: Callable[[], None] | None = None
-        self._warning_shown: bool = False
-        self._expired_shown: bool = False
-
-        # Use hass.config.path() for proper path resolution
-        # Cache files use EAN suffix (last 6 digits) to support multiple instances
-        self._cache_dir = Path(hass.config.path(CACHE_SUBDIR))
-        ean_short = ean_suffix(ean)
-        self._cache_file = self._cache_dir / f"cache_{ean_short}.json"
-        self._prices_file = self._cache_dir / f"prices_{ean_short}.json"
+        # State is recalculated at the next tariff boundary / midnight, and every
+        # minute only while a countdown (remaining time) entity is listening and
+        # its duration is counting down, i.e. during its own tariff.
+        # The timers of all coordinators share one domain-wide timer wheel.
+        self._state_updates_started: bool = False
+        self._timers = timer_wheel.get_timer_wheel(hass)
+        self._boundary_version: int = -1
+        # Listener count per duration field shown by countdown entities
+        self._countdown_fields: dict[str, int] = {}
+
+        # cez_hdo_tariff_change events: (fire epoch, switch epoch, low tariff starts,
+        # lead minutes) for every switch of the payload and every lead time, in order
+        self._event_lead_times: list[int] = (
+            DEFAULT_EVENT_LEAD_TIMES if event_lead_times is None else event_lead_times
+        )
+        self._tariff_events: list[tuple[float, float, bool, int]] = []
+        self._tariff_event_times: list[float] = []
+        self._tariff_events_version: int = -1
+        self._tariff_events_fired_until: float = 0.0
+
+        # Data validity day counters; they only change at last_update + N days
+        # (including the warning and expiry instants), so they are recomputed
+        # by a timer armed at exactly that instant
+        self._data_is_valid: bool = False
+        self._data_age_days: int = 0
+        self._days_until_expiry: int = 0
+
+        # Compiled tariff timeline and minute bitmap for the current payload
+        # (rebuilt only when a new payload arrives, restored from a snapshot on start)
+        self._timeline: downloader.TariffTimeline | None = None
+        self._bitmap: downloader.TariffBitmap | None = None
+        self._payload_version: int = 0
+
+        # Memoized graph schedule: per-day intervals for (payload version, signal)
+        self._schedule_key: tuple[int, str | None] | None = None
+        self._schedule_days: list[tuple[date, list[dict[str, Any]]]] = []
+        # Epoch-minute (websocket) and run-length (compact attribute) encodings of the
+        # same days, memoized per day for the schedule key
+        self._encoded_key: tuple[int, str | None] | None = None
+        self._encoded_days: dict[date, dict[str, Any]] = {}
+        self._run_length_days: dict[date, list[int]] = {}
+        self._compact_schedule: dict[str, Any] | None = None
+
+        # Per-field change detection - entities only write state when their fields changed
+        self._last_snapshot: dict[str, Any] = {}
+        self.changed_fields: frozenset[str] = frozenset()
+
+        # Payload, its signal index, prices and storage are shared by all signals of
+        # the EAN; this coordinator only compiles its own signal's view of them
+        self.payloads = payload_store.get_payload_store(hass, ean)
+        self._payloads_version: int = 0
+        self._unsub_payloads: Callable[[], None] | None = None
+        # Append-only history of every received day/signal schedule (shared per EAN)
+        self.archive = self.payloads.archive
 
         # Initialize data container
         self.data = CezHdoData()
 
         _LOGGER.debug(
-            "CezHdoCoordinator initialized: ean=%s, signal=%s, cache=%s",
+            "CezHdoCoordinator initialized: ean=%s, signal=%s, storage=%s",
             mask_ean(self.ean),
             self.signal,
-            self._cache_file,
+            self.payloads.path,
         )
 
     async def async_initialize(self) -> None:
@@ -107,11 +157,8 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
         This method is for YAML-based platforms. For config entry platforms,
         use async_config_entry_first_refresh() instead.
         """
-        # Ensure cache directory exists
-        await self.hass.async_add_executor_job(self._ensure_cache_dir)
-
-        # Load prices from storage
-        await self._async_load_prices()
+        # Load cached payload and prices from storage
+        await self._async_load_storage()
 
         # Check if we have initial data from config flow (CAPTCHA validation)
         _LOGGER.debug(
@@ -125,27 +172,22 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
                 "CezHdoCoordinator: Using initial data from config flow for EAN %s",
                 mask_ean(self.ean),
             )
-            # Save to cache and use it
-            await self.hass.async_add_executor_job(self._save_to_cache, initial_data)
-            self._parse_data(initial_data)
-            self.data.raw_data = initial_data
-            self.data.last_update = datetime.now()
+            # Share it with all signals of the EAN and schedule saving it to storage
+            self.payloads.async_set_payload(initial_data)
             # Clean up the temporary data
             self.hass.data.get("cez_hdo_initial_data", {}).pop(self.ean, None)
-            _LOGGER.debug("CezHdoCoordinator: Initial data saved to cache")
         else:
-            _LOGGER.debug("CezHdoCoordinator: No initial data found, trying cache")
-            # Try to load from cache first for quick startup
-            cache_loaded = await self.hass.async_add_executor_job(self._load_from_cache)
-            if cache_loaded:
-                _LOGGER.debug("CezHdoCoordinator: Loaded initial data from cache")
-
-            # Then do the actual refresh (doesn't raise ConfigEntryError)
+            # Do the actual refresh (doesn't raise ConfigEntryError)
             await self.async_refresh()
 
-        # Start periodic state recalculation (every 5 seconds)
+        # Start event-driven state recalculation (tariff boundaries, midnight)
         self._start_state_updates()
 
+    @property
+    def bitmap(self) -> downloader.TariffBitmap | None:
+        """Return minute-resolution low-tariff bitmap of the current payload."""
+        return self._bitmap
+
     @property
     def data_valid_until(self) -> datetime | None:
         """Return datetime when cached data expires."""
@@ -156,85 +198,303 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
     @property
     def data_is_valid(self) -> bool:
         """Return True if cached data is still valid."""
-        valid_until = self.data_valid_until
-        if valid_until is None:
-            return False
-        return datetime.now() < valid_until
+        return self._data_is_valid
 
     @property
     def days_until_expiry(self) -> int:
         """Return number of days until data expires (can be negative if expired)."""
-        valid_until = self.data_valid_until
-        if valid_until is None:
-            return 0
-        delta = valid_until - datetime.now()
-        return delta.days
+        return self._days_until_expiry
 
     @property
     def data_age_days(self) -> int:
         """Return how many days old the data is."""
-        if self.data.last_update is None:
-            return 0
-        return (datetime.now() - self.data.last_update).days
+        return self._data_age_days
+
+    def _update_validity(self) -> None:
+        """Recompute the data validity day counters."""
+        valid_until = self.data_valid_until
+        if self.data.last_update is None or valid_until is None:
+            self._data_is_valid = False
+            self._data_age_days = 0
+            self._days_until_expiry = 0
+            return
+        now = datetime.now()
+        self._data_is_valid = now < valid_until
+        self._data_age_days = (now - self.data.last_update).days
+        self._days_until_expiry = (valid_until - now).days
+
+    def _state_snapshot(self) -> dict[str, Any]:
+        """Return comparable values of all fields exposed by entities."""
+        data = self.data
+        return {
+            "last_update_success": self.last_update_success,
+            "low_tariff_active": data.low_tariff_active,
+            "low_tariff_start": data.low_tariff_start,
+            "low_tariff_end": data.low_tariff_end,
+            # Durations are displayed as HH:MM, so compare them at minute resolution
+            "low_tariff_duration": downloader.format_duration(data.low_tariff_duration),
+            "low_tariff_ends_at": data.low_tariff_ends_at,
+            "high_tariff_active": data.high_tariff_active,
+            "high_tariff_start": data.high_tariff_start,
+            "high_tariff_end": data.high_tariff_end,
+            "high_tariff_duration": downloader.format_duration(data.high_tariff_duration),
+            "high_tariff_ends_at": data.high_tariff_ends_at,
+            # The graph schedule is memoized, so its key identifies its content
+            "schedule": (self._schedule_key, self._schedule_days[0][0] if self._schedule_days else None),
+            "raw_data": self._payload_version,
+            "last_update": data.last_update,
+            "low_tariff_price": data.low_tariff_price,
+            "high_tariff_price": data.high_tariff_price,
+            "today": datetime.now(tz=downloader.CEZ_TIMEZONE).date(),
+            "data_valid_until": self.data_valid_until,
+            "data_is_valid": self.data_is_valid,
+            "data_age_days": self.data_age_days,
+            "days_until_expiry": self.days_until_expiry,
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Publish the per-field diff of the data, then notify listeners."""
+        snapshot = self._state_snapshot()
+        previous = self._last_snapshot
+        self.changed_fields = frozenset(
+            field for field, value in snapshot.items() if field not in previous or previous[field] != value
+        )
+        self._last_snapshot = snapshot
+        super().async_update_listeners()
 
     def _start_state_updates(self) -> None:
-        """Start periodic state recalculation."""
-        if self._state_update_unsub is not None:
+        """Start event-driven state recalculation."""
+        if self._state_updates_started:
             return  # Already started
 
-        self._state_update_unsub = async_track_time_interval(
-            self.hass,
-            self._async_recalculate_state,
-            STATE_UPDATE_INTERVAL,
-        )
-        _LOGGER.debug("CezHdoCoordinator: Started state updates every %s", STATE_UPDATE_INTERVAL)
+        self._state_updates_started = True
+        self._schedule_next_boundary()
+        self._schedule_expiry_deadline()
+        # Only upcoming events are fired, not those missed while stopped: a lead event
+        # of a switch less than the lead time away is skipped, not fired late
+        self._tariff_events_fired_until = datetime.now(tz=timezone.utc).timestamp()
+        self._schedule_tariff_event()
+        self._update_countdown_tick()
+        _LOGGER.debug("CezHdoCoordinator: Started event-driven state updates")
 
     def stop_state_updates(self) -> None:
-        """Stop periodic state recalculation."""
-        if self._state_update_unsub is not None:
-            self._state_update_unsub()
-            self._state_update_unsub = None
-            _LOGGER.debug("CezHdoCoordinator: Stopped state updates")
+        """Stop state recalculation timers."""
+        self._state_updates_started = False
+        self._timers.async_cancel_owner(self)
+        _LOGGER.debug("CezHdoCoordinator: Stopped state updates")
+
+    def _schedule_next_boundary(self) -> None:
+        """Arm a timer for the next NT/VT switch or Prague midnight, whichever comes first."""
+        if not self._state_updates_started:
+            self._timers.async_cancel(self, TIMER_BOUNDARY)
+            return
+
+        now = datetime.now(tz=downloader.CEZ_TIMEZONE)
+        # Midnight rolls the schedule graph even when no tariff switch happens then.
+        next_point = datetime.combine(
+            now.date() + timedelta(days=1),
+            time(0, 0),
+            tzinfo=downloader.CEZ_TIMEZONE,
+        )
+        if self._timeline is not None:
+            next_switch = self._timeline.next_boundary(now.timestamp())
+            if next_switch is not None and next_switch < next_point.timestamp():
+                next_point = datetime.fromtimestamp(next_switch, tz=downloader.CEZ_TIMEZONE)
+
+        self._timers.async_schedule(self, TIMER_BOUNDARY, next_point, self._async_handle_boundary)
+        self._boundary_version = self._payload_version
+        _LOGGER.debug("CezHdoCoordinator: Next state update at %s", next_point)
+
+    @callback
+    def _async_handle_boundary(self, _now: datetime) -> None:
+        """Handle a tariff switch or day rollover."""
+        self._async_recalculate_state()
+
+    def _build_tariff_events(self) -> None:
+        """Precompute the ordered tariff change events of the payload."""
+        events: list[tuple[float, float, bool, int]] = []
+        if self._timeline is not None:
+            for switch_ts, low_tariff in self._timeline.transitions():
+                events.append((switch_ts, switch_ts, low_tariff, 0))
+                events.extend(
+                    (switch_ts - lead * 60, switch_ts, low_tariff, lead) for lead in self._event_lead_times
+                )
+        events.sort()
+        self._tariff_events = events
+        self._tariff_event_times = [event[0] for event in events]
+        self._tariff_events_version = self._payload_version
+
+    def _schedule_tariff_event(self) -> None:
+        """Arm a timer at the next tariff change event."""
+        if not self._state_updates_started:
+            self._timers.async_cancel(self, TIMER_TARIFF_EVENT)
+            return
+        if self._tariff_events_version != self._payload_version:
+            self._build_tariff_events()
+            # A new payload must not replay events of switches already announced
+            self._tariff_events_fired_until = max(
+                self._tariff_events_fired_until, datetime.now(tz=timezone.utc).timestamp()
+            )
+
+        pos = bisect_right(self._tariff_event_times, self._tariff_events_fired_until)
+        if pos >= len(self._tariff_event_times):
+            self._timers.async_cancel(self, TIMER_TARIFF_EVENT)
+            return
+        next_event = datetime.fromtimestamp(self._tariff_event_times[pos], tz=timezone.utc)
+        self._timers.async_schedule(self, TIMER_TARIFF_EVENT, next_event, self._async_handle_tariff_event)
+
+    @callback
+    def _async_handle_tariff_event(self, now: datetime) -> None:
+        """Fire the tariff change events that are due."""
+        # The wheel passes its slot time, which is never before the event
+        now_ts = max(now.timestamp(), datetime.now(tz=timezone.utc).timestamp())
+        start = bisect_right(self._tariff_event_times, self._tariff_events_fired_until)
+        end = bisect_right(self._tariff_event_times, now_ts)
+        for _fire_ts, switch_ts, low_tariff, lead_time in self._tariff_events[start:end]:
+            switch_at = datetime.fromtimestamp(switch_ts, tz=downloader.CEZ_TIMEZONE)
+            self.hass.bus.async_fire(
+                EVENT_TARIFF_CHANGE,
+                {
+                    # Events are visible to every bus subscriber; never expose the full EAN
+                    "ean": ean_suffix(self.ean),
+                    "signal": self.signal,
+                    "tariff": "low" if low_tariff else "high",
+                    "low_tariff": low_tariff,
+                    "switch_at": switch_at.isoformat(),
+                    "lead_time": lead_time,
+                    "price": self.data.low_tariff_price if low_tariff else self.data.high_tariff_price,
+                },
+            )
+            _LOGGER.debug(
+                "CezHdoCoordinator: Fired %s (%s at %s, %d min ahead)",
+                EVENT_TARIFF_CHANGE,
+                "NT" if low_tariff else "VT",
+                switch_at,
+                lead_time,
+            )
+        self._tariff_events_fired_until = max(self._tariff_events_fired_until, now_ts)
+        self._schedule_tariff_event()
+
+    def _schedule_expiry_deadline(self) -> None:
+        """Arm a timer at the next whole day of data age.
+
+        The day counters, the warning (DATA_WARNING_DAYS) and the expiry
+        (DATA_VALIDITY_DAYS) all fall on last_update + N days. The deadline is
+        derived from the stored last_update, so it is re-armed after a restart
+        and a deadline missed while stopped is handled on start.
+        """
+        last_update = self.data.last_update
+        if not self._state_updates_started or last_update is None:
+            self._timers.async_cancel(self, TIMER_EXPIRY)
+            return
+        age_days = max((datetime.now() - last_update).days, 0)
+        # last_update is naive local time
+        deadline = (last_update + timedelta(days=age_days + 1)).astimezone()
+        self._timers.async_schedule(self, TIMER_EXPIRY, deadline, self._async_handle_expiry_deadline)
+        _LOGGER.debug("CezHdoCoordinator: Next data validity update at %s", deadline)
+
+    @callback
+    def _async_handle_expiry_deadline(self, _now: datetime) -> None:
+        """Update the day counters and show due expiry notifications."""
+        self._update_validity()
+        self._schedule_expiry_deadline()
+        self.hass.async_create_task(self._check_data_validity())
+        self.async_update_listeners()
+
+    @callback
+    def async_add_countdown_listener(self, duration_field: str) -> Callable[[], None]:
+        """Request minute-aligned updates while a countdown entity's duration runs.
+
+        Args:
+            duration_field: Data field shown by the entity, e.g. "low_tariff_duration".
+
+        Returns:
+            Callback removing the listener; the minute tick stops with the last one.
+        """
+        self._countdown_fields[duration_field] = self._countdown_fields.get(duration_field, 0) + 1
+        self._update_countdown_tick()
+
+        @callback
+        def remove_listener() -> None:
+            self._countdown_fields[duration_field] -= 1
+            if not self._countdown_fields[duration_field]:
+                del self._countdown_fields[duration_field]
+            self._update_countdown_tick()
+
+        return remove_listener
+
+    def _update_countdown_tick(self) -> None:
+        """Arm the minute tick only while a listened duration is counting down.
+
+        Outside its tariff a duration stays 00:00 until the next switch, which
+        the boundary timer already handles, so no minute tick runs then.
+        """
+        counting = self._state_updates_started and any(
+            (duration := getattr(self.data, field, None)) is not None and duration.total_seconds() > 0
+            for field in self._countdown_fields
+        )
+        if not counting:
+            self._timers.async_cancel(self, TIMER_COUNTDOWN)
+        elif not self._timers.is_scheduled(self, TIMER_COUNTDOWN):
+            self._schedule_countdown_tick()
+
+    def _schedule_countdown_tick(self, now: datetime | None = None) -> None:
+        """Arm the countdown tick at the start of the minute after now."""
+        now = now or datetime.now(tz=timezone.utc)
+        next_minute = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        self._timers.async_schedule(self, TIMER_COUNTDOWN, next_minute, self._async_handle_countdown_tick)
+
+    @callback
+    def _async_handle_countdown_tick(self, now: datetime) -> None:
+        """Handle the minute tick of countdown entities."""
+        self._schedule_countdown_tick(now)
+        self._async_recalculate_state(now)
 
     @callback
     def _async_recalculate_state(self, _now: datetime | None = None) -> None:
         """Recalculate current state based on cached data.
 
-        This is called every 5 seconds to update countdown timers
-        and active tariff states without fetching from API.
+        Called at tariff boundaries, at midnight and every minute while a
+        listened countdown is running, without fetching from API.
         """
         if self.data.raw_data is None:
             return  # No data to recalculate from
 
-        # Re-parse data with current time
-        self._parse_data(self.data.raw_data)
+        # Re-evaluate the indexed schedule with current time
+        self._parse_data()
+
+        # Re-arm the boundary timer after it fired or when the payload changed
+        if (
+            not self._timers.is_scheduled(self, TIMER_BOUNDARY)
+            or self._boundary_version != self._payload_version
+        ):
+            self._schedule_next_boundary()
 
         # Notify all listeners that data has changed
         self.async_set_updated_data(self.data)
 
-    def _ensure_cache_dir(self) -> None:
-        """Ensure cache directory exists."""
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
-
     async def _async_update_data(self) -> CezHdoData:
-        """Check data validity and load from cache.
+        """Check validity of the stored data.
 
         Due to CAPTCHA protection on ČEZ API, we only fetch data during
-        initial configuration. This method only checks cache validity
-        and shows notifications when data is about to expire.
+        initial configuration. The payload is kept in memory (and persisted
+        in storage), so this method only checks its validity and shows
+        notifications when data is about to expire.
         """
         try:
-            # Load data from cache
-            cache_loaded = await self.hass.async_add_executor_job(self._load_from_cache)
-
-            if not cache_loaded:
+            if self.data.raw_data is None:
                 raise UpdateFailed("No cached HDO data available. Please reconfigure the integration.")
 
+            # Payload may have changed - re-arm the boundary timer from the event loop
+            if self._boundary_version != self._payload_version:
+                self._schedule_next_boundary()
+
             # Check data age and show notifications
             await self._check_data_validity()
 
             _LOGGER.debug(
-                "CezHdoCoordinator: Data loaded from cache, low_tariff=%s",
+                "CezHdoCoordinator: Stored data checked, low_tariff=%s",
                 self.data.low_tariff_active,
             )
             return self.data
@@ -252,9 +512,8 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
         data_age = datetime.now() - self.data.last_update
         days_old = data_age.days
 
-        # Show warning notification at day 5
-        if days_old >= DATA_WARNING_DAYS and not self._warning_shown:
-            self._warning_shown = True
+        # Show warning notification at day 5 (once per payload, also across restarts)
+        if days_old >= DATA_WARNING_DAYS and self.payloads.async_mark_notified("warning"):
             days_remaining = DATA_VALIDITY_DAYS - days_old
             title, message = await self._get_notification_text("warning", days_old, days_remaining)
             await self._show_notification(
@@ -269,8 +528,7 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
             )
 
         # Show expired notification at day 6
-        if days_old >= DATA_VALIDITY_DAYS and not self._expired_shown:
-            self._expired_shown = True
+        if days_old >= DATA_VALIDITY_DAYS and self.payloads.async_mark_notified("expired"):
             title, message = await self._get_notification_text("expired", days_old, 0)
             await self._show_notification(
                 title=title,
@@ -350,76 +608,158 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
             },
         )
 
-    def _save_to_cache(self, data: dict[str, Any]) -> None:
-        """Save data to cache file (blocking)."""
-        try:
-            self._cache_dir.mkdir(parents=True, exist_ok=True)
-            cache_data = {
-                "timestamp": datetime.now().isoformat(),
-                "data": data,
-            }
-            _LOGGER.debug(
-                "CezHdoCoordinator._save_to_cache: saving to %s, data keys=%s",
-                self._cache_file,
-                list(data.keys()) if isinstance(data, dict) else "not a dict",
+    async def _async_load_storage(self) -> None:
+        """Load the shared payload of the EAN and compile this signal's view of it."""
+        if self._unsub_payloads is None:
+            # The store may have been released since construction (entry reload)
+            self.payloads = payload_store.get_payload_store(self.hass, self.ean)
+            self.archive = self.payloads.archive
+        await self.payloads.async_load()
+        if self._unsub_payloads is None:
+            self._unsub_payloads = self.payloads.async_add_listener(
+                self._async_payloads_updated, self._compiled_snapshot
             )
-            with open(self._cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            _LOGGER.debug("CezHdoCoordinator: Data saved to cache at %s", self._cache_file)
-        except Exception as err:
-            _LOGGER.warning("CezHdoCoordinator: Failed to save cache: %s", err)
 
-    def _load_from_cache(self) -> bool:
-        """Load data from cache file (blocking). Returns True if successful."""
+        self.data.low_tariff_price = self.payloads.low_tariff_price
+        self.data.high_tariff_price = self.payloads.high_tariff_price
+        if self.payloads.raw_data is None:
+            return
+
+        snapshot = self.payloads.snapshot(self.signal)
+        if snapshot and self._restore_snapshot(snapshot):
+            _LOGGER.debug("CezHdoCoordinator: Restored compiled schedule from snapshot")
+        else:
+            self._compile_payload()
+            # Persist a fresh snapshot so the next start is warm
+            self.payloads.async_schedule_save()
+            # Seed statistics with payloads stored before they existed
+            self._async_import_statistics()
+        self._parse_data()
+        _LOGGER.debug("CezHdoCoordinator: Loaded data from storage, timestamp=%s", self.data.last_update)
+
+    def _restore_snapshot(self, snapshot: dict[str, Any]) -> bool:
+        """Restore compiled timeline, bitmap and graph schedule from a stored snapshot.
+
+        The store only hands out snapshots made from the same payload rows, for
+        the same signal and by the same parser version. Returns True on success.
+        """
         try:
-            _LOGGER.debug(
-                "CezHdoCoordinator._load_from_cache: checking file %s, exists=%s",
-                self._cache_file,
-                self._cache_file.exists(),
-            )
-            if not self._cache_file.exists():
-                _LOGGER.debug("CezHdoCoordinator._load_from_cache: file does not exist")
-                return False
+            timeline = downloader.TariffTimeline.from_snapshot(snapshot["timeline"])
+            bitmap = downloader.TariffBitmap.from_snapshot(snapshot["bitmap"])
+            schedule_days = [(date.fromisoformat(day), intervals) for day, intervals in snapshot["schedule"]]
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("CezHdoCoordinator: Invalid schedule snapshot: %s", err)
+            return False
 
-            with open(self._cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+        self._use_payload()
+        self._timeline = timeline
+        self._bitmap = bitmap
+        # _parse_schedule() only rolls these days forward if the date changed
+        self._schedule_key = (self._payload_version, self.signal)
+        self._schedule_days = schedule_days
+        self.data.schedule = [interval for _, intervals in schedule_days for interval in intervals]
+        return True
 
-            _LOGGER.debug(
-                "CezHdoCoordinator._load_from_cache: loaded cache, keys=%s",
-                list(cache_data.keys()) if isinstance(cache_data, dict) else "not a dict",
+    @callback
+    def _compiled_snapshot(self, payload_digest: str) -> dict[str, Any] | None:
+        """Return a snapshot of the compiled schedule state for storage."""
+        if self._timeline is None or self._bitmap is None or self._payloads_version != self.payloads.version:
+            return None
+        return {
+            "parser_version": downloader.PARSER_VERSION,
+            "payload_digest": payload_digest,
+            "signal": self.signal,
+            "timeline": self._timeline.to_snapshot(),
+            "bitmap": self._bitmap.to_snapshot(),
+            "schedule": [[day.isoformat(), intervals] for day, intervals in self._schedule_days],
+        }
+
+    @callback
+    def _async_import_statistics(self) -> None:
+        """Write hourly NT share and price statistics of the whole payload in one batch."""
+        if self._timeline is None:
+            return
+        try:
+            statistics.async_import_statistics(
+                self.hass,
+                self.ean,
+                self.signal,
+                self._timeline,
+                self.data.low_tariff_price,
+                self.data.high_tariff_price,
             )
+        except Exception as err:
+            _LOGGER.warning("CezHdoCoordinator: Failed to import statistics: %s", err)
 
-            # Support new format with timestamp and old format
-            if "data" in cache_data and "timestamp" in cache_data:
-                raw_data = cache_data["data"]
-                try:
-                    self.data.last_update = datetime.fromisoformat(cache_data["timestamp"])
-                except Exception:
-                    self.data.last_update = datetime.now()
-                _LOGGER.debug(
-                    "CezHdoCoordinator._load_from_cache: new format, timestamp=%s",
-                    self.data.last_update,
-                )
-            else:
-                # Old format - data directly
-                raw_data = cache_data
-                self.data.last_update = datetime.now()
-                _LOGGER.debug("CezHdoCoordinator._load_from_cache: old format detected")
+    async def async_flush_storage(self) -> None:
+        """Write a pending delayed save of the EAN immediately (e.g. before unload)."""
+        await self.payloads.async_flush()
+
+    async def async_unload(self) -> None:
+        """Stop timers, persist pending changes and detach from the shared payload."""
+        self.stop_state_updates()
+        await self.async_flush_storage()
+        if self._unsub_payloads is not None:
+            self._unsub_payloads()
+            self._unsub_payloads = None
 
-            self.data.raw_data = raw_data
-            self._parse_data(raw_data)
+    @callback
+    def async_set_payload(self, raw_data: dict[str, Any]) -> None:
+        """Replace the payload of the EAN with freshly downloaded data and persist it.
 
-            _LOGGER.debug("CezHdoCoordinator: Loaded data from cache")
-            return True
+        All coordinators of the EAN pick it up through _async_payloads_updated().
+        """
+        self.payloads.async_set_payload(raw_data)
 
-        except Exception as err:
-            _LOGGER.warning("CezHdoCoordinator: Failed to load cache: %s", err)
-            return False
+    @callback
+    def _async_payloads_updated(self) -> None:
+        """Pick up a new shared payload or new prices."""
+        prices_changed = (self.data.low_tariff_price, self.data.high_tariff_price) != (
+            self.payloads.low_tariff_price,
+            self.payloads.high_tariff_price,
+        )
+        self.data.low_tariff_price = self.payloads.low_tariff_price
+        self.data.high_tariff_price = self.payloads.high_tariff_price
+
+        if self._payloads_version != self.payloads.version:
+            self._compile_payload()
+            self._async_import_statistics()
+            self._schedule_tariff_event()
+            # Re-evaluate state, re-arm timers and notify listeners
+            self._async_recalculate_state()
+            return
+
+        if prices_changed:
+            self._async_import_statistics()
+        self.async_set_updated_data(self.data)
+
+    def _use_payload(self) -> None:
+        """Point the data at the shared payload."""
+        self.data.raw_data = self.payloads.raw_data
+        self.data.last_update = self.payloads.last_update
+        self._payloads_version = self.payloads.version
+        self._update_validity()
+        self._schedule_expiry_deadline()
+        self._payload_version += 1
+
+    def _compile_payload(self) -> None:
+        """Compile this signal's timeline and bitmap from the shared signal index."""
+        self._use_payload()
+        index = self.payloads.index
+        if index is None:
+            self._timeline = None
+            self._bitmap = None
+            return
+        self._timeline = downloader.compile_timeline(index, self.signal)
+        self._bitmap = downloader.compile_bitmap(index, self.signal)
 
-    def _parse_data(self, raw_data: dict[str, Any]) -> None:
-        """Parse raw API data into structured format."""
+    def _parse_data(self) -> None:
+        """Evaluate the indexed payload into structured current state."""
+        if self._timeline is None or self._bitmap is None:
+            return
         try:
-            result = downloader.isHdo(raw_data, preferred_signal=self.signal)
+            now = datetime.now(tz=downloader.CEZ_TIMEZONE)
+            result = downloader.isHdo(self._timeline, now=now)
 
             # result is tuple: (low_active, low_start, low_end, low_duration,
             #                   high_active, high_start, high_end, high_duration)
@@ -433,52 +773,129 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
             self.data.high_tariff_end = result[6]
             self.data.high_tariff_duration = result[7]
 
+            # Durations are measured to the exact boundary, so these only change at switches
+            self.data.low_tariff_ends_at = now + result[3] if result[0] and result[3] else None
+            self.data.high_tariff_ends_at = now + result[7] if result[4] and result[7] else None
+
             # Parse schedule for card
-            self._parse_schedule(raw_data)
+            self._parse_schedule(self._bitmap)
+
+            # A countdown starts or ends with the tariff switch
+            self._update_countdown_tick()
 
         except Exception as err:
             _LOGGER.error("CezHdoCoordinator: Failed to parse data: %s", err)
 
-    def _parse_schedule(self, raw_data: dict[str, Any]) -> None:
-        """Parse schedule data for the card."""
+    def _parse_schedule(self, bitmap: downloader.TariffBitmap) -> None:
+        """Parse schedule data for the card.
+
+        The graph schedule only changes with the payload or the Prague date, so it
+        is memoized against (payload version, signal, first day). On day rollover
+        the past days are dropped and only the new days are generated.
+        """
         try:
-            # Use existing function from downloader
-            self.data.schedule = downloader.generate_schedule_for_graph(
-                raw_data,
-                preferred_signal=self.signal,
-                days_ahead=7,
-            )
+            today = datetime.now(tz=downloader.CEZ_TIMEZONE).date()
+            key = (self._payload_version, self.signal)
+            days = self._schedule_days
+
+            if key == self._schedule_key and days:
+                shift = (today - days[0][0]).days
+                if shift == 0:
+                    return  # Nothing changed, keep the same schedule list
+                if 0 < shift < SCHEDULE_DAYS:
+                    days = days[shift:]
+                else:
+                    days = []
+            else:
+                days = []
+
+            next_day = days[-1][0] + timedelta(days=1) if days else today
+            while len(days) < SCHEDULE_DAYS:
+                days.append((next_day, downloader.generate_schedule_day_for_graph(bitmap, next_day)))
+                next_day += timedelta(days=1)
+
+            self._schedule_key = key
+            self._schedule_days = days
+            self.data.schedule = [interval for _, intervals in days for interval in intervals]
         except Exception as err:
             _LOGGER.warning("CezHdoCoordinator: Failed to parse schedule: %s", err)
+            self._schedule_key = None
+            self._schedule_days = []
             self.data.schedule = []
 
-    async def _async_load_prices(self) -> None:
-        """Load prices from storage."""
-        prices = await self.hass.async_add_executor_job(self._load_prices)
-        self.data.low_tariff_price = prices.get("low_tariff_price", 0.0)
-        self.data.high_tariff_price = prices.get("high_tariff_price", 0.0)
+    def encoded_schedule(self) -> dict[str, dict[str, Any]]:
+        """Return the graph schedule days in compact epoch-minute form, keyed by ISO date.
 
-    def _load_prices(self) -> dict[str, float]:
-        """Load prices from file (blocking)."""
-        try:
-            if self._prices_file.exists():
-                with open(self._prices_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    _LOGGER.debug("CezHdoCoordinator: Loaded prices: %s", data)
-                    return data
-        except Exception as err:
-            _LOGGER.warning("CezHdoCoordinator: Failed to load prices: %s", err)
-        return {"low_tariff_price": 0.0, "high_tariff_price": 0.0}
+        Each day is encoded once per payload, see downloader.encode_schedule_day().
+        """
+        if self._bitmap is None:
+            return {}
+        self._reset_day_encodings()
+        encoded: dict[str, dict[str, Any]] = {}
+        for day, _intervals in self._schedule_days:
+            if day not in self._encoded_days:
+                self._encoded_days[day] = downloader.encode_schedule_day(self._bitmap, day)
+            encoded[day.isoformat()] = self._encoded_days[day]
+        # Drop days that rolled out of the graph window
+        for day in [day for day in self._encoded_days if day.isoformat() not in encoded]:
+            del self._encoded_days[day]
+        return encoded
+
+    def compact_schedule(self) -> dict[str, Any] | None:
+        """Return the graph schedule as per-day run lengths, see downloader.schedule_day_run_lengths().
+
+        The result is rebuilt only when the payload or the first day changes, and
+        each day is encoded once per payload.
+        """
+        if self._bitmap is None or not self._schedule_days:
+            return None
+        self._reset_day_encodings()
+        first_day = self._schedule_days[0][0]
+        if self._compact_schedule is not None and self._compact_schedule["start"] == first_day.isoformat():
+            return self._compact_schedule
+
+        days: list[list[int]] = []
+        for day, _intervals in self._schedule_days:
+            if day not in self._run_length_days:
+                self._run_length_days[day] = downloader.schedule_day_run_lengths(self._bitmap, day)
+            days.append(self._run_length_days[day])
+        for day in [day for day in self._run_length_days if day < first_day]:
+            del self._run_length_days[day]
+
+        self._compact_schedule = {
+            "version": downloader.SCHEDULE_COMPACT_VERSION,
+            "start": first_day.isoformat(),
+            "timezone": str(downloader.CEZ_TIMEZONE),
+            "days": days,
+        }
+        return self._compact_schedule
 
-    async def async_set_prices(self, low_price: float, high_price: float) -> None:
-        """Set tariff prices and save to storage."""
-        self.data.low_tariff_price = low_price
-        self.data.high_tariff_price = high_price
+    @property
+    def schedule_etag(self) -> str:
+        """Return a tag identifying the current graph schedule and prices.
 
-        await self.hass.async_add_executor_job(self._save_prices, low_price, high_price)
+        It changes with a new payload, the signal, the first graph day or the
+        prices, and is stable across restarts.
+        """
+        first_day = self._schedule_days[0][0].isoformat() if self._schedule_days else ""
+        last_update = self.data.last_update.isoformat() if self.data.last_update else ""
+        key = f"{last_update}|{self.signal}|{first_day}|{self.data.low_tariff_price}|{self.data.high_tariff_price}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _reset_day_encodings(self) -> None:
+        """Drop memoized day encodings when the schedule key changed."""
+        if self._encoded_key != self._schedule_key:
+            self._encoded_key = self._schedule_key
+            self._encoded_days = {}
+            self._run_length_days = {}
+            self._compact_schedule = None
 
-        # Notify listeners that data changed
-        self.async_set_updated_data(self.data)
+    async def async_set_prices(self, low_price: float, high_price: float) -> None:
+        """Set tariff prices of the EAN and save them to storage.
+
+        Prices are stored per EAN, so all coordinators of the EAN pick them up.
+        """
+        self.payloads.async_set_prices(low_price, high_price)
 
         _LOGGER.debug(
             "CezHdoCoordinator: Prices set: NT=%.2f, VT=%.2f",
@@ -486,22 +903,30 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
             high_price,
         )
 
-    def _save_prices(self, low_price: float, high_price: float) -> None:
-        """Save prices to file (blocking)."""
-        try:
-            self._cache_dir.mkdir(parents=True, exist_ok=True)
-            with open(self._prices_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    {"low_tariff_price": low_price, "high_tariff_price": high_price},
-                    f,
-                )
-            _LOGGER.debug(
-                "CezHdoCoordinator: Saved prices: NT=%.2f, VT=%.2f",
-                low_price,
-                high_price,
-            )
-        except Exception as err:
-            _LOGGER.warning("CezHdoCoordinator: Failed to save prices: %s", err)
+    def find_cheapest_windows(
+        self,
+        duration: timedelta,
+        earliest_start: datetime,
+        latest_end: datetime,
+        objective: str = "coverage",
+        power: float = 1.0,
+        max_results: int = 3,
+    ) -> list[downloader.TariffWindow]:
+        """Find best appliance run windows using the in-memory schedule and stored prices."""
+        if self._bitmap is None:
+            return []
+        return downloader.find_cheapest_windows(
+            self._bitmap,
+            duration,
+            earliest_start,
+            latest_end,
+            low_price=self.data.low_tariff_price,
+            high_price=self.data.high_tariff_price,
+            objective=objective,
+            power=power,
+            max_results=max_results,
+            timeline=self._timeline,
+        )
 
     @property
     def current_price(self) -> float:
@@ -509,3 +934,46 @@ class CezHdoCoordinator(DataUpdateCoordinator[CezHdoData]):
         if self.data.low_tariff_active:
             return self.data.low_tariff_price
         return self.data.high_tariff_price
+
+
+async def async_get_yaml_coordinator(hass: HomeAssistant, ean: str, signal: str | None) -> CezHdoCoordinator:
+    """Return the YAML coordinator of (EAN, signal), creating it exactly once.
+
+    The sensor and binary_sensor platforms set up concurrently; the first
+    caller starts the creation task and later callers await the same task
+    instead of building a duplicate. A failed creation is forgotten so the
+    next setup retries.
+    """
+    tasks: dict[tuple[str, str | None], asyncio.Task[CezHdoCoordinator]] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_YAML_COORDINATORS, {})
+    key = (ean, signal)
+    task = tasks.get(key)
+    if task is None:
+
+        async def _async_create() -> CezHdoCoordinator:
+            coordinator = CezHdoCoordinator(hass, ean, signal)
+            # Use async_initialize() for YAML platforms (not async_config_entry_first_refresh)
+            await coordinator.async_initialize()
+            _LOGGER.debug("Created new coordinator for EAN: %s, signal: %s", mask_ean(ean), signal)
+            return coordinator
+
+        task = tasks[key] = hass.async_create_task(_async_create(), f"cez_hdo coordinator {mask_ean(ean)}")
+    else:
+        _LOGGER.debug("Using existing coordinator for EAN: %s, signal: %s", mask_ean(ean), signal)
+
+    try:
+        # Shield - a cancelled platform setup must not cancel the shared creation
+        return await asyncio.shield(task)
+    except Exception:
+        if tasks.get(key) is task:
+            del tasks[key]
+        raise
+
+
+def yaml_coordinators(hass: HomeAssistant) -> list[CezHdoCoordinator]:
+    """Return the initialized YAML coordinators."""
+    tasks = hass.data.get(DOMAIN, {}).get(DATA_YAML_COORDINATORS, {})
+    return [
+        task.result() for task in tasks.values() if task.done() and not task.cancelled() and task.exception() is None
+    ]
@@ -107,7 +107,7 @@ def _get_redacted_raw_data(raw_data: dict[str, Any]) -> dict[str, Any]:
 
 
 async def _get_cache_info(hass: HomeAssistant, coordinator) -> dict[str, Any]:
-    """Get cache file information and content."""
+    """Get storage file information and content."""
     from datetime import datetime
     from pathlib import Path
     import json
@@ -115,8 +115,7 @@ async def _get_cache_info(hass: HomeAssistant, coordinator) -> dict[str, Any]:
     cache_info: dict[str, Any] = {}
 
     if coordinator:
-        cache_file = coordinator._cache_file
-        prices_file = coordinator._prices_file
+        storage_file = Path(coordinator.payloads.path)
 
         def get_file_info(file_path: Path, include_content: bool = False) -> dict[str, Any]:
             if file_path.exists():
@@ -137,14 +136,11 @@ async def _get_cache_info(hass: HomeAssistant, coordinator) -> dict[str, Any]:
                 return info
             return {"exists": False, "path": str(file_path)}
 
-        # Cache file - include content but redact it
-        cache_file_info = await hass.async_add_executor_job(get_file_info, cache_file, True)
-        if "content" in cache_file_info:
-            cache_file_info["content"] = _redact_cache_content(cache_file_info["content"])
-        cache_info["cache_file"] = cache_file_info
-
-        # Prices file - include full content (no sensitive data)
-        cache_info["prices_file"] = await hass.async_add_executor_job(get_file_info, prices_file, True)
+        # Storage file (cached payload and prices) - include content but redact it
+        storage_file_info = await hass.async_add_executor_job(get_file_info, storage_file, True)
+        if "content" in storage_file_info:
+            storage_file_info["content"] = _redact_cache_content(storage_file_info["content"])
+        cache_info["storage_file"] = storage_file_info
 
     return cache_info
 
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import base64
 import logging
-from datetime import datetime, time, timedelta
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, NamedTuple
 
-import requests
 
 try:
     # python 3.9+
@@ -16,108 +18,17 @@ except ImportError:
     # python 3.6-3.8
     from backports.zoneinfo import ZoneInfo  # type: ignore[no-redef]
 
+try:
+    # NumPy is optional - it only adds a matrix view of the schedule bitmap.
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 _LOGGER = logging.getLogger(__name__)
 
 BASE_URL = "https://dip.cezdistribuce.cz/irj/portal/anonymous/casy-spinani?path=switch-times/signals"
-CAPTCHA_URL = "https://dip.cezdistribuce.cz/irj/portal/anonymous/captcha"
 CEZ_TIMEZONE = ZoneInfo("Europe/Prague")
 
-# HTTP headers for CEZ API requests
-CEZ_HEADERS = {
-    "Accept": "application/json, text/plain, */*",
-    "Content-Type": "application/json",
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    ),
-}
-
-
-class CaptchaSession:
-    """Class to hold CAPTCHA session data."""
-
-    def __init__(self, image_base64: str, cookies: dict[str, str]) -> None:
-        """Initialize CAPTCHA session.
-
-        Args:
-            image_base64: Base64 encoded CAPTCHA image (PNG).
-            cookies: Session cookies from CAPTCHA request.
-        """
-        self.image_base64 = image_base64
-        self.cookies = cookies
-
-
-def fetch_captcha() -> CaptchaSession:
-    """Fetch CAPTCHA image and session cookies from CEZ API.
-
-    Returns:
-        CaptchaSession with base64 encoded image and cookies.
-
-    Raises:
-        requests.RequestException: If the request fails.
-    """
-    timestamp = int(datetime.now().timestamp() * 1000)
-    url = f"{CAPTCHA_URL}?t={timestamp}"
-
-    response = requests.get(
-        url,
-        headers={
-            "User-Agent": CEZ_HEADERS["User-Agent"],
-            "Accept": "image/webp,image/png,*/*",
-        },
-        timeout=10,
-    )
-    response.raise_for_status()
-
-    # Encode image to base64
-    image_base64 = base64.b64encode(response.content).decode("utf-8")
-
-    # Extract cookies
-    cookies = dict(response.cookies)
-
-    _LOGGER.debug("CAPTCHA fetched successfully, cookies: %s", list(cookies.keys()))
-
-    return CaptchaSession(image_base64=image_base64, cookies=cookies)
-
-
-def validate_ean_with_captcha(ean: str, captcha_code: str, cookies: dict[str, str]) -> dict[str, Any]:
-    """Validate EAN with CAPTCHA code using session cookies.
-
-    Args:
-        ean: EAN number to validate.
-        captcha_code: CAPTCHA code entered by user.
-        cookies: Session cookies from CAPTCHA request.
-
-    Returns:
-        API response as dictionary.
-
-    Raises:
-        requests.RequestException: If the request fails.
-        ValueError: If the API returns an error.
-    """
-    request_data = {"ean": ean, "captcha": captcha_code}
-
-    response = requests.post(
-        BASE_URL,
-        json=request_data,
-        headers=CEZ_HEADERS,
-        cookies=cookies,
-        timeout=10,
-    )
-
-    json_data = response.json()
-
-    # Check for CAPTCHA error
-    flash_messages = json_data.get("flashMessages", [])
-    for msg in flash_messages:
-        if msg.get("key") == "CPT-002":
-            raise ValueError("invalid_captcha")
-
-    if response.status_code != 200:
-        raise ValueError(f"API returned status {response.status_code}")
-
-    return json_data
-
 
 class HdoData(NamedTuple):
     """HDO data structure."""
@@ -137,22 +48,36 @@ def get_request_data(ean: str) -> dict:
     return {"ean": ean}
 
 
-def normalize_datum(datum_str: str | None) -> str | None:
-    """Normalize various date formats to 'DD.MM.YYYY' used by CEZ HDO."""
-    if not datum_str:
+# Bounded memoization of parsed strings. CEZ payloads repeat the same few 'datum'
+# and 'casy' values, so small caches are enough; clear_parse_caches() evicts them.
+PARSE_CACHE_SIZE = 256
+
+# Version of the compiled timeline/bitmap semantics. Bump it whenever parsing or
+# compilation changes, so persisted snapshots of compiled data are rebuilt.
+PARSER_VERSION = 1
+
+
+def _fast_datum(s: str) -> str | None:
+    """Normalize 'D.M.YYYY' / 'D.M.YY' without strptime, or return None."""
+    first = s.find(".")
+    second = s.find(".", first + 1)
+    if first <= 0 or second <= first + 1 or s.find(".", second + 1) != -1:
         return None
-    s = str(datum_str).strip()
-
-    # Common CEZ format, sometimes without leading zeros.
-    parts = [p.strip() for p in s.split(".")]
-    if len(parts) == 3 and all(p.isdigit() for p in parts):
-        day, month, year = parts
-        if len(year) == 2:
-            year = f"20{year}"
-        try:
-            return f"{int(day):02d}.{int(month):02d}.{int(year):04d}"
-        except ValueError:
-            pass
+    day = s[:first].strip()
+    month = s[first + 1 : second].strip()
+    year = s[second + 1 :].strip()
+    if not (day.isdecimal() and month.isdecimal() and year.isdecimal()):
+        return None
+    if len(year) == 2:
+        year = f"20{year}"
+    return f"{int(day):02d}.{int(month):02d}.{int(year):04d}"
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _normalize_datum_cached(s: str) -> str:
+    normalized = _fast_datum(s)
+    if normalized is not None:
+        return normalized
 
     # Fallback: try a few known formats.
     for fmt in ("%d.%m.%Y", "%d.%m.%y", "%Y-%m-%d"):
@@ -164,6 +89,13 @@ def normalize_datum(datum_str: str | None) -> str | None:
     return s
 
 
+def normalize_datum(datum_str: str | None) -> str | None:
+    """Normalize various date formats to 'DD.MM.YYYY' used by CEZ HDO."""
+    if not datum_str:
+        return None
+    return _normalize_datum_cached(str(datum_str).strip())
+
+
 def time_in_range(start: time, end: time, check_time: time) -> bool:
     """Check if time is in range, handling overnight periods."""
     if start <= end:
@@ -171,14 +103,33 @@ def time_in_range(start: time, end: time, check_time: time) -> bool:
     return start <= check_time or check_time <= end
 
 
+def _fast_time(s: str) -> time | None:
+    """Parse 'H:MM' / 'HH:MM' (including '24:00') without strptime, or return None."""
+    colon = s.find(":")
+    if colon not in (1, 2) or len(s) != colon + 3:
+        return None
+    hours = s[:colon]
+    minutes = s[colon + 1 :]
+    if not (hours.isdecimal() and minutes.isdecimal()):
+        return None
+    hour = int(hours)
+    minute = int(minutes)
+    if hour == 24 and minute == 0:
+        # Handle 24:00 as 00:00 (midnight of next day)
+        return time(0, 0)
+    if hour < 24 and minute < 60:
+        return time(hour, minute)
+    return None
+
+
 def parse_time(time_str: str | None) -> time | None:
     """Parse time string to time object."""
     if not time_str:
         return None
+    parsed = _fast_time(time_str.strip())
+    if parsed is not None:
+        return parsed
     try:
-        # Handle 24:00 as 00:00 (midnight of next day)
-        if time_str.strip() == "24:00":
-            return datetime.strptime("00:00", "%H:%M").time()
         return datetime.strptime(time_str, "%H:%M").time()
     except ValueError as err:
         _LOGGER.error("Error parsing time string '%s': %s", time_str, err)
@@ -215,16 +166,19 @@ def calculate_duration(from_time: time, to_time: time) -> timedelta:
     return duration
 
 
-def parse_time_periods(casy_string: str) -> list[tuple[time, time]]:
-    """Parse time periods from casy string like '00:00-06:00; 07:00-09:00'."""
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_time_periods_cached(casy_string: str) -> tuple[tuple[time, time], ...]:
     periods: list[tuple[time, time]] = []
-    if not casy_string:
-        return periods
 
-    # Split by semicolon and clean up whitespace
-    time_ranges = [period.strip() for period in casy_string.split(";") if period.strip()]
-
-    for time_range in time_ranges:
+    for time_range in casy_string.split(";"):
+        time_range = time_range.strip()
+        # Fast path for the usual 'HH:MM-HH:MM' token.
+        if len(time_range) == 11 and time_range[5] == "-":
+            start_time = _fast_time(time_range[:5])
+            end_time = _fast_time(time_range[6:])
+            if start_time is not None and end_time is not None:
+                periods.append((start_time, end_time))
+                continue
         if "-" in time_range:
             start_str, end_str = time_range.split("-", 1)
             start_time = parse_time(start_str.strip())
@@ -232,125 +186,350 @@ def parse_time_periods(casy_string: str) -> list[tuple[time, time]]:
             if start_time is not None and end_time is not None:
                 periods.append((start_time, end_time))
 
-    return periods
+    return tuple(periods)
 
 
-def get_today_schedule(json_data: dict, preferred_signal: str | None = None) -> list[tuple[time, time]]:
-    """Get today's schedule from API response."""
+def parse_time_periods(casy_string: str) -> list[tuple[time, time]]:
+    """Parse time periods from casy string like '00:00-06:00; 07:00-09:00'."""
+    if not casy_string:
+        return []
+    return list(_parse_time_periods_cached(casy_string))
+
+
+def clear_parse_caches() -> None:
+    """Evict memoized results of normalize_datum and parse_time_periods."""
+    _normalize_datum_cached.cache_clear()
+    _parse_time_periods_cached.cache_clear()
+
 
-    # Podpora více úrovní vnoření (pro kompatibilitu s různými API odpověďmi)
-    signals = None
+def extract_signals(json_data: dict) -> list[dict]:
+    """Extract signals list from API response.
+
+    Supports both structures:
+    - {"data": {"signals": [...]}}
+    - {"data": {"data": {"signals": [...]}}}
+    """
     if not json_data or "data" not in json_data:
-        _LOGGER.error("Invalid API response structure: missing 'data'")
         return []
-    data_level = json_data["data"]
-    # Pokud je další úroveň 'data', použij ji
+
+    data_level = json_data.get("data")
     if isinstance(data_level, dict) and "data" in data_level:
-        data_level = data_level["data"]
-    if isinstance(data_level, dict) and "signals" in data_level:
-        signals = data_level["signals"]
-    if signals is None:
+        data_level = data_level.get("data")
+
+    if isinstance(data_level, dict):
+        signals = data_level.get("signals")
+        if isinstance(signals, list):
+            return signals
+    return []
+
+
+def parse_signal_date(datum_str: str | None) -> date | None:
+    """Parse a CEZ 'datum' value into a date, or None if it is not a valid date."""
+    normalized = normalize_datum(datum_str)
+    if not normalized:
+        return None
+    parts = normalized.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        return date(int(parts[2]), int(parts[1]), int(parts[0]))
+    except ValueError:
+        return None
+
+
+class SignalIndex:
+    """Immutable index of parsed HDO periods keyed by (date, signal name).
+
+    Built once per payload, so date lookups are dictionary hits instead of
+    rescanning and re-normalizing the whole ``signals`` list every time.
+    """
+
+    __slots__ = ("_by_signal", "_by_date", "_signal_count", "signal_names")
+
+    def __init__(self, signals: list[dict]) -> None:
+        """Initialize the index.
+
+        Args:
+            signals: Signals list as returned by the CEZ API.
+        """
+        by_signal: dict[tuple[date, str], tuple[tuple[time, time], ...]] = {}
+        by_date: dict[date, tuple[tuple[time, time], ...]] = {}
+        signal_names: list[str] = []
+
+        for signal in signals:
+            if not isinstance(signal, dict):
+                continue
+            day = parse_signal_date(signal.get("datum"))
+            if day is None:
+                continue
+            casy = signal.get("casy", "")
+            periods = _parse_time_periods_cached(casy) if casy else ()
+            # The first entry for a day is the fallback when the preferred signal is missing.
+            by_date.setdefault(day, periods)
+            name = signal.get("signal")
+            if name:
+                by_signal.setdefault((day, name), periods)
+                if name not in signal_names:
+                    signal_names.append(name)
+
+        self._by_signal = MappingProxyType(by_signal)
+        self._by_date = MappingProxyType(by_date)
+        self._signal_count = len(signals)
+        self.signal_names: tuple[str, ...] = tuple(signal_names)
+
+    def __len__(self) -> int:
+        """Return number of signal entries the index was built from."""
+        return self._signal_count
+
+    def has_date(self, day: date) -> bool:
+        """Return True if the payload contains any signal for the day."""
+        return day in self._by_date
+
+    @property
+    def dates(self) -> list[date]:
+        """Return sorted list of dates present in the payload."""
+        return sorted(self._by_date)
+
+    def has_signal(self, day: date, signal_name: str) -> bool:
+        """Return True if the payload contains the given signal for the day."""
+        return (day, signal_name) in self._by_signal
+
+    def periods(self, day: date, preferred_signal: str | None = None) -> tuple[tuple[time, time], ...]:
+        """Return low-tariff periods for a day.
+
+        Uses the preferred signal when present, otherwise the first signal
+        listed for that day. Returns an empty tuple for unknown days.
+        """
+        if preferred_signal:
+            periods = self._by_signal.get((day, preferred_signal))
+            if periods is not None:
+                return periods
+        return self._by_date.get(day, ())
+
+
+def build_signal_index(json_data: dict | SignalIndex | None) -> SignalIndex:
+    """Build a SignalIndex from an API response (no-op for an existing index)."""
+    if isinstance(json_data, SignalIndex):
+        return json_data
+    return SignalIndex(extract_signals(json_data or {}))
+
+
+def get_today_schedule(
+    json_data: dict | SignalIndex, preferred_signal: str | None = None
+) -> list[tuple[time, time]]:
+    """Get today's schedule from API response."""
+    index = build_signal_index(json_data)
+    if not len(index):
         _LOGGER.error("Invalid API response structure: missing 'signals'")
         return []
 
     current_time = datetime.now(tz=CEZ_TIMEZONE)
+    today = current_time.date()
     today_date = current_time.strftime("%d.%m.%Y")
 
-    # Find all today's schedules
-    today_signals = []
-    for signal in signals:
-        if normalize_datum(signal.get("datum")) == today_date:
-            today_signals.append(signal)
-
-    if not today_signals:
+    if not index.has_date(today):
         # Extra diagnostics: show which dates exist (normalized)
-        available_dates_all = {normalize_datum(s.get("datum")) for s in signals if s.get("datum")}
-        available_dates = sorted([d for d in available_dates_all if d is not None])
         _LOGGER.warning(
             "No schedule found for today %s (available: %s)",
             today_date,
-            ", ".join([d for d in available_dates if d]),
+            ", ".join(d.strftime("%d.%m.%Y") for d in index.dates),
         )
         return []
 
     # If preferred signal is specified, try to find it
     if preferred_signal:
-        for signal in today_signals:
-            if signal.get("signal") == preferred_signal:
-                casy = signal.get("casy", "")
-                signal_name = signal.get("signal", "unknown")
-                _LOGGER.info(
-                    "Found preferred signal %s for today %s: %s",
-                    signal_name,
-                    today_date,
-                    casy,
-                )
-                return parse_time_periods(casy)
+        if index.has_signal(today, preferred_signal):
+            periods = index.periods(today, preferred_signal)
+            _LOGGER.info("Found preferred signal %s for today %s", preferred_signal, today_date)
+            return list(periods)
         _LOGGER.warning(
             "Preferred signal %s not found for today, using first available",
             preferred_signal,
         )
 
     # If no preferred signal or not found, pick the first one
-    first_signal = today_signals[0]
-    casy = first_signal.get("casy", "")
-    signal_name = first_signal.get("signal", "unknown")
-    _LOGGER.info("Using signal %s for today %s: %s", signal_name, today_date, casy)
+    _LOGGER.info("Using first available signal for today %s", today_date)
+    return list(index.periods(today))
 
-    return parse_time_periods(casy)
 
+def get_schedule_for_date(
+    json_data: dict | SignalIndex,
+    target_date: datetime,
+    preferred_signal: str | None = None,
+) -> list[tuple[time, time]]:
+    """Get schedule for a specific date from API response or a prebuilt SignalIndex."""
+    index = build_signal_index(json_data)
+    if not len(index):
+        _LOGGER.error("Invalid API response structure: missing 'signals'")
+        return []
 
-def _extract_signals(json_data: dict) -> list[dict]:
-    """Extract signals list from API response.
+    day = target_date.date() if isinstance(target_date, datetime) else target_date
+    return list(index.periods(day, preferred_signal))
 
-    Supports both structures:
-    - {"data": {"signals": [...]}}
-    - {"data": {"data": {"signals": [...]}}}
+
+class TariffTimeline:
+    """Compiled low-tariff timeline for one payload and signal.
+
+    Merged low-tariff intervals are stored as a flat, sorted tuple of UTC epoch
+    boundaries ``(start0, end0, start1, end1, ...)``. Even positions open a low
+    tariff window and odd positions close it, so the tariff active at any
+    instant is a single ``bisect`` away.
     """
-    if not json_data or "data" not in json_data:
-        return []
 
-    data_level = json_data.get("data")
-    if isinstance(data_level, dict) and "data" in data_level:
-        data_level = data_level.get("data")
+    __slots__ = ("boundaries", "_days")
 
-    if isinstance(data_level, dict):
-        signals = data_level.get("signals")
-        if isinstance(signals, list):
-            return signals
-    return []
+    def __init__(self, index: SignalIndex, preferred_signal: str | None = None) -> None:
+        """Compile the timeline.
 
+        Args:
+            index: Signal index of the payload.
+            preferred_signal: Optional preferred signal name.
+        """
+        intervals: list[tuple[float, float]] = []
+        days: set[date] = set()
+        for day in index.dates:
+            periods = index.periods(day, preferred_signal)
+            if periods:
+                days.add(day)
+            for start_t, end_t in periods:
+                start_dt = datetime.combine(day, start_t, tzinfo=CEZ_TIMEZONE)
+                end_dt = datetime.combine(day, end_t, tzinfo=CEZ_TIMEZONE)
+                # 24:00 is parsed as 00:00, so the period ends on the next day.
+                if end_dt <= start_dt:
+                    end_dt += timedelta(days=1)
+                intervals.append((start_dt.timestamp(), end_dt.timestamp()))
 
-def get_schedule_for_date(
-    json_data: dict,
-    target_date: datetime,
-    preferred_signal: str | None = None,
-) -> list[tuple[time, time]]:
-    """Get schedule for a specific date from API response."""
-    signals = _extract_signals(json_data)
-    if not signals:
-        _LOGGER.error("Invalid API response structure: missing 'signals'")
-        return []
+        intervals.sort()
 
-    date_str = target_date.strftime("%d.%m.%Y")
-    day_signals = [s for s in signals if normalize_datum(s.get("datum")) == date_str]
+        # Merge overlapping/adjacent intervals (adjacent is important for midnight joins).
+        boundaries: list[float] = []
+        for start_ts, end_ts in intervals:
+            if boundaries and start_ts <= boundaries[-1]:
+                boundaries[-1] = max(boundaries[-1], end_ts)
+            else:
+                boundaries.extend((start_ts, end_ts))
+
+        self.boundaries: tuple[float, ...] = tuple(boundaries)
+        self._days = frozenset(days)
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of the compiled timeline."""
+        return {
+            "boundaries": list(self.boundaries),
+            "days": sorted(day.isoformat() for day in self._days),
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> TariffTimeline:
+        """Restore a timeline from to_snapshot() output without recompiling."""
+        timeline = cls.__new__(cls)
+        timeline.boundaries = tuple(float(ts) for ts in snapshot["boundaries"])
+        timeline._days = frozenset(date.fromisoformat(day) for day in snapshot["days"])
+        return timeline
+
+    def has_data_near(self, day: date) -> bool:
+        """Return True if there are low-tariff periods for the day or its neighbours."""
+        return any(day + timedelta(days=offset) in self._days for offset in (-1, 0, 1))
+
+    def is_low_tariff(self, timestamp: float) -> bool:
+        """Return True if low tariff is active at the epoch timestamp (end is exclusive)."""
+        return bisect_right(self.boundaries, timestamp) % 2 == 1
+
+    def next_boundary(self, timestamp: float) -> float | None:
+        """Return epoch of the next tariff switch strictly after the timestamp."""
+        pos = bisect_right(self.boundaries, timestamp)
+        if pos < len(self.boundaries):
+            return self.boundaries[pos]
+        return None
 
-    if not day_signals:
-        return []
+    def horizon(self) -> tuple[float, float] | None:
+        """Return the epochs of the first day's and the day after the last day's Prague midnight."""
+        if not self._days:
+            return None
+        first_day, last_day = min(self._days), max(self._days)
+        return (
+            datetime.combine(first_day, time(0, 0), tzinfo=CEZ_TIMEZONE).timestamp(),
+            datetime.combine(last_day + timedelta(days=1), time(0, 0), tzinfo=CEZ_TIMEZONE).timestamp(),
+        )
+
+    def low_seconds(self, start_ts: float, end_ts: float) -> float:
+        """Return the seconds of low tariff within the epoch range [start_ts, end_ts)."""
+        boundaries = self.boundaries
+        pos = bisect_right(boundaries, start_ts)
+        total = 0.0
+        if pos % 2 == 1:
+            # Starts inside a low tariff window
+            total += min(boundaries[pos], end_ts) - start_ts
+            pos += 1
+        while pos < len(boundaries) and boundaries[pos] < end_ts:
+            total += min(boundaries[pos + 1], end_ts) - boundaries[pos]
+            pos += 2
+        return max(total, 0.0)
+
+    def transitions(self) -> list[tuple[float, bool]]:
+        """Return the ordered NT/VT switches as ``(epoch, low tariff starts)`` tuples.
+
+        A low tariff window touching the first or the last day's midnight is cut
+        by the payload horizon, not switched there, so such edges are left out.
+        """
+        horizon = self.horizon()
+        if not self.boundaries or horizon is None:
+            return []
+        horizon_start, horizon_end = horizon
+        return [
+            (ts, pos % 2 == 0)
+            for pos, ts in enumerate(self.boundaries)
+            if not (pos == 0 and ts <= horizon_start) and not (pos == len(self.boundaries) - 1 and ts >= horizon_end)
+        ]
+
+    def _at(self, pos: int) -> datetime:
+        return datetime.fromtimestamp(self.boundaries[pos], tz=CEZ_TIMEZONE)
+
+    def state_at(self, current_time: datetime) -> HdoData:
+        """Return HDO state for the given aware datetime."""
+        pos = bisect_right(self.boundaries, current_time.timestamp())
+        size = len(self.boundaries)
+
+        if pos % 2 == 1:
+            # Inside low tariff window [pos - 1, pos); next low window starts at pos + 1.
+            low_start_dt = self._at(pos - 1)
+            low_end_dt = self._at(pos)
+            return HdoData(
+                low_tariff_active=True,
+                low_tariff_start=low_start_dt.time(),
+                low_tariff_end=low_end_dt.time(),
+                low_tariff_duration=low_end_dt - current_time,
+                high_tariff_active=False,
+                high_tariff_start=low_end_dt.time(),
+                high_tariff_end=self._at(pos + 1).time() if pos + 1 < size else None,
+                high_tariff_duration=timedelta(0),
+            )
+
+        # High tariff: previous low window ended at pos - 1, next one spans [pos, pos + 1].
+        high_start = self._at(pos - 1).time() if pos > 0 else time(0, 0)
+        if pos >= size:
+            return HdoData(False, None, None, None, True, high_start, None, None)
+
+        next_low_start = self._at(pos)
+        return HdoData(
+            low_tariff_active=False,
+            low_tariff_start=next_low_start.time(),
+            low_tariff_end=self._at(pos + 1).time(),
+            low_tariff_duration=timedelta(0),
+            high_tariff_active=True,
+            high_tariff_start=high_start,
+            high_tariff_end=next_low_start.time(),
+            high_tariff_duration=next_low_start - current_time,
+        )
 
-    if preferred_signal:
-        for signal in day_signals:
-            if signal.get("signal") == preferred_signal:
-                casy = signal.get("casy", "")
-                return parse_time_periods(casy)
 
-    # Fallback: first available signal for that day
-    casy = day_signals[0].get("casy", "")
-    return parse_time_periods(casy)
+def compile_timeline(json_data: dict | SignalIndex, preferred_signal: str | None = None) -> TariffTimeline:
+    """Compile a TariffTimeline from an API response or a prebuilt SignalIndex."""
+    return TariffTimeline(build_signal_index(json_data), preferred_signal)
 
 
 def isHdo(
-    json_data: dict,
+    json_data: dict | SignalIndex | TariffTimeline,
     preferred_signal: str | None = None,
     now: datetime | None = None,
 ) -> tuple[
@@ -367,7 +546,8 @@ def isHdo(
     Determine HDO state for current timestamp.
 
     Args:
-        json_data: JSON response from CEZ new API
+        json_data: JSON response from CEZ new API, a prebuilt SignalIndex or a
+            compiled TariffTimeline (preferred_signal is then already applied)
         preferred_signal: Optional preferred signal name
 
     Returns:
@@ -376,143 +556,310 @@ def isHdo(
     """
     current_time = now.astimezone(CEZ_TIMEZONE) if now is not None else datetime.now(tz=CEZ_TIMEZONE)
 
-    # Initialize return values
-    low_tariff_active = False
-    low_start = low_end = None
-    low_duration = None
-    high_tariff_active = False
-    high_start = high_end = None
-    high_duration = None
+    if isinstance(json_data, TariffTimeline):
+        timeline = json_data
+    else:
+        timeline = compile_timeline(json_data, preferred_signal)
+
+    # Low-tariff windows spanning midnight (17:00-24:00 + 00:00-06:00) are merged in the
+    # timeline, so they are reported as one 17:00-06:00 window.
+    if not timeline.has_data_near(current_time.date()):
+        _LOGGER.error(
+            "No schedule data available for %s±1 day",
+            current_time.strftime("%d.%m.%Y"),
+        )
+        return HdoData(False, None, None, None, False, None, None, None)
 
-    try:
-        # Build low-tariff intervals as datetimes across yesterday/today/tomorrow.
-        # This fixes edge cases like 17:00-24:00 + 00:00-06:00 (next day) which should be displayed as 17:00-06:00.
-        days = [
-            current_time.date() - timedelta(days=1),
-            current_time.date(),
-            current_time.date() + timedelta(days=1),
-        ]
+    result = timeline.state_at(current_time)
 
-        low_intervals: list[tuple[datetime, datetime]] = []
-        for day in days:
-            day_dt = datetime.combine(day, time(0, 0), tzinfo=CEZ_TIMEZONE)
-            periods = get_schedule_for_date(json_data, day_dt, preferred_signal)
-            for start_t, end_t in periods:
-                start_dt = datetime.combine(day, start_t, tzinfo=CEZ_TIMEZONE)
-                end_dt = datetime.combine(day, end_t, tzinfo=CEZ_TIMEZONE)
-                if end_dt <= start_dt:
-                    end_dt += timedelta(days=1)
-                low_intervals.append((start_dt, end_dt))
-
-        if not low_intervals:
-            import json as _json
-
-            try:
-                _LOGGER.error(
-                    "No schedule data available for %s±1 day. Raw json_data: %s",
-                    current_time.strftime("%d.%m.%Y"),
-                    _json.dumps(json_data, ensure_ascii=False, indent=2),
-                )
-            except Exception as log_err:
-                _LOGGER.error(
-                    "No schedule data available. (Chyba při logování json_data: %s)",
-                    log_err,
-                )
-            return False, None, None, None, False, None, None, None
-
-        low_intervals.sort(key=lambda x: x[0])
+    if result.low_tariff_active:
+        _LOGGER.debug(
+            "[NT] IN LOW TARIFF: %s-%s, remaining: %s",
+            result.low_tariff_start,
+            result.low_tariff_end,
+            format_duration(result.low_tariff_duration),
+        )
+    elif result.high_tariff_end is not None:
+        _LOGGER.debug(
+            "[VT] IN HIGH TARIFF: %s-%s, remaining: %s, next low: %s",
+            result.high_tariff_start,
+            result.high_tariff_end,
+            format_duration(result.high_tariff_duration),
+            result.low_tariff_start,
+        )
+    else:
+        _LOGGER.error("Could not determine next low tariff period")
 
-        # Merge overlapping/adjacent intervals (adjacent is important for midnight joins).
-        merged: list[tuple[datetime, datetime]] = []
-        for start_dt, end_dt in low_intervals:
-            if not merged:
-                merged.append((start_dt, end_dt))
-                continue
-            last_start, last_end = merged[-1]
-            if start_dt <= last_end:
-                merged[-1] = (last_start, max(last_end, end_dt))
-            else:
-                merged.append((start_dt, end_dt))
-
-        # Find current low interval, if any (end is treated as exclusive to avoid overlaps).
-        current_low: tuple[datetime, datetime] | None = None
-        for start_dt, end_dt in merged:
-            if start_dt <= current_time < end_dt:
-                current_low = (start_dt, end_dt)
-                break
-
-        if current_low is not None:
-            low_tariff_active = True
-            low_start_dt, low_end_dt = current_low
-            low_start = low_start_dt.time()
-            low_end = low_end_dt.time()
-            low_duration = low_end_dt - current_time
-
-            # Next high tariff window is the gap until next low interval.
-            next_low = next((p for p in merged if p[0] >= low_end_dt), None)
-            high_start = low_end
-            high_end = next_low[0].time() if next_low is not None else None
-            high_duration = timedelta(0)
-
-            _LOGGER.debug(
-                "[NT] IN LOW TARIFF: %s-%s, remaining: %s",
-                low_start,
-                low_end,
-                format_duration(low_duration),
-            )
+    return result
+
+
+MINUTES_PER_DAY = 24 * 60
+_DAY_MASK = (1 << MINUTES_PER_DAY) - 1
+
+
+def _minute_of_day(t: time) -> int:
+    return t.hour * 60 + t.minute
+
+
+class TariffBitmap:
+    """Minute-resolution low-tariff bitmap for one payload and signal.
+
+    Each day is one packed 1440-bit integer (bit N set = low tariff in minute N
+    of the Prague wall-clock day) and the whole payload is concatenated into a
+    single horizon integer, so aggregates are shifts, masks and ``bit_count``
+    instead of per-period Python loops. When NumPy is available, ``matrix``
+    exposes the same data as a ``days x 1440`` boolean array.
+
+    Rows are indexed by wall-clock minute, so on the 23 h and 25 h DST days the
+    minute counts include the skipped hour and miss the repeated one. Queries
+    that must be exact in real time use the epoch-based TariffTimeline.
+    """
+
+    __slots__ = ("first_day", "rows", "horizon", "_matrix", "_edges", "_edge_prefix")
+
+    def __init__(self, index: SignalIndex, preferred_signal: str | None = None) -> None:
+        """Build the bitmap.
+
+        Args:
+            index: Signal index of the payload.
+            preferred_signal: Optional preferred signal name.
+        """
+        dates = index.dates
+        self.first_day: date | None = dates[0] if dates else None
+        rows: list[int] = []
+        if dates:
+            rows = [0] * ((dates[-1] - dates[0]).days + 1)
+            for day in dates:
+                pos = (day - dates[0]).days
+                for start_t, end_t in index.periods(day, preferred_signal):
+                    start_min = _minute_of_day(start_t)
+                    end_min = _minute_of_day(end_t)
+                    if end_min <= start_min:
+                        # 24:00 (parsed as 00:00) or a period crossing midnight.
+                        rows[pos] |= _DAY_MASK ^ ((1 << start_min) - 1)
+                        if end_min:
+                            if pos + 1 == len(rows):
+                                rows.append(0)
+                            rows[pos + 1] |= (1 << end_min) - 1
+                    else:
+                        rows[pos] |= ((1 << end_min) - 1) ^ ((1 << start_min) - 1)
+
+        self._set_rows(rows)
+
+    def _set_rows(self, rows: list[int]) -> None:
+        horizon = 0
+        for pos, row in enumerate(rows):
+            horizon |= row << (pos * MINUTES_PER_DAY)
+
+        self.rows: tuple[int, ...] = tuple(rows)
+        self.horizon: int = horizon
+        self._matrix: Any = None
+        self._edges: list[int] | None = None
+        self._edge_prefix: list[int] = []
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot (day rows as hex strings)."""
+        return {
+            "first_day": self.first_day.isoformat() if self.first_day else None,
+            "rows": [format(row, "x") for row in self.rows],
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> TariffBitmap:
+        """Restore a bitmap from to_snapshot() output without recompiling."""
+        bitmap = cls.__new__(cls)
+        first_day = snapshot["first_day"]
+        bitmap.first_day = date.fromisoformat(first_day) if first_day else None
+        bitmap._set_rows([int(row, 16) for row in snapshot["rows"]])
+        return bitmap
+
+    @property
+    def total_minutes(self) -> int:
+        """Return number of minutes covered by the bitmap."""
+        return len(self.rows) * MINUTES_PER_DAY
+
+    @property
+    def matrix(self) -> Any:
+        """Return a ``days x 1440`` NumPy boolean matrix, or None without NumPy."""
+        if np is None:
+            return None
+        if self._matrix is None:
+            packed = self.horizon.to_bytes(self.total_minutes // 8, "little")
+            bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), bitorder="little")
+            self._matrix = bits.astype(bool).reshape(len(self.rows), MINUTES_PER_DAY)
+        return self._matrix
+
+    def minute_index(self, moment: datetime) -> int:
+        """Return the bitmap minute index of an aware datetime (may be out of range)."""
+        if self.first_day is None:
+            return 0
+        local = moment.astimezone(CEZ_TIMEZONE)
+        return (local.date() - self.first_day).days * MINUTES_PER_DAY + local.hour * 60 + local.minute
+
+    def datetime_at(self, minute_index: int) -> datetime:
+        """Return the aware Prague datetime of a bitmap minute index."""
+        day_offset, minute = divmod(minute_index, MINUTES_PER_DAY)
+        day = (self.first_day or date.today()) + timedelta(days=day_offset)
+        return datetime.combine(day, time(minute // 60, minute % 60), tzinfo=CEZ_TIMEZONE)
+
+    def row(self, day: date) -> int:
+        """Return the packed low-tariff bits of a day (0 when the day is unknown)."""
+        if self.first_day is None:
+            return 0
+        pos = (day - self.first_day).days
+        if 0 <= pos < len(self.rows):
+            return self.rows[pos]
+        return 0
+
+    def nt_minutes(self, day: date) -> int:
+        """Return number of low-tariff minutes in a day."""
+        return self.row(day).bit_count()
+
+    def nt_minutes_per_day(self) -> list[int]:
+        """Return low-tariff minutes for every day of the bitmap."""
+        matrix = self.matrix
+        if matrix is not None:
+            return [int(count) for count in matrix.sum(axis=1)]
+        return [row.bit_count() for row in self.rows]
+
+    def nt_minutes_range(self, start_index: int, end_index: int) -> int:
+        """Return low-tariff minutes in the half-open minute index range."""
+        start_index = max(start_index, 0)
+        end_index = min(end_index, self.total_minutes)
+        if end_index <= start_index:
+            return 0
+        return ((self.horizon >> start_index) & ((1 << (end_index - start_index)) - 1)).bit_count()
+
+    def nt_minutes_between(self, start: datetime, end: datetime) -> int:
+        """Return low-tariff minutes overlapping the window [start, end)."""
+        return self.nt_minutes_range(self.minute_index(start), self.minute_index(end))
+
+    def nt_minutes_next(self, now: datetime, hours: int = 24) -> int:
+        """Return low-tariff minutes within the next ``hours`` hours."""
+        start_index = self.minute_index(now)
+        return self.nt_minutes_range(start_index, start_index + hours * 60)
+
+    @property
+    def edges(self) -> list[int]:
+        """Return sorted minute indexes where the tariff switches (first switch is VT -> NT)."""
+        if self._edges is None:
+            edges: list[int] = []
+            prefix: list[int] = []
+            # The horizon starts in VT, so even edges open and odd edges close NT runs.
+            bits = self.horizon ^ (self.horizon << 1)
+            nt_before = 0
+            while bits:
+                lowest = bits & -bits
+                minute = lowest.bit_length() - 1
+                if len(edges) % 2 == 1:
+                    nt_before += minute - edges[-1]
+                edges.append(minute)
+                prefix.append(nt_before)
+                bits ^= lowest
+            self._edges = edges
+            self._edge_prefix = prefix
+        return self._edges
+
+    def nt_minutes_before(self, minute_index: int) -> int:
+        """Return low-tariff minutes in [0, minute_index) using prefix sums over the edges."""
+        edges = self.edges
+        pos = bisect_right(edges, minute_index) - 1
+        if pos < 0:
+            return 0
+        nt_before = self._edge_prefix[pos]
+        if pos % 2 == 0:
+            nt_before += minute_index - edges[pos]
+        return nt_before
+
+    def runs(self, day: date) -> list[tuple[int, int, bool]]:
+        """Return merged (start_minute, end_minute, is_low_tariff) runs covering a day."""
+        row = self.row(day)
+        # Set bits of row ^ (row << 1) mark minutes where the tariff switches.
+        edges = (row ^ (row << 1)) & _DAY_MASK
+        edges &= ~1
+        runs: list[tuple[int, int, bool]] = []
+        start = 0
+        state = bool(row & 1)
+        while edges:
+            lowest = edges & -edges
+            minute = lowest.bit_length() - 1
+            runs.append((start, minute, state))
+            start = minute
+            state = not state
+            edges ^= lowest
+        runs.append((start, MINUTES_PER_DAY, state))
+        return runs
+
+
+def compile_bitmap(json_data: dict | SignalIndex, preferred_signal: str | None = None) -> TariffBitmap:
+    """Build a TariffBitmap from an API response or a prebuilt SignalIndex."""
+    return TariffBitmap(build_signal_index(json_data), preferred_signal)
+
+
+def generate_schedule_day_for_graph(bitmap: TariffBitmap, target_date: date) -> list[dict]:
+    """Generate merged NT/VT graph intervals for a single day.
+
+    See generate_schedule_for_graph for the format of returned intervals.
+    A run ending at 24:00 is reported as ending at 23:59:59 of the same day.
+    """
+    schedule: list[dict] = []
+    for start_min, end_min, is_low in bitmap.runs(target_date):
+        start_dt = datetime.combine(target_date, time(start_min // 60, start_min % 60), tzinfo=CEZ_TIMEZONE)
+        if end_min == MINUTES_PER_DAY:
+            end_dt = datetime.combine(target_date, time(23, 59, 59), tzinfo=CEZ_TIMEZONE)
         else:
-            high_tariff_active = True
-
-            next_low = next((p for p in merged if p[0] > current_time), None)
-            prev_low = None
-            for start_dt, end_dt in merged:
-                if end_dt <= current_time:
-                    prev_low = (start_dt, end_dt)
-                else:
-                    break
-
-            # Determine high interval boundaries.
-            if prev_low is not None:
-                high_start = prev_low[1].time()
-            else:
-                high_start = time(0, 0)
-
-            if next_low is not None:
-                high_end = next_low[0].time()
-                high_duration = next_low[0] - current_time
-
-                # Next low tariff info (for display)
-                low_start = next_low[0].time()
-                low_end = next_low[1].time()
-                low_duration = timedelta(0)
-
-                _LOGGER.debug(
-                    "[VT] IN HIGH TARIFF: %s-%s, remaining: %s, next low: %s",
-                    high_start,
-                    high_end,
-                    format_duration(high_duration),
-                    low_start,
-                )
-            else:
-                _LOGGER.error("Could not determine next low tariff period")
-
-    except (KeyError, TypeError, ValueError) as err:
-        _LOGGER.error("Error processing schedule data: %s", err)
-
-    return (
-        low_tariff_active,
-        low_start,
-        low_end,
-        low_duration,
-        high_tariff_active,
-        high_start,
-        high_end,
-        high_duration,
-    )
+            end_dt = datetime.combine(target_date, time(end_min // 60, end_min % 60), tzinfo=CEZ_TIMEZONE)
+        schedule.append(
+            {
+                "start": start_dt.isoformat(),
+                "end": end_dt.isoformat(),
+                "tariff": "NT" if is_low else "VT",
+                "value": 1 if is_low else 0,
+            }
+        )
+    return schedule
+
+
+# Version of the run-length schedule encoding, see schedule_day_run_lengths()
+SCHEDULE_COMPACT_VERSION = 1
+
+
+def schedule_day_run_lengths(bitmap: TariffBitmap, target_date: date) -> list[int]:
+    """Return the lengths (minutes) of the alternating NT/VT runs of a day.
+
+    Runs always start with NT at 00:00, so the first length is 0 when the day
+    starts in VT. The lengths add up to 1440.
+    """
+    runs = bitmap.runs(target_date)
+    lengths = [] if runs[0][2] else [0]
+    lengths.extend(end_min - start_min for start_min, end_min, _is_low in runs)
+    return lengths
+
+
+def encode_schedule_day(bitmap: TariffBitmap, target_date: date) -> dict[str, Any]:
+    """Encode a day of the schedule as epoch-minute tariff switches.
+
+    Returns:
+        ``{"start": m, "end": m, "low": bool, "switches": [m, ...]}`` where ``m``
+        are minutes since the Unix epoch, ``low`` is the tariff at ``start`` and
+        every switch toggles it.
+    """
+
+    def epoch_minute(day: date, minute: int) -> int:
+        moment = datetime.combine(day, time(minute // 60, minute % 60), tzinfo=CEZ_TIMEZONE)
+        return int(moment.timestamp()) // 60
+
+    runs = bitmap.runs(target_date)
+    return {
+        "start": epoch_minute(target_date, 0),
+        "end": epoch_minute(target_date + timedelta(days=1), 0),
+        "low": runs[0][2],
+        "switches": [epoch_minute(target_date, start_min) for start_min, _end_min, _is_low in runs[1:]],
+    }
 
 
 def generate_schedule_for_graph(
-    json_data: dict,
+    json_data: dict | SignalIndex,
     preferred_signal: str | None = None,
     days_ahead: int = 7,
 ) -> list[dict]:
@@ -526,94 +873,183 @@ def generate_schedule_for_graph(
     ]
     """
     schedule: list[dict] = []
-    current_time = datetime.now(tz=CEZ_TIMEZONE)
+    today = datetime.now(tz=CEZ_TIMEZONE).date()
+    bitmap = compile_bitmap(json_data, preferred_signal)
 
     for day_offset in range(days_ahead):
-        target_date = current_time.date() + timedelta(days=day_offset)
-        day_dt = datetime.combine(target_date, time(0, 0), tzinfo=CEZ_TIMEZONE)
-
-        # Get NT periods for this day
-        nt_periods = get_schedule_for_date(json_data, day_dt, preferred_signal)
-
-        if not nt_periods:
-            # No data for this day - add full day as VT
-            day_start_dt = datetime.combine(target_date, time(0, 0), tzinfo=CEZ_TIMEZONE)
-            day_end_dt = datetime.combine(target_date, time(23, 59, 59), tzinfo=CEZ_TIMEZONE)
-            schedule.append(
-                {
-                    "start": day_start_dt.isoformat(),
-                    "end": day_end_dt.isoformat(),
-                    "tariff": "VT",
-                    "value": 0,
-                }
-            )
-            continue
+        schedule.extend(generate_schedule_day_for_graph(bitmap, today + timedelta(days=day_offset)))
 
-        # Sort periods by start time
-        nt_periods_sorted = sorted(nt_periods, key=lambda x: x[0])
-
-        # Build full day schedule (NT and VT intervals)
-        # Use minutes from midnight for easier comparison
-        def time_to_minutes(t: time) -> int:
-            return t.hour * 60 + t.minute
-
-        current_minute = 0  # Start of day (00:00)
-        end_of_day = 24 * 60  # End of day (24:00 = 1440 minutes)
-
-        for nt_start, nt_end in nt_periods_sorted:
-            nt_start_min = time_to_minutes(nt_start)
-            nt_end_min = time_to_minutes(nt_end)
-
-            # Handle 00:00 as end time = 24:00 (end of day)
-            if nt_end_min == 0 and nt_start_min > 0:
-                nt_end_min = end_of_day
-
-            # VT period before this NT (if there's a gap)
-            if current_minute < nt_start_min:
-                vt_start_h, vt_start_m = divmod(current_minute, 60)
-                vt_end_h, vt_end_m = divmod(nt_start_min, 60)
-                vt_start_dt = datetime.combine(target_date, time(vt_start_h, vt_start_m), tzinfo=CEZ_TIMEZONE)
-                vt_end_dt = datetime.combine(target_date, time(vt_end_h, vt_end_m), tzinfo=CEZ_TIMEZONE)
-                schedule.append(
-                    {
-                        "start": vt_start_dt.isoformat(),
-                        "end": vt_end_dt.isoformat(),
-                        "tariff": "VT",
-                        "value": 0,
-                    }
-                )
-
-            # NT period
-            nt_start_dt = datetime.combine(target_date, nt_start, tzinfo=CEZ_TIMEZONE)
-            # Handle end time - if it's 24:00 (represented as 00:00), use 23:59:59
-            if nt_end_min == end_of_day:
-                nt_end_dt = datetime.combine(target_date, time(23, 59, 59), tzinfo=CEZ_TIMEZONE)
-            else:
-                nt_end_dt = datetime.combine(target_date, nt_end, tzinfo=CEZ_TIMEZONE)
-
-            schedule.append(
-                {
-                    "start": nt_start_dt.isoformat(),
-                    "end": nt_end_dt.isoformat(),
-                    "tariff": "NT",
-                    "value": 1,
-                }
-            )
+    return schedule
 
-            current_minute = nt_end_min
-
-        # VT period after last NT until end of day (if needed)
-        if current_minute < end_of_day:
-            vt_start_h, vt_start_m = divmod(current_minute, 60)
-            vt_start_dt = datetime.combine(target_date, time(vt_start_h, vt_start_m), tzinfo=CEZ_TIMEZONE)
-            vt_end_dt = datetime.combine(target_date, time(23, 59, 59), tzinfo=CEZ_TIMEZONE)
-            schedule.append(
-                {
-                    "start": vt_start_dt.isoformat(),
-                    "end": vt_end_dt.isoformat(),
-                    "tariff": "VT",
-                    "value": 0,
-                }
-            )
 
-    return schedule
+class TariffWindow(NamedTuple):
+    """Candidate appliance run window."""
+
+    start: datetime
+    end: datetime
+    nt_minutes: int
+    vt_minutes: int
+    cost: float
+
+
+def _spans_dst_change(start: datetime, end: datetime) -> bool:
+    """Return True if a Prague day between the two datetimes is not 24 hours long."""
+    day = start.astimezone(CEZ_TIMEZONE).date()
+    last_day = end.astimezone(CEZ_TIMEZONE).date()
+    while day <= last_day:
+        next_day = day + timedelta(days=1)
+        if (
+            datetime.combine(day, time(0, 0), tzinfo=CEZ_TIMEZONE).utcoffset()
+            != datetime.combine(next_day, time(0, 0), tzinfo=CEZ_TIMEZONE).utcoffset()
+        ):
+            return True
+        day = next_day
+    return False
+
+
+def _window_candidates(edges: list[int], first: int, last: int, length: int) -> set[int]:
+    """Return window starts where the NT coverage can be optimal (range limits and switches)."""
+    candidates = {first, last}
+    for edge in edges[bisect_left(edges, first) : bisect_right(edges, last)]:
+        candidates.add(edge)
+    for edge in edges[bisect_left(edges, first + length) : bisect_right(edges, last + length)]:
+        candidates.add(edge - length)
+    return candidates
+
+
+def _rank_windows(
+    scored_starts: list[tuple[int, int]],
+    length: int,
+    start_at: Callable[[int], datetime],
+    low_price: float,
+    high_price: float,
+    objective: str,
+    power: float,
+    max_results: int,
+) -> list[TariffWindow]:
+    """Order (start, nt_minutes) candidates by the objective and build the best windows."""
+    scored: list[tuple[float, int, int]] = []
+    for start, nt in scored_starts:
+        cost = (nt * low_price + (length - nt) * high_price) * power / 60
+        score = -nt if objective == "coverage" else cost
+        scored.append((score, start, nt))
+    scored.sort()
+
+    return [
+        TariffWindow(
+            start=start_at(start),
+            end=start_at(start + length),
+            nt_minutes=nt,
+            vt_minutes=length - nt,
+            cost=round((nt * low_price + (length - nt) * high_price) * power / 60, 4),
+        )
+        for _, start, nt in scored[:max_results]
+    ]
+
+
+def _find_cheapest_windows_on_timeline(
+    timeline: TariffTimeline,
+    length: int,
+    earliest_start: datetime,
+    latest_end: datetime,
+    low_price: float,
+    high_price: float,
+    objective: str,
+    power: float,
+    max_results: int,
+) -> list[TariffWindow]:
+    """Search run windows on epoch minutes of the timeline (exact on DST days)."""
+    horizon = timeline.horizon()
+    if horizon is None:
+        return []
+
+    first = max(-int(-earliest_start.timestamp() // 60), int(horizon[0]) // 60)
+    last = min(int(latest_end.timestamp()) // 60, int(horizon[1]) // 60) - length
+    if last < first:
+        return []
+
+    edges = [int(boundary) // 60 for boundary in timeline.boundaries]
+    scored_starts = [
+        (start, round(timeline.low_seconds(start * 60, (start + length) * 60) / 60))
+        for start in _window_candidates(edges, first, last, length)
+    ]
+    return _rank_windows(
+        scored_starts,
+        length,
+        lambda minute: datetime.fromtimestamp(minute * 60, tz=CEZ_TIMEZONE),
+        low_price,
+        high_price,
+        objective,
+        power,
+        max_results,
+    )
+
+
+def find_cheapest_windows(
+    bitmap: TariffBitmap,
+    duration: timedelta,
+    earliest_start: datetime,
+    latest_end: datetime,
+    low_price: float = 0.0,
+    high_price: float = 0.0,
+    objective: str = "coverage",
+    power: float = 1.0,
+    max_results: int = 3,
+    timeline: TariffTimeline | None = None,
+) -> list[TariffWindow]:
+    """Find the best run windows of a given duration within [earliest_start, latest_end].
+
+    NT coverage of a window is a piecewise linear function of its start whose slope
+    only changes when the window start or end crosses a tariff switch. The optimum
+    therefore lies on the range limits or on a switch (or a switch minus the
+    duration), and each candidate is scored with two prefix-sum lookups.
+
+    The bitmap counts wall-clock minutes, so when the range covers a DST change
+    and a timeline is given, the search runs on its epoch boundaries instead.
+
+    Args:
+        bitmap: Minute bitmap of the schedule.
+        duration: Required run duration (rounded up to whole minutes).
+        earliest_start: Earliest allowed start (aware datetime).
+        latest_end: Latest allowed end (aware datetime).
+        low_price: Price per kWh in low tariff.
+        high_price: Price per kWh in high tariff.
+        objective: 'coverage' maximizes NT minutes, 'cost' minimizes cost.
+        power: Appliance power in kW used for the cost.
+        max_results: Maximum number of windows returned.
+        timeline: Optional compiled timeline of the same schedule, used on DST days.
+
+    Returns:
+        Best windows first; ties are ordered by start time. Empty if the range
+        is shorter than the duration or outside the schedule.
+
+    Raises:
+        ValueError: If the objective is unknown.
+    """
+    if objective not in ("coverage", "cost"):
+        raise ValueError(f"Unknown objective: {objective}")
+
+    length = -(-int(duration.total_seconds()) // 60)
+    if length <= 0 or bitmap.first_day is None:
+        return []
+
+    if timeline is not None and _spans_dst_change(earliest_start, latest_end):
+        return _find_cheapest_windows_on_timeline(
+            timeline, length, earliest_start, latest_end, low_price, high_price, objective, power, max_results
+        )
+
+    first = bitmap.minute_index(earliest_start)
+    if earliest_start.second or earliest_start.microsecond:
+        first += 1  # Round up to the next whole minute
+    last = min(bitmap.minute_index(latest_end), bitmap.total_minutes) - length
+    first = max(first, 0)
+    if last < first:
+        return []
+
+    scored_starts = [
+        (start, bitmap.nt_minutes_before(start + length) - bitmap.nt_minutes_before(start))
+        for start in _window_candidates(bitmap.edges, first, last, length)
+    ]
+    return _rank_windows(
+        scored_starts, length, bitmap.datetime_at, low_price, high_price, objective, power, max_results
+    )
@@ -1,22 +1,104 @@
 """Frontend for CEZ HDO Cards."""
 
+import gzip
+import hashlib
 import logging
 import os
 import pathlib
 
+from aiohttp import web
 from packaging.version import parse
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_call_later
-from homeassistant.components.http import StaticPathConfig
+from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import __version__
 
+try:
+    # brotli is optional - without it only the .gz variants are built.
+    import brotli
+except ImportError:
+    brotli = None  # type: ignore[assignment]
+
 _LOGGER = logging.getLogger(__name__)
 
 # Konstanty pro frontend kartu
 DOMAIN = "cez_hdo"
 URL_BASE = "/cez_hdo_card"
-CEZ_HDO_CARDS = [{"name": "CEZ HDO Card", "filename": "cez-hdo-card.js", "version": "3.0.0-RC.2"}]
+CEZ_HDO_CARDS = [{"name": "CEZ HDO Card", "filename": "cez-hdo-card.js"}]
+DIST_PATH = pathlib.Path(__file__).parent / "dist"
+
+# Key for hass.data - content-hash versions of the served files (filename -> version)
+DATA_CARD_VERSIONS = "cez_hdo_card_versions"
+
+# Card URLs carry the content hash, so a served version never changes
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Precompressed variants: (suffix, compress function)
+COMPRESSORS = [(".gz", lambda data: gzip.compress(data, 9, mtime=0))]
+if brotli is not None:
+    COMPRESSORS.append((".br", lambda data: brotli.compress(data, quality=11)))
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+
+def prepare_dist_files(path: pathlib.Path = DIST_PATH) -> dict[str, str]:
+    """Build precompressed variants of the dist files and hash their content.
+
+    ``.gz`` (and ``.br`` when brotli is installed) files are written next to
+    each source file when missing or older than the source; aiohttp serves
+    them to clients that accept the encoding.
+
+    Returns:
+        Mapping of filename to content-hash version.
+    """
+    versions: dict[str, str] = {}
+    if not path.exists():
+        return versions
+
+    for filename in sorted(os.listdir(path)):
+        source = path / filename
+        if filename.startswith(".") or filename.endswith(COMPRESSED_SUFFIXES) or not source.is_file():
+            continue
+        content = source.read_bytes()
+        versions[filename] = hashlib.blake2b(content, digest_size=6).hexdigest()
+
+        for suffix, compress in COMPRESSORS:
+            target = path / f"{filename}{suffix}"
+            try:
+                if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+                    continue
+                tmp = target.with_name(f".{target.name}.tmp")
+                tmp.write_bytes(compress(content))
+                os.replace(tmp, target)
+                _LOGGER.debug("Built %s", target.name)
+            except OSError as err:
+                # Read-only installs still work, just without the precompressed variant
+                _LOGGER.debug("Unable to write %s: %s", target, err)
+    return versions
+
+
+class CezHdoCardView(HomeAssistantView):
+    """Serve card assets with long-lived cache headers and precompressed variants."""
+
+    url = URL_BASE + "/{filename}"
+    name = "cez_hdo:card"
+    requires_auth = False
+
+    def __init__(self, versions: dict[str, str]) -> None:
+        """Initialize the view with the servable files."""
+        self._versions = versions
+
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
+        """Return a dist file; clients accepting br/gzip get the precompressed file.
+
+        Only URLs carrying the current content hash (``?v=``) are cacheable
+        forever, unversioned URLs are revalidated via Last-Modified.
+        """
+        version = self._versions.get(filename)
+        if version is None:
+            raise web.HTTPNotFound
+        cache_control = IMMUTABLE_CACHE_CONTROL if request.query.get("v") == version else "no-cache"
+        return web.FileResponse(DIST_PATH / filename, headers={"Cache-Control": cache_control})
 
 
 class CezHdoCardRegistration:
@@ -56,13 +138,23 @@ class CezHdoCardRegistration:
 
     async def async_register_cez_hdo_path(self):
         """Register custom cards path if not already registered."""
-        try:
-            # Složka dist obsahuje zkompilovaný JS soubor
-            dist_path = pathlib.Path(__file__).parent / "dist"
-            await self.hass.http.async_register_static_paths([StaticPathConfig(URL_BASE, str(dist_path), False)])
-            _LOGGER.debug("Registered CEZ HDO path from %s", dist_path)
-        except RuntimeError:
-            _LOGGER.debug("CEZ HDO static path already registered")
+        # Složka dist obsahuje zkompilovaný JS soubor
+        versions = await self.hass.async_add_executor_job(prepare_dist_files)
+        known_versions = self.hass.data.setdefault(DATA_CARD_VERSIONS, {})
+        first_registration = not known_versions
+        # Update in place - a registered view keeps serving the same dict
+        known_versions.clear()
+        known_versions.update(versions)
+        if first_registration:
+            try:
+                self.hass.http.register_view(CezHdoCardView(known_versions))
+                _LOGGER.debug("Registered CEZ HDO path from %s", DIST_PATH)
+            except RuntimeError:
+                _LOGGER.debug("CEZ HDO card path already registered")
+
+    def card_version(self, card: dict) -> str:
+        """Return the content-hash version of a card file."""
+        return self.hass.data.get(DATA_CARD_VERSIONS, {}).get(card["filename"], "0")
 
     async def async_wait_for_lovelace_resources(self) -> None:
         """Wait for Lovelace resources to be loaded before registering cards."""
@@ -92,43 +184,40 @@ class CezHdoCardRegistration:
             url = f"{URL_BASE}/{card.get('filename')}"
 
             card_registered = False
+            version = self.card_version(card)
 
             for res in cez_hdo_resources:
                 if self.get_resource_path(res["url"]) == url:
                     card_registered = True
                     # Check version
-                    if self.get_resource_version(res["url"]) != card.get("version"):
+                    if self.get_resource_version(res["url"]) != version:
                         # Update card version
                         _LOGGER.debug(
                             "Updating %s to version %s",
                             card.get("name"),
-                            card.get("version"),
+                            version,
                         )
                         await self.lovelace_resources.async_update_item(
                             res.get("id"),
                             {
                                 "res_type": "module",
-                                "url": f"{url}?v={card.get('version')}",
+                                "url": f"{url}?v={version}",
                             },
                         )
-                        # Remove old gzipped files
-                        await self.async_remove_gzip_files()
                     else:
                         _LOGGER.debug(
                             "%s already registered as version %s",
                             card.get("name"),
-                            card.get("version"),
+                            version,
                         )
 
             if not card_registered:
                 _LOGGER.debug(
                     "Registering %s as version %s",
                     card.get("name"),
-                    card.get("version"),
-                )
-                await self.lovelace_resources.async_create_item(
-                    {"res_type": "module", "url": f"{url}?v={card.get('version')}"}
+                    version,
                 )
+                await self.lovelace_resources.async_create_item({"res_type": "module", "url": f"{url}?v={version}"})
 
     def get_resource_path(self, url: str):
         """Extract resource path from URL."""
@@ -154,28 +243,3 @@ class CezHdoCardRegistration:
 
                 for resource in cez_hdo_resources:
                     await self.lovelace_resources.async_delete_item(resource.get("id"))
-
-    async def async_remove_gzip_files(self):
-        """Remove old gzip files asynchronously."""
-        await self.hass.async_add_executor_job(self.remove_gzip_files)
-
-    def remove_gzip_files(self):
-        """Remove outdated gzip files."""
-        _LOGGER.debug("remove_gzip_files")
-        path = pathlib.Path(__file__).parent / "dist"
-
-        if not path.exists():
-            return
-
-        gzip_files = [filename for filename in os.listdir(path) if filename.endswith(".gz")]
-
-        _LOGGER.debug("Found gzip files: %s", gzip_files)
-        for file in gzip_files:
-            try:
-                gz_path = path / file
-                original_path = path / file.replace(".gz", "")
-                if original_path.exists() and gz_path.stat().st_mtime < original_path.stat().st_mtime:
-                    _LOGGER.debug("Removing older gzip file - %s", file)
-                    gz_path.unlink()
-            except Exception:
-                pass
@@ -1,4 +1,4 @@
-function t(t,e,i,s){var n,r=arguments.length,o=r<3?e:null===s?s=Object.getOwnPropertyDescriptor(e,i):s;if("object"==typeof Reflect&&"function"==typeof Reflect.decorate)o=Reflect.decorate(t,e,i,s);else for(var a=t.length-1;a>=0;a--)(n=t[a])&&(o=(r<3?n(o):r>3?n(e,i,o):n(e,i))||o);return r>3&&o&&Object.defineProperty(e,i,o),o}"function"==typeof SuppressedError&&SuppressedError;const e=globalThis,i=e.ShadowRoot&&(void 0===e.ShadyCSS||e.ShadyCSS.nativeShadow)&&"adoptedStyleSheets"in Document.prototype&&"replace"in CSSStyleSheet.prototype,s=Symbol(),n=new WeakMap;let r=class{constructor(t,e,i){if(this._$cssResult$=!0,i!==s)throw Error("CSSResult is not constructable. Use `unsafeCSS` or `css` instead.");this.cssText=t,this.t=e}get styleSheet(){let t=this.o;const e=this.t;if(i&&void 0===t){const i=void 0!==e&&1===e.length;i&&(t=n.get(e)),void 0===t&&((this.o=t=new CSSStyleSheet).replaceSync(this.cssText),i&&n.set(e,t))}return t}toString(){return this.cssText}};const o=(t,...e)=>{const i=1===t.length?t[0]:e.reduce((e,i,s)=>e+(t=>{if(!0===t._$cssResult$)return t.cssText;if("number"==typeof t)return t;throw Error("Value passed to 'css' function must be a 'css' function result: "+t+". Use 'unsafeCSS' to pass non-literal values, but take care to ensure page security.")})(i)+t[s+1],t[0]);return new r(i,t,s)},a=i?t=>t:t=>t instanceof CSSStyleSheet?(t=>{let e="";for(const i of t.cssRules)e+=i.cssText;return(t=>new r("string"==typeof t?t:t+"",void 0,s))(e)})(t):t,{is:c,defineProperty:h,getOwnPropertyDescriptor:l,getOwnPropertyNames:d,getOwnPropertySymbols:p,getPrototypeOf:u}=Object,f=globalThis,g=f.trustedTypes,_=g?g.emptyScript:"",v=f.reactiveElementPolyfillSupport,m=(t,e)=>t,y={toAttribute(t,e){switch(e){case Boolean:t=t?_:null;break;case Object:case Array:t=null==t?t:JSON.stringify(t)}return t},fromAttribute(t,e){let i=t;switch(e){case Boolean:i=null!==t;break;case Number:i=null===t?null:Number(t);break;case Object:case Array:try{i=JSON.parse(t)}catch(t){i=null}}return i}},$=(t,e)=>!c(t,e),w={attribute:!0,type:String,converter:y,reflect:!1,useDefault:!1,hasChanged:$};Symbol.metadata??=Symbol("metadata"),f.litPropertyMetadata??=new WeakMap;let b=class extends HTMLElement{static addInitializer(t){this._$Ei(),(this.l??=[]).push(t)}static get observedAttributes(){return this.finalize(),this._$Eh&&[...this._$Eh.keys()]}static createProperty(t,e=w){if(e.state&&(e.attribute=!1),this._$Ei(),this.prototype.hasOwnProperty(t)&&((e=Object.create(e)).wrapped=!0),this.elementProperties.set(t,e),!e.noAccessor){const i=Symbol(),s=this.getPropertyDescriptor(t,i,e);void 0!==s&&h(this.prototype,t,s)}}static getPropertyDescriptor(t,e,i){const{get:s,set:n}=l(this.prototype,t)??{get(){return this[e]},set(t){this[e]=t}};return{get:s,set(e){const r=s?.call(this);n?.call(this,e),this.requestUpdate(t,r,i)},configurable:!0,enumerable:!0}}static getPropertyOptions(t){return this.elementProperties.get(t)??w}static _$Ei(){if(this.hasOwnProperty(m("elementProperties")))return;const t=u(this);t.finalize(),void 0!==t.l&&(this.l=[...t.l]),this.elementProperties=new Map(t.elementProperties)}static finalize(){if(this.hasOwnProperty(m("finalized")))return;if(this.finalized=!0,this._$Ei(),this.hasOwnProperty(m("properties"))){const t=this.properties,e=[...d(t),...p(t)];for(const i of e)this.createProperty(i,t[i])}const t=this[Symbol.metadata];if(null!==t){const e=litPropertyMetadata.get(t);if(void 0!==e)for(const[t,i]of e)this.elementProperties.set(t,i)}this._$Eh=new Map;for(const[t,e]of this.elementProperties){const i=this._$Eu(t,e);void 0!==i&&this._$Eh.set(i,t)}this.elementStyles=this.finalizeStyles(this.styles)}static finalizeStyles(t){const e=[];if(Array.isArray(t)){const i=new Set(t.flat(1/0).reverse());for(const t of i)e.unshift(a(t))}else void 0!==t&&e.push(a(t));return e}static _$Eu(t,e){const i=e.attribute;return!1===i?void 0:"string"==typeof i?i:"string"==typeof t?t.toLowerCase():void 0}constructor(){super(),this._$Ep=void 0,this.isUpdatePending=!1,this.hasUpdated=!1,this._$Em=null,this._$Ev()}_$Ev(){this._$ES=new Promise(t=>this.enableUpdating=t),this._$AL=new Map,this._$E_(),this.requestUpdate(),this.constructor.l?.forEach(t=>t(this))}addController(t){(this._$EO??=new Set).add(t),void 0!==this.renderRoot&&this.isConnected&&t.hostConnected?.()}removeController(t){this._$EO?.delete(t)}_$E_(){const t=new Map,e=this.constructor.elementProperties;for(const i of e.keys())this.hasOwnProperty(i)&&(t.set(i,this[i]),delete this[i]);t.size>0&&(this._$Ep=t)}createRenderRoot(){const t=this.shadowRoot??this.attachShadow(this.constructor.shadowRootOptions);return((t,s)=>{if(i)t.adoptedStyleSheets=s.map(t=>t instanceof CSSStyleSheet?t:t.styleSheet);else for(const i of s){const s=document.createElement("style"),n=e.litNonce;void 0!==n&&s.setAttribute("nonce",n),s.textContent=i.cssText,t.appendChild(s)}})(t,this.constructor.elementStyles),t}connectedCallback(){this.renderRoot??=this.createRenderRoot(),this.enableUpdating(!0),this._$EO?.forEach(t=>t.hostConnected?.())}enableUpdating(t){}disconnectedCallback(){this._$EO?.forEach(t=>t.hostDisconnected?.())}attributeChangedCallback(t,e,i){this._$AK(t,i)}_$ET(t,e){const i=this.constructor.elementProperties.get(t),s=this.constructor._$Eu(t,i);if(void 0!==s&&!0===i.reflect){const n=(void 0!==i.converter?.toAttribute?i.converter:y).toAttribute(e,i.type);this._$Em=t,null==n?this.removeAttribute(s):this.setAttribute(s,n),this._$Em=null}}_$AK(t,e){const i=this.constructor,s=i._$Eh.get(t);if(void 0!==s&&this._$Em!==s){const t=i.getPropertyOptions(s),n="function"==typeof t.converter?{fromAttribute:t.converter}:void 0!==t.converter?.fromAttribute?t.converter:y;this._$Em=s;const r=n.fromAttribute(e,t.type);this[s]=r??this._$Ej?.get(s)??r,this._$Em=null}}requestUpdate(t,e,i,s=!1,n){if(void 0!==t){const r=this.constructor;if(!1===s&&(n=this[t]),i??=r.getPropertyOptions(t),!((i.hasChanged??$)(n,e)||i.useDefault&&i.reflect&&n===this._$Ej?.get(t)&&!this.hasAttribute(r._$Eu(t,i))))return;this.C(t,e,i)}!1===this.isUpdatePending&&(this._$ES=this._$EP())}C(t,e,{useDefault:i,reflect:s,wrapped:n},r){i&&!(this._$Ej??=new Map).has(t)&&(this._$Ej.set(t,r??e??this[t]),!0!==n||void 0!==r)||(this._$AL.has(t)||(this.hasUpdated||i||(e=void 0),this._$AL.set(t,e)),!0===s&&this._$Em!==t&&(this._$Eq??=new Set).add(t))}async _$EP(){this.isUpdatePending=!0;try{await this._$ES}catch(t){Promise.reject(t)}const t=this.scheduleUpdate();return null!=t&&await t,!this.isUpdatePending}scheduleUpdate(){return this.performUpdate()}performUpdate(){if(!this.isUpdatePending)return;if(!this.hasUpdated){if(this.renderRoot??=this.createRenderRoot(),this._$Ep){for(const[t,e]of this._$Ep)this[t]=e;this._$Ep=void 0}const t=this.constructor.elementProperties;if(t.size>0)for(const[e,i]of t){const{wrapped:t}=i,s=this[e];!0!==t||this._$AL.has(e)||void 0===s||this.C(e,void 0,i,s)}}let t=!1;const e=this._$AL;try{t=this.shouldUpdate(e),t?(this.willUpdate(e),this._$EO?.forEach(t=>t.hostUpdate?.()),this.update(e)):this._$EM()}catch(e){throw t=!1,this._$EM(),e}t&&this._$AE(e)}willUpdate(t){}_$AE(t){this._$EO?.forEach(t=>t.hostUpdated?.()),this.hasUpdated||(this.hasUpdated=!0,this.firstUpdated(t)),this.updated(t)}_$EM(){this._$AL=new Map,this.isUpdatePending=!1}get updateComplete(){return this.getUpdateComplete()}getUpdateComplete(){return this._$ES}shouldUpdate(t){return!0}update(t){this._$Eq&&=this._$Eq.forEach(t=>this._$ET(t,this[t])),this._$EM()}updated(t){}firstUpdated(t){}};b.elementStyles=[],b.shadowRootOptions={mode:"open"},b[m("elementProperties")]=new Map,b[m("finalized")]=new Map,v?.({ReactiveElement:b}),(f.reactiveElementVersions??=[]).push("2.1.2");const S=globalThis,E=t=>t,x=S.trustedTypes,A=x?x.createPolicy("lit-html",{createHTML:t=>t}):void 0,T="$lit$",k=`lit$${Math.random().toFixed(9).slice(2)}$`,C="?"+k,z=`<${C}>`,P=document,N=()=>P.createComment(""),O=t=>null===t||"object"!=typeof t&&"function"!=typeof t,H=Array.isArray,R="[ \t\n\f\r]",D=/<(?:(!--|\/[^a-zA-Z])|(\/?[a-zA-Z][^>\s]*)|(\/?$))/g,U=/-->/g,M=/>/g,j=RegExp(`>|${R}(?:([^\\s"'>=/]+)(${R}*=${R}*(?:[^ \t\n\f\r"'\`<>=]|("|')|))|$)`,"g"),Z=/'/g,V=/"/g,L=/^(?:script|style|textarea|title)$/i,B=(t=>(e,...i)=>({_$litType$:t,strings:e,values:i}))(1),W=Symbol.for("lit-noChange"),I=Symbol.for("lit-nothing"),K=new WeakMap,q=P.createTreeWalker(P,129);function F(t,e){if(!H(t)||!t.hasOwnProperty("raw"))throw Error("invalid template strings array");return void 0!==A?A.createHTML(e):e}const J=(t,e)=>{const i=t.length-1,s=[];let n,r=2===e?"<svg>":3===e?"<math>":"",o=D;for(let e=0;e<i;e++){const i=t[e];let a,c,h=-1,l=0;for(;l<i.length&&(o.lastIndex=l,c=o.exec(i),null!==c);)l=o.lastIndex,o===D?"!--"===c[1]?o=U:void 0!==c[1]?o=M:void 0!==c[2]?(L.test(c[2])&&(n=RegExp("</"+c[2],"g")),o=j):void 0!==c[3]&&(o=j):o===j?">"===c[0]?(o=n??D,h=-1):void 0===c[1]?h=-2:(h=o.lastIndex-c[2].length,a=c[1],o=void 0===c[3]?j:'"'===c[3]?V:Z):o===V||o===Z?o=j:o===U||o===M?o=D:(o=j,n=void 0);const d=o===j&&t[e+1].startsWith("/>")?" ":"";r+=o===D?i+z:h>=0?(s.push(a),i.slice(0,h)+T+i.slice(h)+k+d):i+k+(-2===h?e:d)}return[F(t,r+(t[i]||"<?>")+(2===e?"</svg>":3===e?"</math>":"")),s]};class Y{constructor({strings:t,_$litType$:e},i){let s;this.parts=[];let n=0,r=0;const o=t.length-1,a=this.parts,[c,h]=J(t,e);if(this.el=Y.createElement(c,i),q.currentNode=this.el.content,2===e||3===e){const t=this.el.content.firstChild;t.replaceWith(...t.childNodes)}for(;null!==(s=q.nextNode())&&a.length<o;){if(1===s.nodeType){if(s.hasAttributes())for(const t of s.getAttributeNames())if(t.endsWith(T)){const e=h[r++],i=s.getAttribute(t).split(k),o=/([.?@])?(.*)/.exec(e);a.push({type:1,index:n,name:o[2],strings:i,ctor:"."===o[1]?et:"?"===o[1]?it:"@"===o[1]?st:tt}),s.removeAttribute(t)}else t.startsWith(k)&&(a.push({type:6,index:n}),s.removeAttribute(t));if(L.test(s.tagName)){const t=s.textContent.split(k),e=t.length-1;if(e>0){s.textContent=x?x.emptyScript:"";for(let i=0;i<e;i++)s.append(t[i],N()),q.nextNode(),a.push({type:2,index:++n});s.append(t[e],N())}}}else if(8===s.nodeType)if(s.data===C)a.push({type:2,index:n});else{let t=-1;for(;-1!==(t=s.data.indexOf(k,t+1));)a.push({type:7,index:n}),t+=k.length-1}n++}}static createElement(t,e){const i=P.createElement("template");return i.innerHTML=t,i}}function G(t,e,i=t,s){if(e===W)return e;let n=void 0!==s?i._$Co?.[s]:i._$Cl;const r=O(e)?void 0:e._$litDirective$;return n?.constructor!==r&&(n?._$AO?.(!1),void 0===r?n=void 0:(n=new r(t),n._$AT(t,i,s)),void 0!==s?(i._$Co??=[])[s]=n:i._$Cl=n),void 0!==n&&(e=G(t,n._$AS(t,e.values),n,s)),e}class Q{constructor(t,e){this._$AV=[],this._$AN=void 0,this._$AD=t,this._$AM=e}get parentNode(){return this._$AM.parentNode}get _$AU(){return this._$AM._$AU}u(t){const{el:{content:e},parts:i}=this._$AD,s=(t?.creationScope??P).importNode(e,!0);q.currentNode=s;let n=q.nextNode(),r=0,o=0,a=i[0];for(;void 0!==a;){if(r===a.index){let e;2===a.type?e=new X(n,n.nextSibling,this,t):1===a.type?e=new a.ctor(n,a.name,a.strings,this,t):6===a.type&&(e=new nt(n,this,t)),this._$AV.push(e),a=i[++o]}r!==a?.index&&(n=q.nextNode(),r++)}return q.currentNode=P,s}p(t){let e=0;for(const i of this._$AV)void 0!==i&&(void 0!==i.strings?(i._$AI(t,i,e),e+=i.strings.length-2):i._$AI(t[e])),e++}}class X{get _$AU(){return this._$AM?._$AU??this._$Cv}constructor(t,e,i,s){this.type=2,this._$AH=I,this._$AN=void 0,this._$AA=t,this._$AB=e,this._$AM=i,this.options=s,this._$Cv=s?.isConnected??!0}get parentNode(){let t=this._$AA.parentNode;const e=this._$AM;return void 0!==e&&11===t?.nodeType&&(t=e.parentNode),t}get startNode(){return this._$AA}get endNode(){return this._$AB}_$AI(t,e=this){t=G(this,t,e),O(t)?t===I||null==t||""===t?(this._$AH!==I&&this._$AR(),this._$AH=I):t!==this._$AH&&t!==W&&this._(t):void 0!==t._$litType$?this.$(t):void 0!==t.nodeType?this.T(t):(t=>H(t)||"function"==typeof t?.[Symbol.iterator])(t)?this.k(t):this._(t)}O(t){return this._$AA.parentNode.insertBefore(t,this._$AB)}T(t){this._$AH!==t&&(this._$AR(),this._$AH=this.O(t))}_(t){this._$AH!==I&&O(this._$AH)?this._$AA.nextSibling.data=t:this.T(P.createTextNode(t)),this._$AH=t}$(t){const{values:e,_$litType$:i}=t,s="number"==typeof i?this._$AC(t):(void 0===i.el&&(i.el=Y.createElement(F(i.h,i.h[0]),this.options)),i);if(this._$AH?._$AD===s)this._$AH.p(e);else{const t=new Q(s,this),i=t.u(this.options);t.p(e),this.T(i),this._$AH=t}}_$AC(t){let e=K.get(t.strings);return void 0===e&&K.set(t.strings,e=new Y(t)),e}k(t){H(this._$AH)||(this._$AH=[],this._$AR());const e=this._$AH;let i,s=0;for(const n of t)s===e.length?e.push(i=new X(this.O(N()),this.O(N()),this,this.options)):i=e[s],i._$AI(n),s++;s<e.length&&(this._$AR(i&&i._$AB.nextSibling,s),e.length=s)}_$AR(t=this._$AA.nextSibling,e){for(this._$AP?.(!1,!0,e);t!==this._$AB;){const e=E(t).nextSibling;E(t).remove(),t=e}}setConnected(t){void 0===this._$AM&&(this._$Cv=t,this._$AP?.(t))}}class tt{get tagName(){return this.element.tagName}get _$AU(){return this._$AM._$AU}constructor(t,e,i,s,n){this.type=1,this._$AH=I,this._$AN=void 0,this.element=t,this.name=e,this._$AM=s,this.options=n,i.length>2||""!==i[0]||""!==i[1]?(this._$AH=Array(i.length-1).fill(new String),this.strings=i):this._$AH=I}_$AI(t,e=this,i,s){const n=this.strings;let r=!1;if(void 0===n)t=G(this,t,e,0),r=!O(t)||t!==this._$AH&&t!==W,r&&(this._$AH=t);else{const s=t;let o,a;for(t=n[0],o=0;o<n.length-1;o++)a=G(this,s[i+o],e,o),a===W&&(a=this._$AH[o]),r||=!O(a)||a!==this._$AH[o],a===I?t=I:t!==I&&(t+=(a??"")+n[o+1]),this._$AH[o]=a}r&&!s&&this.j(t)}j(t){t===I?this.element.removeAttribute(this.name):this.element.setAttribute(this.name,t??"")}}class et extends tt{constructor(){super(...arguments),this.type=3}j(t){this.element[this.name]=t===I?void 0:t}}class it extends tt{constructor(){super(...arguments),this.type=4}j(t){this.element.toggleAttribute(this.name,!!t&&t!==I)}}class st extends tt{constructor(t,e,i,s,n){super(t,e,i,s,n),this.type=5}_$AI(t,e=this){if((t=G(this,t,e,0)??I)===W)return;const i=this._$AH,s=t===I&&i!==I||t.capture!==i.capture||t.once!==i.once||t.passive!==i.passive,n=t!==I&&(i===I||s);s&&this.element.removeEventListener(this.name,this,i),n&&this.element.addEventListener(this.name,this,t),this._$AH=t}handleEvent(t){"function"==typeof this._$AH?this._$AH.call(this.options?.host??this.element,t):this._$AH.handleEvent(t)}}class nt{constructor(t,e,i){this.element=t,this.type=6,this._$AN=void 0,this._$AM=e,this.options=i}get _$AU(){return this._$AM._$AU}_$AI(t){G(this,t)}}const rt=S.litHtmlPolyfillSupport;rt?.(Y,X),(S.litHtmlVersions??=[]).push("3.3.2");const ot=globalThis;class at extends b{constructor(){super(...arguments),this.renderOptions={host:this},this._$Do=void 0}createRenderRoot(){const t=super.createRenderRoot();return this.renderOptions.renderBefore??=t.firstChild,t}update(t){const e=this.render();this.hasUpdated||(this.renderOptions.isConnected=this.isConnected),super.update(t),this._$Do=((t,e,i)=>{const s=i?.renderBefore??e;let n=s._$litPart$;if(void 0===n){const t=i?.renderBefore??null;s._$litPart$=n=new X(e.insertBefore(N(),t),t,void 0,i??{})}return n._$AI(t),n})(e,this.renderRoot,this.renderOptions)}connectedCallback(){super.connectedCallback(),this._$Do?.setConnected(!0)}disconnectedCallback(){super.disconnectedCallback(),this._$Do?.setConnected(!1)}render(){return W}}at._$litElement$=!0,at.finalized=!0,ot.litElementHydrateSupport?.({LitElement:at});const ct=ot.litElementPolyfillSupport;ct?.({LitElement:at}),(ot.litElementVersions??=[]).push("4.2.2");const ht={attribute:!0,type:String,converter:y,reflect:!1,hasChanged:$},lt=(t=ht,e,i)=>{const{kind:s,metadata:n}=i;let r=globalThis.litPropertyMetadata.get(n);if(void 0===r&&globalThis.litPropertyMetadata.set(n,r=new Map),"setter"===s&&((t=Object.create(t)).wrapped=!0),r.set(i.name,t),"accessor"===s){const{name:s}=i;return{set(i){const n=e.get.call(this);e.set.call(this,i),this.requestUpdate(s,n,t,!0,i)},init(e){return void 0!==e&&this.C(s,void 0,t,e),e}}}if("setter"===s){const{name:s}=i;return function(i){const n=this[s];e.call(this,i),this.requestUpdate(s,n,t,!0,i)}}throw Error("Unsupported decorator location: "+s)};function dt(t){return(e,i)=>"object"==typeof i?lt(t,e,i):((t,e,i)=>{const s=e.hasOwnProperty(i);return e.constructor.createProperty(i,t),s?Object.getOwnPropertyDescriptor(e,i):void 0})(t,e,i)}const pt={cs:{title:"ČEZ HDO Status",lowTariff:"Nízký tarif",highTariff:"Vysoký tarif",active:"Aktivní",inactive:"Neaktivní",ntStart:"NT začátek",vtStart:"VT začátek",ntEnd:"NT konec",vtEnd:"VT konec",ntRemaining:"NT zbývá",vtRemaining:"VT zbývá",currentPrice:"Aktuální cena",priceUnit:"Kč/kWh",currency:"Kč/kWh",currencyShort:"Kč",scheduleTitle:"HDO rozvrh",hdoSchedule:"HDO rozvrh",scheduleNotAvailable:"Rozvrh není k dispozici",nt:"NT",vt:"VT",loading:"Načítání...",entityNotFound:"Entita nenalezena",configureEntities:"Nakonfigurujte entity v nastavení karty",editorTitle:"Titulek",showTitle:"Zobrazit titulek",showTariffStatus:"Zobrazit stavy tarifů",showTariffPrices:"Zobrazit ceny u tarifů",showTimes:"Zobrazit časy (začátek/konec)",showDuration:"Zobrazit zbývající čas",showCurrentPrice:"Zobrazit aktuální cenu",showHdoSchedule:"Zobrazit HDO rozvrh",showSchedulePrices:"Zobrazit ceny v legendě rozvrhu",compactMode:"Kompaktní režim",ntActiveBinarySensor:"NT aktivní (binary_sensor)",vtActiveBinarySensor:"VT aktivní (binary_sensor)",ntStartSensor:"NT začátek (sensor)",ntEndSensor:"NT konec (sensor)",ntRemainingSensor:"NT zbývá (sensor)",vtStartSensor:"VT začátek (sensor)",vtEndSensor:"VT konec (sensor)",vtRemainingSensor:"VT zbývá (sensor)",hdoScheduleSensor:"HDO rozvrh (sensor)",editorHint:"Entity jsou předvyplněny automaticky. Změňte pouze pokud máte více instancí integrace."},en:{title:"ČEZ HDO Status",lowTariff:"Low Tariff",highTariff:"High Tariff",active:"Active",inactive:"Inactive",ntStart:"NT Start",vtStart:"VT Start",ntEnd:"NT End",vtEnd:"VT End",ntRemaining:"NT Remaining",vtRemaining:"VT Remaining",currentPrice:"Current Price",priceUnit:"CZK/kWh",currency:"CZK/kWh",currencyShort:"CZK",scheduleTitle:"HDO Schedule",hdoSchedule:"HDO Schedule",scheduleNotAvailable:"Schedule not available",nt:"NT",vt:"VT",loading:"Loading...",entityNotFound:"Entity not found",configureEntities:"Configure entities in card settings",editorTitle:"Title",showTitle:"Show title",showTariffStatus:"Show tariff status",showTariffPrices:"Show tariff prices",showTimes:"Show times (start/end)",showDuration:"Show remaining time",showCurrentPrice:"Show current price",showHdoSchedule:"Show HDO schedule",showSchedulePrices:"Show prices in schedule legend",compactMode:"Compact mode",ntActiveBinarySensor:"NT active (binary_sensor)",vtActiveBinarySensor:"VT active (binary_sensor)",ntStartSensor:"NT start (sensor)",ntEndSensor:"NT end (sensor)",ntRemainingSensor:"NT remaining (sensor)",vtStartSensor:"VT start (sensor)",vtEndSensor:"VT end (sensor)",vtRemainingSensor:"VT remaining (sensor)",hdoScheduleSensor:"HDO schedule (sensor)",editorHint:"Entities are auto-filled. Change only if you have multiple integration instances."},sk:{title:"ČEZ HDO Status",lowTariff:"Nízky tarif",highTariff:"Vysoký tarif",active:"Aktívny",inactive:"Neaktívny",ntStart:"NT začiatok",vtStart:"VT začiatok",ntEnd:"NT koniec",vtEnd:"VT koniec",ntRemaining:"NT zostáva",vtRemaining:"VT zostáva",currentPrice:"Aktuálna cena",priceUnit:"Kč/kWh",currency:"Kč/kWh",currencyShort:"Kč",scheduleTitle:"HDO rozvrh",hdoSchedule:"HDO rozvrh",scheduleNotAvailable:"Rozvrh nie je k dispozícii",nt:"NT",vt:"VT",loading:"Načítava sa...",entityNotFound:"Entita nenájdená",configureEntities:"Nakonfigurujte entity v nastavení karty",editorTitle:"Nadpis",showTitle:"Zobraziť nadpis",showTariffStatus:"Zobraziť stavy tarifov",showTariffPrices:"Zobraziť ceny pri tarifoch",showTimes:"Zobraziť časy (začiatok/koniec)",showDuration:"Zobraziť zostávajúci čas",showCurrentPrice:"Zobraziť aktuálnu cenu",showHdoSchedule:"Zobraziť HDO rozvrh",showSchedulePrices:"Zobraziť ceny v legende rozvrhu",compactMode:"Kompaktný režim",ntActiveBinarySensor:"NT aktívny (binary_sensor)",vtActiveBinarySensor:"VT aktívny (binary_sensor)",ntStartSensor:"NT začiatok (sensor)",ntEndSensor:"NT koniec (sensor)",ntRemainingSensor:"NT zostáva (sensor)",vtStartSensor:"VT začiatok (sensor)",vtEndSensor:"VT koniec (sensor)",vtRemainingSensor:"VT zostáva (sensor)",hdoScheduleSensor:"HDO rozvrh (sensor)",editorHint:"Entity sú predvyplnené automaticky. Zmeňte len ak máte viac inštancií integrácie."}};function ut(t){const e=t.split("-")[0].toLowerCase();return pt[e]||pt.en}function ft(t){return t?.language?t.language:t?.locale?.language?t.locale.language:"undefined"!=typeof navigator&&navigator.language?navigator.language:"en"}const gt={low_tariff:{domain:"binary_sensor",prefix:"cez_hdo_lowtariffactive_"},high_tariff:{domain:"binary_sensor",prefix:"cez_hdo_hightariffactive_"},low_start:{domain:"sensor",prefix:"cez_hdo_lowtariffstart_"},low_end:{domain:"sensor",prefix:"cez_hdo_lowtariffend_"},low_duration:{domain:"sensor",prefix:"cez_hdo_lowtariffduration_"},high_start:{domain:"sensor",prefix:"cez_hdo_hightariffstart_"},high_end:{domain:"sensor",prefix:"cez_hdo_hightariffend_"},high_duration:{domain:"sensor",prefix:"cez_hdo_hightariffduration_"},schedule:{domain:"sensor",prefix:"cez_hdo_schedule_"}},_t={low_tariff:"",high_tariff:"",low_start:"",low_end:"",low_duration:"",high_start:"",high_end:"",high_duration:"",schedule:""};let vt=class extends at{static getConfigElement(){return document.createElement("cez-hdo-card-editor")}static getStubConfig(){return{type:"custom:cez-hdo-card",title:"ČEZ HDO Status",show_times:!0,show_duration:!0,compact_mode:!1,entities:{..._t}}}setConfig(t){t.entities||(t={entities:{},title:"ČEZ HDO Status",show_times:!0,show_duration:!0,compact_mode:!1,...t}),this.config=t}findAllEntitiesByPrefix(t){if(!this.hass?.states)return[];const e=gt[t];if(!e)return[];const i=`${e.domain}.${e.prefix}`;return Object.keys(this.hass.states).filter(t=>t.startsWith(i))}resolveEntity(t){const e=this.config.entities?.[t];if(e&&this.hass?.states[e])return e;const i=this.findAllEntitiesByPrefix(t);if(1===i.length)return i[0];const s=_t[t];return s&&this.hass?.states[s]?s:void 0}getEntityState(t){if(!t||!this.hass)return"unavailable";const e=this.hass.states[t];return e?e.state:"unavailable"}isEntityOn(t){return"on"===this.getEntityState(t)}getPricesFromSensor(){const t=this.resolveEntity("schedule"),e=t?this.hass?.states[t]:void 0;if(e?.attributes){const t=e.attributes.low_tariff_price,i=e.attributes.high_tariff_price;return{low:"number"==typeof t?t:0,high:"number"==typeof i?i:0}}return{low:0,high:0}}render(){if(!this.config||!this.hass)return B`<ha-card>Loading...</ha-card>`;const t=ut(ft(this.hass)),e={low_tariff:this.resolveEntity("low_tariff"),high_tariff:this.resolveEntity("high_tariff"),low_start:this.resolveEntity("low_start"),low_end:this.resolveEntity("low_end"),low_duration:this.resolveEntity("low_duration"),high_start:this.resolveEntity("high_start"),high_end:this.resolveEntity("high_end"),high_duration:this.resolveEntity("high_duration"),schedule:this.resolveEntity("schedule")},i=this.isEntityOn(e.low_tariff),s=this.isEntityOn(e.high_tariff),n=this.getEntityState(e.low_start),r=this.getEntityState(e.low_end),o=this.getEntityState(e.low_duration),a=this.getEntityState(e.high_start),c=this.getEntityState(e.high_end),h=this.getEntityState(e.high_duration),l=this.config.title||"ČEZ HDO",d=!1!==this.config.show_times,p=!1!==this.config.show_duration,u=!0===this.config.compact_mode,f=!1!==this.config.show_price,g=this.getPricesFromSensor(),_=g.low,v=g.high,m=i?_:v,y=!0===this.config.show_tariff_prices,$=!1!==this.config.show_title,w=!1!==this.config.show_tariff_status;return B`
+function t(t,e,i,s){var n,r=arguments.length,o=r<3?e:null===s?s=Object.getOwnPropertyDescriptor(e,i):s;if("object"==typeof Reflect&&"function"==typeof Reflect.decorate)o=Reflect.decorate(t,e,i,s);else for(var a=t.length-1;a>=0;a--)(n=t[a])&&(o=(r<3?n(o):r>3?n(e,i,o):n(e,i))||o);return r>3&&o&&Object.defineProperty(e,i,o),o}"function"==typeof SuppressedError&&SuppressedError;const e=globalThis,i=e.ShadowRoot&&(void 0===e.ShadyCSS||e.ShadyCSS.nativeShadow)&&"adoptedStyleSheets"in Document.prototype&&"replace"in CSSStyleSheet.prototype,s=Symbol(),n=new WeakMap;let r=class{constructor(t,e,i){if(this._$cssResult$=!0,i!==s)throw Error("CSSResult is not constructable. Use `unsafeCSS` or `css` instead.");this.cssText=t,this.t=e}get styleSheet(){let t=this.o;const e=this.t;if(i&&void 0===t){const i=void 0!==e&&1===e.length;i&&(t=n.get(e)),void 0===t&&((this.o=t=new CSSStyleSheet).replaceSync(this.cssText),i&&n.set(e,t))}return t}toString(){return this.cssText}};const o=(t,...e)=>{const i=1===t.length?t[0]:e.reduce((e,i,s)=>e+(t=>{if(!0===t._$cssResult$)return t.cssText;if("number"==typeof t)return t;throw Error("Value passed to 'css' function must be a 'css' function result: "+t+". Use 'unsafeCSS' to pass non-literal values, but take care to ensure page security.")})(i)+t[s+1],t[0]);return new r(i,t,s)},a=i?t=>t:t=>t instanceof CSSStyleSheet?(t=>{let e="";for(const i of t.cssRules)e+=i.cssText;return(t=>new r("string"==typeof t?t:t+"",void 0,s))(e)})(t):t,{is:c,defineProperty:h,getOwnPropertyDescriptor:l,getOwnPropertyNames:d,getOwnPropertySymbols:p,getPrototypeOf:u}=Object,f=globalThis,g=f.trustedTypes,_=g?g.emptyScript:"",v=f.reactiveElementPolyfillSupport,m=(t,e)=>t,y={toAttribute(t,e){switch(e){case Boolean:t=t?_:null;break;case Object:case Array:t=null==t?t:JSON.stringify(t)}return t},fromAttribute(t,e){let i=t;switch(e){case Boolean:i=null!==t;break;case Number:i=null===t?null:Number(t);break;case Object:case Array:try{i=JSON.parse(t)}catch(t){i=null}}return i}},$=(t,e)=>!c(t,e),w={attribute:!0,type:String,converter:y,reflect:!1,useDefault:!1,hasChanged:$};Symbol.metadata??=Symbol("metadata"),f.litPropertyMetadata??=new WeakMap;let b=class extends HTMLElement{static addInitializer(t){this._$Ei(),(this.l??=[]).push(t)}static get observedAttributes(){return this.finalize(),this._$Eh&&[...this._$Eh.keys()]}static createProperty(t,e=w){if(e.state&&(e.attribute=!1),this._$Ei(),this.prototype.hasOwnProperty(t)&&((e=Object.create(e)).wrapped=!0),this.elementProperties.set(t,e),!e.noAccessor){const i=Symbol(),s=this.getPropertyDescriptor(t,i,e);void 0!==s&&h(this.prototype,t,s)}}static getPropertyDescriptor(t,e,i){const{get:s,set:n}=l(this.prototype,t)??{get(){return this[e]},set(t){this[e]=t}};return{get:s,set(e){const r=s?.call(this);n?.call(this,e),this.requestUpdate(t,r,i)},configurable:!0,enumerable:!0}}static getPropertyOptions(t){return this.elementProperties.get(t)??w}static _$Ei(){if(this.hasOwnProperty(m("elementProperties")))return;const t=u(this);t.finalize(),void 0!==t.l&&(this.l=[...t.l]),this.elementProperties=new Map(t.elementProperties)}static finalize(){if(this.hasOwnProperty(m("finalized")))return;if(this.finalized=!0,this._$Ei(),this.hasOwnProperty(m("properties"))){const t=this.properties,e=[...d(t),...p(t)];for(const i of e)this.createProperty(i,t[i])}const t=this[Symbol.metadata];if(null!==t){const e=litPropertyMetadata.get(t);if(void 0!==e)for(const[t,i]of e)this.elementProperties.set(t,i)}this._$Eh=new Map;for(const[t,e]of this.elementProperties){const i=this._$Eu(t,e);void 0!==i&&this._$Eh.set(i,t)}this.elementStyles=this.finalizeStyles(this.styles)}static finalizeStyles(t){const e=[];if(Array.isArray(t)){const i=new Set(t.flat(1/0).reverse());for(const t of i)e.unshift(a(t))}else void 0!==t&&e.push(a(t));return e}static _$Eu(t,e){const i=e.attribute;return!1===i?void 0:"string"==typeof i?i:"string"==typeof t?t.toLowerCase():void 0}constructor(){super(),this._$Ep=void 0,this.isUpdatePending=!1,this.hasUpdated=!1,this._$Em=null,this._$Ev()}_$Ev(){this._$ES=new Promise(t=>this.enableUpdating=t),this._$AL=new Map,this._$E_(),this.requestUpdate(),this.constructor.l?.forEach(t=>t(this))}addController(t){(this._$EO??=new Set).add(t),void 0!==this.renderRoot&&this.isConnected&&t.hostConnected?.()}removeController(t){this._$EO?.delete(t)}_$E_(){const t=new Map,e=this.constructor.elementProperties;for(const i of e.keys())this.hasOwnProperty(i)&&(t.set(i,this[i]),delete this[i]);t.size>0&&(this._$Ep=t)}createRenderRoot(){const t=this.shadowRoot??this.attachShadow(this.constructor.shadowRootOptions);return((t,s)=>{if(i)t.adoptedStyleSheets=s.map(t=>t instanceof CSSStyleSheet?t:t.styleSheet);else for(const i of s){const s=document.createElement("style"),n=e.litNonce;void 0!==n&&s.setAttribute("nonce",n),s.textContent=i.cssText,t.appendChild(s)}})(t,this.constructor.elementStyles),t}connectedCallback(){this.renderRoot??=this.createRenderRoot(),this.enableUpdating(!0),this._$EO?.forEach(t=>t.hostConnected?.())}enableUpdating(t){}disconnectedCallback(){this._$EO?.forEach(t=>t.hostDisconnected?.())}attributeChangedCallback(t,e,i){this._$AK(t,i)}_$ET(t,e){const i=this.constructor.elementProperties.get(t),s=this.constructor._$Eu(t,i);if(void 0!==s&&!0===i.reflect){const n=(void 0!==i.converter?.toAttribute?i.converter:y).toAttribute(e,i.type);this._$Em=t,null==n?this.removeAttribute(s):this.setAttribute(s,n),this._$Em=null}}_$AK(t,e){const i=this.constructor,s=i._$Eh.get(t);if(void 0!==s&&this._$Em!==s){const t=i.getPropertyOptions(s),n="function"==typeof t.converter?{fromAttribute:t.converter}:void 0!==t.converter?.fromAttribute?t.converter:y;this._$Em=s;const r=n.fromAttribute(e,t.type);this[s]=r??this._$Ej?.get(s)??r,this._$Em=null}}requestUpdate(t,e,i,s=!1,n){if(void 0!==t){const r=this.constructor;if(!1===s&&(n=this[t]),i??=r.getPropertyOptions(t),!((i.hasChanged??$)(n,e)||i.useDefault&&i.reflect&&n===this._$Ej?.get(t)&&!this.hasAttribute(r._$Eu(t,i))))return;this.C(t,e,i)}!1===this.isUpdatePending&&(this._$ES=this._$EP())}C(t,e,{useDefault:i,reflect:s,wrapped:n},r){i&&!(this._$Ej??=new Map).has(t)&&(this._$Ej.set(t,r??e??this[t]),!0!==n||void 0!==r)||(this._$AL.has(t)||(this.hasUpdated||i||(e=void 0),this._$AL.set(t,e)),!0===s&&this._$Em!==t&&(this._$Eq??=new Set).add(t))}async _$EP(){this.isUpdatePending=!0;try{await this._$ES}catch(t){Promise.reject(t)}const t=this.scheduleUpdate();return null!=t&&await t,!this.isUpdatePending}scheduleUpdate(){return this.performUpdate()}performUpdate(){if(!this.isUpdatePending)return;if(!this.hasUpdated){if(this.renderRoot??=this.createRenderRoot(),this._$Ep){for(const[t,e]of this._$Ep)this[t]=e;this._$Ep=void 0}const t=this.constructor.elementProperties;if(t.size>0)for(const[e,i]of t){const{wrapped:t}=i,s=this[e];!0!==t||this._$AL.has(e)||void 0===s||this.C(e,void 0,i,s)}}let t=!1;const e=this._$AL;try{t=this.shouldUpdate(e),t?(this.willUpdate(e),this._$EO?.forEach(t=>t.hostUpdate?.()),this.update(e)):this._$EM()}catch(e){throw t=!1,this._$EM(),e}t&&this._$AE(e)}willUpdate(t){}_$AE(t){this._$EO?.forEach(t=>t.hostUpdated?.()),this.hasUpdated||(this.hasUpdated=!0,this.firstUpdated(t)),this.updated(t)}_$EM(){this._$AL=new Map,this.isUpdatePending=!1}get updateComplete(){return this.getUpdateComplete()}getUpdateComplete(){return this._$ES}shouldUpdate(t){return!0}update(t){this._$Eq&&=this._$Eq.forEach(t=>this._$ET(t,this[t])),this._$EM()}updated(t){}firstUpdated(t){}};b.elementStyles=[],b.shadowRootOptions={mode:"open"},b[m("elementProperties")]=new Map,b[m("finalized")]=new Map,v?.({ReactiveElement:b}),(f.reactiveElementVersions??=[]).push("2.1.2");const S=globalThis,E=t=>t,x=S.trustedTypes,A=x?x.createPolicy("lit-html",{createHTML:t=>t}):void 0,T="$lit$",k=`lit$${Math.random().toFixed(9).slice(2)}$`,C="?"+k,z=`<${C}>`,P=document,N=()=>P.createComment(""),O=t=>null===t||"object"!=typeof t&&"function"!=typeof t,H=Array.isArray,R="[ \t\n\f\r]",D=/<(?:(!--|\/[^a-zA-Z])|(\/?[a-zA-Z][^>\s]*)|(\/?$))/g,U=/-->/g,M=/>/g,j=RegExp(`>|${R}(?:([^\\s"'>=/]+)(${R}*=${R}*(?:[^ \t\n\f\r"'\`<>=]|("|')|))|$)`,"g"),Z=/'/g,V=/"/g,L=/^(?:script|style|textarea|title)$/i,B=(t=>(e,...i)=>({_$litType$:t,strings:e,values:i}))(1),W=Symbol.for("lit-noChange"),I=Symbol.for("lit-nothing"),K=new WeakMap,q=P.createTreeWalker(P,129);function F(t,e){if(!H(t)||!t.hasOwnProperty("raw"))throw Error("invalid template strings array");return void 0!==A?A.createHTML(e):e}const J=(t,e)=>{const i=t.length-1,s=[];let n,r=2===e?"<svg>":3===e?"<math>":"",o=D;for(let e=0;e<i;e++){const i=t[e];let a,c,h=-1,l=0;for(;l<i.length&&(o.lastIndex=l,c=o.exec(i),null!==c);)l=o.lastIndex,o===D?"!--"===c[1]?o=U:void 0!==c[1]?o=M:void 0!==c[2]?(L.test(c[2])&&(n=RegExp("</"+c[2],"g")),o=j):void 0!==c[3]&&(o=j):o===j?">"===c[0]?(o=n??D,h=-1):void 0===c[1]?h=-2:(h=o.lastIndex-c[2].length,a=c[1],o=void 0===c[3]?j:'"'===c[3]?V:Z):o===V||o===Z?o=j:o===U||o===M?o=D:(o=j,n=void 0);const d=o===j&&t[e+1].startsWith("/>")?" ":"";r+=o===D?i+z:h>=0?(s.push(a),i.slice(0,h)+T+i.slice(h)+k+d):i+k+(-2===h?e:d)}return[F(t,r+(t[i]||"<?>")+(2===e?"</svg>":3===e?"</math>":"")),s]};class Y{constructor({strings:t,_$litType$:e},i){let s;this.parts=[];let n=0,r=0;const o=t.length-1,a=this.parts,[c,h]=J(t,e);if(this.el=Y.createElement(c,i),q.currentNode=this.el.content,2===e||3===e){const t=this.el.content.firstChild;t.replaceWith(...t.childNodes)}for(;null!==(s=q.nextNode())&&a.length<o;){if(1===s.nodeType){if(s.hasAttributes())for(const t of s.getAttributeNames())if(t.endsWith(T)){const e=h[r++],i=s.getAttribute(t).split(k),o=/([.?@])?(.*)/.exec(e);a.push({type:1,index:n,name:o[2],strings:i,ctor:"."===o[1]?et:"?"===o[1]?it:"@"===o[1]?st:tt}),s.removeAttribute(t)}else t.startsWith(k)&&(a.push({type:6,index:n}),s.removeAttribute(t));if(L.test(s.tagName)){const t=s.textContent.split(k),e=t.length-1;if(e>0){s.textContent=x?x.emptyScript:"";for(let i=0;i<e;i++)s.append(t[i],N()),q.nextNode(),a.push({type:2,index:++n});s.append(t[e],N())}}}else if(8===s.nodeType)if(s.data===C)a.push({type:2,index:n});else{let t=-1;for(;-1!==(t=s.data.indexOf(k,t+1));)a.push({type:7,index:n}),t+=k.length-1}n++}}static createElement(t,e){const i=P.createElement("template");return i.innerHTML=t,i}}function G(t,e,i=t,s){if(e===W)return e;let n=void 0!==s?i._$Co?.[s]:i._$Cl;const r=O(e)?void 0:e._$litDirective$;return n?.constructor!==r&&(n?._$AO?.(!1),void 0===r?n=void 0:(n=new r(t),n._$AT(t,i,s)),void 0!==s?(i._$Co??=[])[s]=n:i._$Cl=n),void 0!==n&&(e=G(t,n._$AS(t,e.values),n,s)),e}class Q{constructor(t,e){this._$AV=[],this._$AN=void 0,this._$AD=t,this._$AM=e}get parentNode(){return this._$AM.parentNode}get _$AU(){return this._$AM._$AU}u(t){const{el:{content:e},parts:i}=this._$AD,s=(t?.creationScope??P).importNode(e,!0);q.currentNode=s;let n=q.nextNode(),r=0,o=0,a=i[0];for(;void 0!==a;){if(r===a.index){let e;2===a.type?e=new X(n,n.nextSibling,this,t):1===a.type?e=new a.ctor(n,a.name,a.strings,this,t):6===a.type&&(e=new nt(n,this,t)),this._$AV.push(e),a=i[++o]}r!==a?.index&&(n=q.nextNode(),r++)}return q.currentNode=P,s}p(t){let e=0;for(const i of this._$AV)void 0!==i&&(void 0!==i.strings?(i._$AI(t,i,e),e+=i.strings.length-2):i._$AI(t[e])),e++}}class X{get _$AU(){return this._$AM?._$AU??this._$Cv}constructor(t,e,i,s){this.type=2,this._$AH=I,this._$AN=void 0,this._$AA=t,this._$AB=e,this._$AM=i,this.options=s,this._$Cv=s?.isConnected??!0}get parentNode(){let t=this._$AA.parentNode;const e=this._$AM;return void 0!==e&&11===t?.nodeType&&(t=e.parentNode),t}get startNode(){return this._$AA}get endNode(){return this._$AB}_$AI(t,e=this){t=G(this,t,e),O(t)?t===I||null==t||""===t?(this._$AH!==I&&this._$AR(),this._$AH=I):t!==this._$AH&&t!==W&&this._(t):void 0!==t._$litType$?this.$(t):void 0!==t.nodeType?this.T(t):(t=>H(t)||"function"==typeof t?.[Symbol.iterator])(t)?this.k(t):this._(t)}O(t){return this._$AA.parentNode.insertBefore(t,this._$AB)}T(t){this._$AH!==t&&(this._$AR(),this._$AH=this.O(t))}_(t){this._$AH!==I&&O(this._$AH)?this._$AA.nextSibling.data=t:this.T(P.createTextNode(t)),this._$AH=t}$(t){const{values:e,_$litType$:i}=t,s="number"==typeof i?this._$AC(t):(void 0===i.el&&(i.el=Y.createElement(F(i.h,i.h[0]),this.options)),i);if(this._$AH?._$AD===s)this._$AH.p(e);else{const t=new Q(s,this),i=t.u(this.options);t.p(e),this.T(i),this._$AH=t}}_$AC(t){let e=K.get(t.strings);return void 0===e&&K.set(t.strings,e=new Y(t)),e}k(t){H(this._$AH)||(this._$AH=[],this._$AR());const e=this._$AH;let i,s=0;for(const n of t)s===e.length?e.push(i=new X(this.O(N()),this.O(N()),this,this.options)):i=e[s],i._$AI(n),s++;s<e.length&&(this._$AR(i&&i._$AB.nextSibling,s),e.length=s)}_$AR(t=this._$AA.nextSibling,e){for(this._$AP?.(!1,!0,e);t!==this._$AB;){const e=E(t).nextSibling;E(t).remove(),t=e}}setConnected(t){void 0===this._$AM&&(this._$Cv=t,this._$AP?.(t))}}class tt{get tagName(){return this.element.tagName}get _$AU(){return this._$AM._$AU}constructor(t,e,i,s,n){this.type=1,this._$AH=I,this._$AN=void 0,this.element=t,this.name=e,this._$AM=s,this.options=n,i.length>2||""!==i[0]||""!==i[1]?(this._$AH=Array(i.length-1).fill(new String),this.strings=i):this._$AH=I}_$AI(t,e=this,i,s){const n=this.strings;let r=!1;if(void 0===n)t=G(this,t,e,0),r=!O(t)||t!==this._$AH&&t!==W,r&&(this._$AH=t);else{const s=t;let o,a;for(t=n[0],o=0;o<n.length-1;o++)a=G(this,s[i+o],e,o),a===W&&(a=this._$AH[o]),r||=!O(a)||a!==this._$AH[o],a===I?t=I:t!==I&&(t+=(a??"")+n[o+1]),this._$AH[o]=a}r&&!s&&this.j(t)}j(t){t===I?this.element.removeAttribute(this.name):this.element.setAttribute(this.name,t??"")}}class et extends tt{constructor(){super(...arguments),this.type=3}j(t){this.element[this.name]=t===I?void 0:t}}class it extends tt{constructor(){super(...arguments),this.type=4}j(t){this.element.toggleAttribute(this.name,!!t&&t!==I)}}class st extends tt{constructor(t,e,i,s,n){super(t,e,i,s,n),this.type=5}_$AI(t,e=this){if((t=G(this,t,e,0)??I)===W)return;const i=this._$AH,s=t===I&&i!==I||t.capture!==i.capture||t.once!==i.once||t.passive!==i.passive,n=t!==I&&(i===I||s);s&&this.element.removeEventListener(this.name,this,i),n&&this.element.addEventListener(this.name,this,t),this._$AH=t}handleEvent(t){"function"==typeof this._$AH?this._$AH.call(this.options?.host??this.element,t):this._$AH.handleEvent(t)}}class nt{constructor(t,e,i){this.element=t,this.type=6,this._$AN=void 0,this._$AM=e,this.options=i}get _$AU(){return this._$AM._$AU}_$AI(t){G(this,t)}}const rt=S.litHtmlPolyfillSupport;rt?.(Y,X),(S.litHtmlVersions??=[]).push("3.3.2");const ot=globalThis;class at extends b{constructor(){super(...arguments),this.renderOptions={host:this},this._$Do=void 0}createRenderRoot(){const t=super.createRenderRoot();return this.renderOptions.renderBefore??=t.firstChild,t}update(t){const e=this.render();this.hasUpdated||(this.renderOptions.isConnected=this.isConnected),super.update(t),this._$Do=((t,e,i)=>{const s=i?.renderBefore??e;let n=s._$litPart$;if(void 0===n){const t=i?.renderBefore??null;s._$litPart$=n=new X(e.insertBefore(N(),t),t,void 0,i??{})}return n._$AI(t),n})(e,this.renderRoot,this.renderOptions)}connectedCallback(){super.connectedCallback(),this._$Do?.setConnected(!0)}disconnectedCallback(){super.disconnectedCallback(),this._$Do?.setConnected(!1)}render(){return W}}at._$litElement$=!0,at.finalized=!0,ot.litElementHydrateSupport?.({LitElement:at});const ct=ot.litElementPolyfillSupport;ct?.({LitElement:at}),(ot.litElementVersions??=[]).push("4.2.2");const ht={attribute:!0,type:String,converter:y,reflect:!1,hasChanged:$},lt=(t=ht,e,i)=>{const{kind:s,metadata:n}=i;let r=globalThis.litPropertyMetadata.get(n);if(void 0===r&&globalThis.litPropertyMetadata.set(n,r=new Map),"setter"===s&&((t=Object.create(t)).wrapped=!0),r.set(i.name,t),"accessor"===s){const{name:s}=i;return{set(i){const n=e.get.call(this);e.set.call(this,i),this.requestUpdate(s,n,t,!0,i)},init(e){return void 0!==e&&this.C(s,void 0,t,e),e}}}if("setter"===s){const{name:s}=i;return function(i){const n=this[s];e.call(this,i),this.requestUpdate(s,n,t,!0,i)}}throw Error("Unsupported decorator location: "+s)};function dt(t){return(e,i)=>"object"==typeof i?lt(t,e,i):((t,e,i)=>{const s=e.hasOwnProperty(i);return e.constructor.createProperty(i,t),s?Object.getOwnPropertyDescriptor(e,i):void 0})(t,e,i)}const pt={cs:{title:"ČEZ HDO Status",lowTariff:"Nízký tarif",highTariff:"Vysoký tarif",active:"Aktivní",inactive:"Neaktivní",ntStart:"NT začátek",vtStart:"VT začátek",ntEnd:"NT konec",vtEnd:"VT konec",ntRemaining:"NT zbývá",vtRemaining:"VT zbývá",currentPrice:"Aktuální cena",priceUnit:"Kč/kWh",currency:"Kč/kWh",currencyShort:"Kč",scheduleTitle:"HDO rozvrh",hdoSchedule:"HDO rozvrh",scheduleNotAvailable:"Rozvrh není k dispozici",nt:"NT",vt:"VT",loading:"Načítání...",entityNotFound:"Entita nenalezena",configureEntities:"Nakonfigurujte entity v nastavení karty",editorTitle:"Titulek",showTitle:"Zobrazit titulek",showTariffStatus:"Zobrazit stavy tarifů",showTariffPrices:"Zobrazit ceny u tarifů",showTimes:"Zobrazit časy (začátek/konec)",showDuration:"Zobrazit zbývající čas",showCurrentPrice:"Zobrazit aktuální cenu",showHdoSchedule:"Zobrazit HDO rozvrh",showSchedulePrices:"Zobrazit ceny v legendě rozvrhu",compactMode:"Kompaktní režim",ntActiveBinarySensor:"NT aktivní (binary_sensor)",vtActiveBinarySensor:"VT aktivní (binary_sensor)",ntStartSensor:"NT začátek (sensor)",ntEndSensor:"NT konec (sensor)",ntRemainingSensor:"NT zbývá (sensor)",vtStartSensor:"VT začátek (sensor)",vtEndSensor:"VT konec (sensor)",vtRemainingSensor:"VT zbývá (sensor)",hdoScheduleSensor:"HDO rozvrh (sensor)",editorHint:"Entity jsou předvyplněny automaticky. Změňte pouze pokud máte více instancí integrace."},en:{title:"ČEZ HDO Status",lowTariff:"Low Tariff",highTariff:"High Tariff",active:"Active",inactive:"Inactive",ntStart:"NT Start",vtStart:"VT Start",ntEnd:"NT End",vtEnd:"VT End",ntRemaining:"NT Remaining",vtRemaining:"VT Remaining",currentPrice:"Current Price",priceUnit:"CZK/kWh",currency:"CZK/kWh",currencyShort:"CZK",scheduleTitle:"HDO Schedule",hdoSchedule:"HDO Schedule",scheduleNotAvailable:"Schedule not available",nt:"NT",vt:"VT",loading:"Loading...",entityNotFound:"Entity not found",configureEntities:"Configure entities in card settings",editorTitle:"Title",showTitle:"Show title",showTariffStatus:"Show tariff status",showTariffPrices:"Show tariff prices",showTimes:"Show times (start/end)",showDuration:"Show remaining time",showCurrentPrice:"Show current price",showHdoSchedule:"Show HDO schedule",showSchedulePrices:"Show prices in schedule legend",compactMode:"Compact mode",ntActiveBinarySensor:"NT active (binary_sensor)",vtActiveBinarySensor:"VT active (binary_sensor)",ntStartSensor:"NT start (sensor)",ntEndSensor:"NT end (sensor)",ntRemainingSensor:"NT remaining (sensor)",vtStartSensor:"VT start (sensor)",vtEndSensor:"VT end (sensor)",vtRemainingSensor:"VT remaining (sensor)",hdoScheduleSensor:"HDO schedule (sensor)",editorHint:"Entities are auto-filled. Change only if you have multiple integration instances."},sk:{title:"ČEZ HDO Status",lowTariff:"Nízky tarif",highTariff:"Vysoký tarif",active:"Aktívny",inactive:"Neaktívny",ntStart:"NT začiatok",vtStart:"VT začiatok",ntEnd:"NT koniec",vtEnd:"VT koniec",ntRemaining:"NT zostáva",vtRemaining:"VT zostáva",currentPrice:"Aktuálna cena",priceUnit:"Kč/kWh",currency:"Kč/kWh",currencyShort:"Kč",scheduleTitle:"HDO rozvrh",hdoSchedule:"HDO rozvrh",scheduleNotAvailable:"Rozvrh nie je k dispozícii",nt:"NT",vt:"VT",loading:"Načítava sa...",entityNotFound:"Entita nenájdená",configureEntities:"Nakonfigurujte entity v nastavení karty",editorTitle:"Nadpis",showTitle:"Zobraziť nadpis",showTariffStatus:"Zobraziť stavy tarifov",showTariffPrices:"Zobraziť ceny pri tarifoch",showTimes:"Zobraziť časy (začiatok/koniec)",showDuration:"Zobraziť zostávajúci čas",showCurrentPrice:"Zobraziť aktuálnu cenu",showHdoSchedule:"Zobraziť HDO rozvrh",showSchedulePrices:"Zobraziť ceny v legende rozvrhu",compactMode:"Kompaktný režim",ntActiveBinarySensor:"NT aktívny (binary_sensor)",vtActiveBinarySensor:"VT aktívny (binary_sensor)",ntStartSensor:"NT začiatok (sensor)",ntEndSensor:"NT koniec (sensor)",ntRemainingSensor:"NT zostáva (sensor)",vtStartSensor:"VT začiatok (sensor)",vtEndSensor:"VT koniec (sensor)",vtRemainingSensor:"VT zostáva (sensor)",hdoScheduleSensor:"HDO rozvrh (sensor)",editorHint:"Entity sú predvyplnené automaticky. Zmeňte len ak máte viac inštancií integrácie."}};function ut(t){const e=t.split("-")[0].toLowerCase();return pt[e]||pt.en}function ft(t){return t?.language?t.language:t?.locale?.language?t.locale.language:"undefined"!=typeof navigator&&navigator.language?navigator.language:"en"}const gt={low_tariff:{domain:"binary_sensor",prefix:"cez_hdo_lowtariffactive_"},high_tariff:{domain:"binary_sensor",prefix:"cez_hdo_hightariffactive_"},low_start:{domain:"sensor",prefix:"cez_hdo_lowtariffstart_"},low_end:{domain:"sensor",prefix:"cez_hdo_lowtariffend_"},low_duration:{domain:"sensor",prefix:"cez_hdo_lowtariffduration_"},high_start:{domain:"sensor",prefix:"cez_hdo_hightariffstart_"},high_end:{domain:"sensor",prefix:"cez_hdo_hightariffend_"},high_duration:{domain:"sensor",prefix:"cez_hdo_hightariffduration_"},schedule:{domain:"sensor",prefix:"cez_hdo_schedule_"}},_t={low_tariff:"",high_tariff:"",low_start:"",low_end:"",low_duration:"",high_start:"",high_end:"",high_duration:"",schedule:""};let vt=class extends at{static getConfigElement(){return document.createElement("cez-hdo-card-editor")}static getStubConfig(){return{type:"custom:cez-hdo-card",title:"ČEZ HDO Status",show_times:!0,show_duration:!0,compact_mode:!1,entities:{..._t}}}connectedCallback(){super.connectedCallback(),this._minuteTimer=window.setInterval(()=>this.requestUpdate(),6e4)}disconnectedCallback(){void 0!==this._minuteTimer&&(window.clearInterval(this._minuteTimer),this._minuteTimer=void 0),this._unsubscribeSchedule(),super.disconnectedCallback()}updated(){const t=this.config?.show_schedule?this.resolveEntity("schedule"):void 0;t!==this._subscribedEntity&&(this._unsubscribeSchedule(),t&&this._subscribeSchedule(t))}_subscribeSchedule(t){this._subscribedEntity=t,this.hass?.connection&&(this._scheduleUnsub=this.hass.connection.subscribeMessage(t=>{const e=t.full?{}:{...this._wsDays};t.removed.forEach(t=>delete e[t]),this._wsDays={...e,...t.days}},{type:"cez_hdo/subscribe_schedule",entity_id:t}),this._scheduleUnsub.catch(()=>{this._scheduleUnsub=void 0}))}_unsubscribeSchedule(){this._scheduleUnsub?.then(t=>t()).catch(()=>{}),this._scheduleUnsub=void 0,this._subscribedEntity=void 0,this._wsDays&&(this._wsDays=void 0)}_decodeSchedule(t){const e=[];return Object.keys(t).sort().forEach(i=>{const s=t[i],n=[s.start,...s.switches,s.end];let r=s.low;for(let t=0;t<n.length-1;t++)e.push({start:new Date(6e4*n[t]).toISOString(),end:new Date(6e4*n[t+1]).toISOString(),tariff:r?"NT":"VT"}),r=!r}),e}setConfig(t){t.entities||(t={entities:{},title:"ČEZ HDO Status",show_times:!0,show_duration:!0,compact_mode:!1,...t}),this.config=t}findAllEntitiesByPrefix(t){if(!this.hass?.states)return[];const e=gt[t];if(!e)return[];const i=`${e.domain}.${e.prefix}`;return Object.keys(this.hass.states).filter(t=>t.startsWith(i))}resolveEntity(t){const e=this.config.entities?.[t];if(e&&this.hass?.states[e])return e;const i=this.findAllEntitiesByPrefix(t);if(1===i.length)return i[0];const s=_t[t];return s&&this.hass?.states[s]?s:void 0}getEntityState(t){if(!t||!this.hass)return"unavailable";const e=this.hass.states[t];return e?e.state:"unavailable"}getRemainingTime(t){const e=t&&this.hass?this.hass.states[t]:void 0;if(!e||"timestamp"!==e.attributes.device_class)return this.getEntityState(t);const i=Date.parse(e.state);if(Number.isNaN(i))return"00:00";const s=Math.max(0,Math.floor((i-Date.now())/6e4));return`${String(Math.floor(s/60)).padStart(2,"0")}:${String(s%60).padStart(2,"0")}`}isEntityOn(t){return"on"===this.getEntityState(t)}getPricesFromSensor(){const t=this.resolveEntity("schedule"),e=t?this.hass?.states[t]:void 0;if(e?.attributes){const t=e.attributes.low_tariff_price,i=e.attributes.high_tariff_price;return{low:"number"==typeof t?t:0,high:"number"==typeof i?i:0}}return{low:0,high:0}}render(){if(!this.config||!this.hass)return B`<ha-card>Loading...</ha-card>`;const t=ut(ft(this.hass)),e={low_tariff:this.resolveEntity("low_tariff"),high_tariff:this.resolveEntity("high_tariff"),low_start:this.resolveEntity("low_start"),low_end:this.resolveEntity("low_end"),low_duration:this.resolveEntity("low_duration"),high_start:this.resolveEntity("high_start"),high_end:this.resolveEntity("high_end"),high_duration:this.resolveEntity("high_duration"),schedule:this.resolveEntity("schedule")},i=this.isEntityOn(e.low_tariff),s=this.isEntityOn(e.high_tariff),n=this.getEntityState(e.low_start),r=this.getEntityState(e.low_end),o=this.getRemainingTime(e.low_duration),a=this.getEntityState(e.high_start),c=this.getEntityState(e.high_end),h=this.getRemainingTime(e.high_duration),l=this.config.title||"ČEZ HDO",d=!1!==this.config.show_times,p=!1!==this.config.show_duration,u=!0===this.config.compact_mode,f=!1!==this.config.show_price,g=this.getPricesFromSensor(),_=g.low,v=g.high,m=i?_:v,y=!0===this.config.show_tariff_prices,$=!1!==this.config.show_title,w=!1!==this.config.show_tariff_status;return B`
       <ha-card class="${u?"compact":""}">
         ${$?B`<div class="card-header">${l}</div>`:""}
 
@@ -62,7 +62,7 @@ function t(t,e,i,s){var n,r=arguments.length,o=r<3?e:null===s?s=Object.getOwnPro
 
         ${this._renderSchedule(t)}
       </ha-card>
-    `}_renderSchedule(t){if(!this.config.show_schedule)return B``;const e=this.resolveEntity("schedule"),i=e?this.hass.states[e]:void 0;if(!i||!i.attributes.schedule)return B`<div class="schedule-error">${t.scheduleNotAvailable}</div>`;const s=i.attributes.schedule,n={},r=ft(this.hass),o="cs"===r?"cs-CZ":"sk"===r?"sk-SK":"en-US";s.forEach(t=>{const e=new Date(t.start),i=`${e.getFullYear()}-${String(e.getMonth()+1).padStart(2,"0")}-${String(e.getDate()).padStart(2,"0")}`,s=e.toLocaleDateString(o,{weekday:"short",day:"2-digit",month:"2-digit"});n[i]||(n[i]={label:s,items:[]}),n[i].items.push(t)});const a=Object.keys(n).sort(),c=this.getPricesFromSensor(),h=c.low,l=c.high,d=!0===this.config.show_schedule_prices&&(h>0||l>0);return B`
+    `}_renderSchedule(t){if(!this.config.show_schedule)return B``;const e=this.resolveEntity("schedule"),i=e?this.hass.states[e]:void 0;if(!this._wsDays&&(!i||!i.attributes.schedule))return B`<div class="schedule-error">${t.scheduleNotAvailable}</div>`;const s=this._wsDays?this._decodeSchedule(this._wsDays):i.attributes.schedule,n={},r=ft(this.hass),o="cs"===r?"cs-CZ":"sk"===r?"sk-SK":"en-US";s.forEach(t=>{const e=new Date(t.start),i=`${e.getFullYear()}-${String(e.getMonth()+1).padStart(2,"0")}-${String(e.getDate()).padStart(2,"0")}`,s=e.toLocaleDateString(o,{weekday:"short",day:"2-digit",month:"2-digit"});n[i]||(n[i]={label:s,items:[]}),n[i].items.push(t)});const a=Object.keys(n).sort(),c=this.getPricesFromSensor(),h=c.low,l=c.high,d=!0===this.config.show_schedule_prices&&(h>0||l>0);return B`
       <div class="schedule-container">
         <div class="schedule-header">
           <span class="schedule-title">${t.hdoSchedule}</span>
@@ -382,4 +382,4 @@ function t(t,e,i,s){var n,r=arguments.length,o=r<3?e:null===s?s=Object.getOwnPro
       .compact .block-time {
         display: none;
       }
-    `}};t([dt({attribute:!1})],vt.prototype,"hass",void 0),t([function(t){return dt({...t,state:!0,attribute:!1})}()],vt.prototype,"config",void 0),vt=t([(t=>(e,i)=>{void 0!==i?i.addInitializer(()=>{customElements.define(t,e)}):customElements.define(t,e)})("cez-hdo-card")],vt),customElements.get("cez-hdo-card")||customElements.define("cez-hdo-card",vt),window.customCards=window.customCards||[],window.customCards.push({type:"cez-hdo-card",name:"ČEZ HDO Card",description:"Custom card for ČEZ HDO integration",preview:!0});const mt={low_tariff:{domain:"binary_sensor",prefix:"cez_hdo_lowtariffactive_"},high_tariff:{domain:"binary_sensor",prefix:"cez_hdo_hightariffactive_"},low_start:{domain:"sensor",prefix:"cez_hdo_lowtariffstart_"},low_end:{domain:"sensor",prefix:"cez_hdo_lowtariffend_"},low_duration:{domain:"sensor",prefix:"cez_hdo_lowtariffduration_"},high_start:{domain:"sensor",prefix:"cez_hdo_hightariffstart_"},high_end:{domain:"sensor",prefix:"cez_hdo_hightariffend_"},high_duration:{domain:"sensor",prefix:"cez_hdo_hightariffduration_"},schedule:{domain:"sensor",prefix:"cez_hdo_schedule_"}};function yt(t,e){if(!t?.states)return[];const i=mt[e];if(!i)return[];const s=`${i.domain}.${i.prefix}`;return Object.keys(t.states).filter(t=>t.startsWith(s))}class $t extends HTMLElement{constructor(){super(),this._config={},this.attachShadow({mode:"open"})}set hass(t){if(this._hass=t,this.shadowRoot){this.shadowRoot.querySelectorAll("ha-selector").forEach(e=>{e.hass=t})}}setConfig(t){this._config=t||{},this._render()}_emitConfigChanged(){this.dispatchEvent(new CustomEvent("config-changed",{detail:{config:this._config},bubbles:!0,composed:!0}))}_setOption(t,e,i=!1){this._config={...this._config,[t]:e},this._emitConfigChanged(),i||this._render()}_setEntity(t,e){const i={...this._config.entities||{}};e?i[t]=e:delete i[t],this._config={...this._config,entities:i},this._emitConfigChanged()}_entityPicker(t,e,i){let s=this._config.entities&&this._config.entities[e]||"";const n=function(t,e){const i=yt(t,e);return 1===i.length?i[0]:null}(this._hass,e),r=yt(this._hass,e),o=s||n||"",a=document.createElement("div");a.className="entity-row";const c=document.createElement("ha-selector");if(c.hass=this._hass,c.label=t,c.selector={entity:i&&i.length?{domain:i}:{}},c.value=o,c.addEventListener("value-changed",t=>{this._setEntity(e,t.detail.value)}),a.appendChild(c),!s&&n){const t=document.createElement("div");t.className="hint",t.textContent="Auto-detekováno",a.appendChild(t)}else if(!s&&!n&&r.length>1){const t=document.createElement("div");t.className="hint hint-warning",t.textContent=`Nalezeno ${r.length} zařízení - vyberte entitu`,a.appendChild(t)}else if(!s&&!n&&0===r.length){const t=document.createElement("div");t.className="hint",t.textContent="Žádná ČEZ HDO entita nenalezena",a.appendChild(t)}return a}_render(){if(!this.shadowRoot||!this._hass)return void(this.shadowRoot&&(this.shadowRoot.innerHTML=""));const t=ut(ft(this._hass)),e=this._config.title??"",i=!1!==this._config.show_times,s=!1!==this._config.show_duration,n=!0===this._config.compact_mode;this.shadowRoot.innerHTML='\n      <style>\n        .wrap {\n          display: flex;\n          flex-direction: column;\n          gap: 12px;\n          padding: 4px 0;\n        }\n        .entity-row {\n          display: flex;\n          flex-direction: column;\n          gap: 6px;\n        }\n        .entity-row ha-selector {\n          display: block;\n        }\n        .hint {\n          font-size: 12px;\n          opacity: 0.8;\n        }\n        .hint-warning {\n          color: var(--warning-color, #ff9800);\n          font-weight: 500;\n        }\n      </style>\n      <div class="wrap"></div>\n    ';const r=this.shadowRoot.querySelector(".wrap");if(!r)return;const o=document.createElement("ha-textfield");o.label=t.editorTitle,o.value=e,o.addEventListener("input",t=>{this._config={...this._config,title:t.target.value}}),o.addEventListener("change",t=>{this._config={...this._config,title:t.target.value},this._emitConfigChanged()}),r.appendChild(o);const a=(t,e,i)=>{const s=document.createElement("ha-formfield");s.label=t;const n=document.createElement("ha-switch");return n.checked=i,n.addEventListener("change",()=>this._setOption(e,n.checked,!0)),s.appendChild(n),s};r.appendChild(a(t.showTitle,"show_title",!1!==this._config.show_title)),r.appendChild(a(t.showTariffStatus,"show_tariff_status",!1!==this._config.show_tariff_status)),r.appendChild(a(t.showTariffPrices,"show_tariff_prices",!0===this._config.show_tariff_prices)),r.appendChild(a(t.showTimes,"show_times",i)),r.appendChild(a(t.showDuration,"show_duration",s)),r.appendChild(a(t.showCurrentPrice,"show_price",!1!==this._config.show_price)),r.appendChild(a(t.showHdoSchedule,"show_schedule",!0===this._config.show_schedule)),r.appendChild(a(t.showSchedulePrices,"show_schedule_prices",!0===this._config.show_schedule_prices)),r.appendChild(a(t.compactMode,"compact_mode",n)),r.appendChild(this._entityPicker(t.ntActiveBinarySensor,"low_tariff",["binary_sensor"])),r.appendChild(this._entityPicker(t.vtActiveBinarySensor,"high_tariff",["binary_sensor"])),r.appendChild(this._entityPicker(t.ntStartSensor,"low_start",["sensor"])),r.appendChild(this._entityPicker(t.ntEndSensor,"low_end",["sensor"])),r.appendChild(this._entityPicker(t.ntRemainingSensor,"low_duration",["sensor"])),r.appendChild(this._entityPicker(t.vtStartSensor,"high_start",["sensor"])),r.appendChild(this._entityPicker(t.vtEndSensor,"high_end",["sensor"])),r.appendChild(this._entityPicker(t.vtRemainingSensor,"high_duration",["sensor"])),r.appendChild(this._entityPicker(t.hdoScheduleSensor,"schedule",["sensor"]));const c=document.createElement("div");c.className="hint",c.textContent=t.editorHint,r.appendChild(c)}}customElements.get("cez-hdo-card-editor")||customElements.define("cez-hdo-card-editor",$t);console.info("ČEZ HDO Card v3.0.0-RC.2 loaded successfully");
+    `}};t([dt({attribute:!1})],vt.prototype,"hass",void 0),t([function(t){return dt({...t,state:!0,attribute:!1})}()],vt.prototype,"config",void 0),t([function(t){return dt({...t,state:!0,attribute:!1})}()],vt.prototype,"_wsDays",void 0),vt=t([(t=>(e,i)=>{void 0!==i?i.addInitializer(()=>{customElements.define(t,e)}):customElements.define(t,e)})("cez-hdo-card")],vt),customElements.get("cez-hdo-card")||customElements.define("cez-hdo-card",vt),window.customCards=window.customCards||[],window.customCards.push({type:"cez-hdo-card",name:"ČEZ HDO Card",description:"Custom card for ČEZ HDO integration",preview:!0});const mt={low_tariff:{domain:"binary_sensor",prefix:"cez_hdo_lowtariffactive_"},high_tariff:{domain:"binary_sensor",prefix:"cez_hdo_hightariffactive_"},low_start:{domain:"sensor",prefix:"cez_hdo_lowtariffstart_"},low_end:{domain:"sensor",prefix:"cez_hdo_lowtariffend_"},low_duration:{domain:"sensor",prefix:"cez_hdo_lowtariffduration_"},high_start:{domain:"sensor",prefix:"cez_hdo_hightariffstart_"},high_end:{domain:"sensor",prefix:"cez_hdo_hightariffend_"},high_duration:{domain:"sensor",prefix:"cez_hdo_hightariffduration_"},schedule:{domain:"sensor",prefix:"cez_hdo_schedule_"}};function yt(t,e){if(!t?.states)return[];const i=mt[e];if(!i)return[];const s=`${i.domain}.${i.prefix}`;return Object.keys(t.states).filter(t=>t.startsWith(s))}class $t extends HTMLElement{constructor(){super(),this._config={},this.attachShadow({mode:"open"})}set hass(t){if(this._hass=t,this.shadowRoot){this.shadowRoot.querySelectorAll("ha-selector").forEach(e=>{e.hass=t})}}setConfig(t){this._config=t||{},this._render()}_emitConfigChanged(){this.dispatchEvent(new CustomEvent("config-changed",{detail:{config:this._config},bubbles:!0,composed:!0}))}_setOption(t,e,i=!1){this._config={...this._config,[t]:e},this._emitConfigChanged(),i||this._render()}_setEntity(t,e){const i={...this._config.entities||{}};e?i[t]=e:delete i[t],this._config={...this._config,entities:i},this._emitConfigChanged()}_entityPicker(t,e,i){let s=this._config.entities&&this._config.entities[e]||"";const n=function(t,e){const i=yt(t,e);return 1===i.length?i[0]:null}(this._hass,e),r=yt(this._hass,e),o=s||n||"",a=document.createElement("div");a.className="entity-row";const c=document.createElement("ha-selector");if(c.hass=this._hass,c.label=t,c.selector={entity:i&&i.length?{domain:i}:{}},c.value=o,c.addEventListener("value-changed",t=>{this._setEntity(e,t.detail.value)}),a.appendChild(c),!s&&n){const t=document.createElement("div");t.className="hint",t.textContent="Auto-detekováno",a.appendChild(t)}else if(!s&&!n&&r.length>1){const t=document.createElement("div");t.className="hint hint-warning",t.textContent=`Nalezeno ${r.length} zařízení - vyberte entitu`,a.appendChild(t)}else if(!s&&!n&&0===r.length){const t=document.createElement("div");t.className="hint",t.textContent="Žádná ČEZ HDO entita nenalezena",a.appendChild(t)}return a}_render(){if(!this.shadowRoot||!this._hass)return void(this.shadowRoot&&(this.shadowRoot.innerHTML=""));const t=ut(ft(this._hass)),e=this._config.title??"",i=!1!==this._config.show_times,s=!1!==this._config.show_duration,n=!0===this._config.compact_mode;this.shadowRoot.innerHTML='\n      <style>\n        .wrap {\n          display: flex;\n          flex-direction: column;\n          gap: 12px;\n          padding: 4px 0;\n        }\n        .entity-row {\n          display: flex;\n          flex-direction: column;\n          gap: 6px;\n        }\n        .entity-row ha-selector {\n          display: block;\n        }\n        .hint {\n          font-size: 12px;\n          opacity: 0.8;\n        }\n        .hint-warning {\n          color: var(--warning-color, #ff9800);\n          font-weight: 500;\n        }\n      </style>\n      <div class="wrap"></div>\n    ';const r=this.shadowRoot.querySelector(".wrap");if(!r)return;const o=document.createElement("ha-textfield");o.label=t.editorTitle,o.value=e,o.addEventListener("input",t=>{this._config={...this._config,title:t.target.value}}),o.addEventListener("change",t=>{this._config={...this._config,title:t.target.value},this._emitConfigChanged()}),r.appendChild(o);const a=(t,e,i)=>{const s=document.createElement("ha-formfield");s.label=t;const n=document.createElement("ha-switch");return n.checked=i,n.addEventListener("change",()=>this._setOption(e,n.checked,!0)),s.appendChild(n),s};r.appendChild(a(t.showTitle,"show_title",!1!==this._config.show_title)),r.appendChild(a(t.showTariffStatus,"show_tariff_status",!1!==this._config.show_tariff_status)),r.appendChild(a(t.showTariffPrices,"show_tariff_prices",!0===this._config.show_tariff_prices)),r.appendChild(a(t.showTimes,"show_times",i)),r.appendChild(a(t.showDuration,"show_duration",s)),r.appendChild(a(t.showCurrentPrice,"show_price",!1!==this._config.show_price)),r.appendChild(a(t.showHdoSchedule,"show_schedule",!0===this._config.show_schedule)),r.appendChild(a(t.showSchedulePrices,"show_schedule_prices",!0===this._config.show_schedule_prices)),r.appendChild(a(t.compactMode,"compact_mode",n)),r.appendChild(this._entityPicker(t.ntActiveBinarySensor,"low_tariff",["binary_sensor"])),r.appendChild(this._entityPicker(t.vtActiveBinarySensor,"high_tariff",["binary_sensor"])),r.appendChild(this._entityPicker(t.ntStartSensor,"low_start",["sensor"])),r.appendChild(this._entityPicker(t.ntEndSensor,"low_end",["sensor"])),r.appendChild(this._entityPicker(t.ntRemainingSensor,"low_duration",["sensor"])),r.appendChild(this._entityPicker(t.vtStartSensor,"high_start",["sensor"])),r.appendChild(this._entityPicker(t.vtEndSensor,"high_end",["sensor"])),r.appendChild(this._entityPicker(t.vtRemainingSensor,"high_duration",["sensor"])),r.appendChild(this._entityPicker(t.hdoScheduleSensor,"schedule",["sensor"]));const c=document.createElement("div");c.className="hint",c.textContent=t.editorHint,r.appendChild(c)}}customElements.get("cez-hdo-card-editor")||customElements.define("cez-hdo-card-editor",$t);console.info("ČEZ HDO Card v3.0.0-RC.2 loaded successfully");
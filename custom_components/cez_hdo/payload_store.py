@@ -0,0 +1,337 @@
+"""Payload, prices and compiled snapshots shared by all coordinators of one EAN."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from . import archive, cache, downloader
+from .const import DOMAIN, ean_suffix, mask_ean
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key for hass.data[DOMAIN] - payload stores shared by all coordinators of the same EAN
+DATA_PAYLOAD_STORES = "payload_stores"
+
+# Persistent storage in .storage/cez_hdo.{ean_suffix}: cached payload, prices,
+# one compiled schedule snapshot per signal and the expiry notifications shown
+STORAGE_VERSION = 1
+STORAGE_KEY = "cez_hdo.{}"
+# Bursts of price/payload updates within this many seconds coalesce into one write
+STORAGE_SAVE_DELAY = 10
+
+# Legacy cache directory (before Store) - migrated on first start, then removed
+LEGACY_CACHE_SUBDIR = "custom_components/cez_hdo/data"
+# Legacy file names were per-EAN: cache_{ean}.json, prices_{ean}.json
+
+# Called when the payload or the prices changed
+UpdateCallback = Callable[[], None]
+# Returns the compiled snapshot of one signal for the given payload digest
+SnapshotCallback = Callable[[str], "dict[str, Any] | None"]
+
+
+def _snapshot_key(signal: str | None) -> str:
+    """Return the storage key of a signal's snapshot."""
+    return signal or ""
+
+
+class PayloadStore:
+    """Payload of one EAN, decoded and indexed once for all its signals.
+
+    Every configured signal gets its own coordinator, but they all read the
+    payload, its SignalIndex and the prices from this store and compile only
+    their own timeline and bitmap. The storage file is written once per burst
+    of changes with the snapshots of all signals.
+    """
+
+    def __init__(self, hass: HomeAssistant, ean: str) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self.ean = ean
+        ean_short = ean_suffix(ean)
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY.format(ean_short))
+        self._save_pending: bool = False
+        self._load_task: asyncio.Task[None] | None = None
+        self._archive_tasks: set[asyncio.Task[None]] = set()
+        # Append-only history of every received day/signal schedule
+        self.archive = archive.get_archive(hass, ean)
+        legacy_dir = Path(hass.config.path(LEGACY_CACHE_SUBDIR))
+        self._legacy_cache_file = legacy_dir / f"cache_{ean_short}.json"
+        self._legacy_prices_file = legacy_dir / f"prices_{ean_short}.json"
+
+        self.raw_data: dict[str, Any] | None = None
+        self.index: downloader.SignalIndex | None = None
+        self.last_update: datetime | None = None
+        # Incremented with every new payload so views know when to recompile
+        self.version: int = 0
+        self._cache_data: dict[str, Any] | None = None
+        self._digest: str | None = None
+
+        self.low_tariff_price: float = 0.0
+        self.high_tariff_price: float = 0.0
+        # Expiry notification types already shown for the current payload
+        self.notified: set[str] = set()
+
+        # Stored snapshots by signal key, kept for signals without a loaded view
+        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._listeners: dict[UpdateCallback, SnapshotCallback] = {}
+
+    @property
+    def path(self) -> str:
+        """Return the path of the storage file."""
+        return self._store.path
+
+    @property
+    def digest(self) -> str | None:
+        """Return the digest of the payload's signal rows."""
+        if self._digest is None and self.raw_data is not None:
+            self._digest = cache.payload_digest(self._encoded_cache())
+        return self._digest
+
+    async def async_load(self) -> None:
+        """Load the stored payload once; concurrent callers await the same load."""
+        task = self._load_task
+        if task is None:
+            task = self._load_task = self.hass.async_create_task(
+                self._async_load(), f"cez_hdo payload store {mask_ean(self.ean)}"
+            )
+        try:
+            # Shield - a cancelled setup must not cancel the shared load
+            await asyncio.shield(task)
+        except Exception:
+            if self._load_task is task:
+                self._load_task = None
+            raise
+
+    async def _async_load(self) -> None:
+        """Load cached payload, prices and snapshots from storage, migrating legacy files."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("PayloadStore: Failed to load storage: %s", err)
+            stored = None
+
+        if stored is None:
+            stored = await self.hass.async_add_executor_job(self._read_legacy_files)
+            if stored is not None:
+                await self._store.async_save(stored)
+                await self.hass.async_add_executor_job(self._remove_legacy_files)
+                _LOGGER.info("PayloadStore: Migrated cache files to storage for EAN %s", mask_ean(self.ean))
+            else:
+                stored = {}
+
+        prices = stored.get("prices") or {}
+        self.low_tariff_price = prices.get("low_tariff_price", 0.0)
+        self.high_tariff_price = prices.get("high_tariff_price", 0.0)
+
+        if not stored.get("cache"):
+            return
+        try:
+            raw_data, timestamp, _version = cache.decode_cache_data(stored["cache"])
+        except ValueError as err:
+            _LOGGER.warning("PayloadStore: Ignoring stored payload: %s", err)
+            return
+        self._set_payload(raw_data, timestamp or datetime.now())
+        self.notified = set(stored.get("notified") or [])
+
+        snapshots = stored.get("snapshots")
+        if snapshots is None and stored.get("snapshot"):
+            # Single-signal layout written before the store was shared
+            snapshot = stored["snapshot"]
+            snapshots = {_snapshot_key(snapshot.get("signal")): snapshot}
+        self._snapshots = {
+            key: snapshot
+            for key, snapshot in (snapshots or {}).items()
+            if snapshot.get("payload_digest") == self.digest
+            and snapshot.get("parser_version") == downloader.PARSER_VERSION
+        }
+        if not self._snapshots:
+            # Seed the archive with payloads stored before it existed
+            self._async_archive_payload(raw_data)
+        _LOGGER.debug("PayloadStore: Loaded data from storage, timestamp=%s", self.last_update)
+
+    def snapshot(self, signal: str | None) -> dict[str, Any] | None:
+        """Return the stored compiled snapshot of a signal for the current payload."""
+        snapshot = self._snapshots.get(_snapshot_key(signal))
+        if snapshot is None or snapshot.get("signal") != signal:
+            return None
+        return snapshot
+
+    @callback
+    def async_add_listener(
+        self, update_callback: UpdateCallback, snapshot_callback: SnapshotCallback
+    ) -> UpdateCallback:
+        """Register a coordinator view of the payload.
+
+        Args:
+            update_callback: Called after the payload or the prices changed.
+            snapshot_callback: Returns the view's compiled snapshot for storage.
+
+        Returns:
+            Callback removing the view.
+        """
+        self._listeners[update_callback] = snapshot_callback
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.pop(update_callback, None)
+            # Keep the view's snapshot for pending saves and a later reload of the entry
+            if self.raw_data is not None and (snapshot := snapshot_callback(self.digest)) is not None:
+                self._snapshots[_snapshot_key(snapshot["signal"])] = snapshot
+            if not self._listeners:
+                self.hass.async_create_task(self._async_release(), f"cez_hdo release payloads {mask_ean(self.ean)}")
+
+        return remove_listener
+
+    async def _async_release(self) -> None:
+        """Flush the store and forget it, unless a new view registered meanwhile."""
+        await self.async_flush()
+        if self._archive_tasks:
+            await asyncio.wait(self._archive_tasks)
+        stores: dict[str, PayloadStore] = self.hass.data.get(DOMAIN, {}).get(DATA_PAYLOAD_STORES, {})
+        ean_short = ean_suffix(self.ean)
+        if self._listeners or stores.get(ean_short) is not self:
+            return
+        del stores[ean_short]
+        archive.async_release_archive(self.hass, self.ean)
+        _LOGGER.debug("PayloadStore: Released payload store of EAN %s", mask_ean(self.ean))
+
+    @callback
+    def async_set_payload(self, raw_data: dict[str, Any]) -> None:
+        """Replace the payload with freshly downloaded data and persist it."""
+        self._set_payload(raw_data, datetime.now())
+        self._snapshots = {}
+        self.notified = set()
+        self.async_schedule_save()
+        self._async_archive_payload(raw_data)
+        self._async_notify()
+
+    @callback
+    def async_set_prices(self, low_price: float, high_price: float) -> None:
+        """Set tariff prices of the EAN and persist them."""
+        self.low_tariff_price = low_price
+        self.high_tariff_price = high_price
+        self.async_schedule_save()
+        self._async_notify()
+
+    @callback
+    def async_mark_notified(self, notification_type: str) -> bool:
+        """Record that an expiry notification is shown for the current payload.
+
+        Returns:
+            False if it was already shown, also before a restart.
+        """
+        if notification_type in self.notified:
+            return False
+        self.notified.add(notification_type)
+        self.async_schedule_save()
+        return True
+
+    def _set_payload(self, raw_data: dict[str, Any], timestamp: datetime) -> None:
+        """Store a payload and index it once for all signals."""
+        self.raw_data = raw_data
+        self.index = downloader.build_signal_index(raw_data)
+        self.last_update = timestamp
+        self._cache_data = None
+        self._digest = None
+        self.version += 1
+
+    def _encoded_cache(self) -> dict[str, Any]:
+        """Return the storage encoding of the payload, built once per payload."""
+        if self._cache_data is None:
+            self._cache_data = cache.encode_cache(self.raw_data or {}, self.last_update or datetime.now())
+        return self._cache_data
+
+    @callback
+    def _async_notify(self) -> None:
+        """Let every view pick up the changed payload or prices."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def _read_legacy_files(self) -> dict[str, Any] | None:
+        """Read cache and prices files used before storage (blocking)."""
+        stored: dict[str, Any] = {}
+        try:
+            if self._legacy_cache_file.exists():
+                raw_data, timestamp, _version = cache.decode_cache(self._legacy_cache_file.read_bytes())
+                stored["cache"] = cache.encode_cache(raw_data, timestamp or datetime.now())
+            if self._legacy_prices_file.exists():
+                stored["prices"] = cache.loads(self._legacy_prices_file.read_bytes())
+        except Exception as err:
+            _LOGGER.warning("PayloadStore: Failed to read legacy cache files: %s", err)
+        return stored or None
+
+    def _remove_legacy_files(self) -> None:
+        """Remove migrated legacy cache files (blocking)."""
+        for path in (self._legacy_cache_file, self._legacy_prices_file):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as err:
+                _LOGGER.debug("PayloadStore: Could not remove %s: %s", path, err)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data written to storage."""
+        self._save_pending = False
+        cache_data = None
+        snapshots: dict[str, dict[str, Any]] = {}
+        if self.raw_data is not None:
+            cache_data = self._encoded_cache()
+            snapshots.update(self._snapshots)
+            for snapshot_callback in self._listeners.values():
+                if (snapshot := snapshot_callback(self.digest)) is not None:
+                    snapshots[_snapshot_key(snapshot["signal"])] = snapshot
+        return {
+            "cache": cache_data,
+            "snapshots": snapshots,
+            "notified": sorted(self.notified),
+            "prices": {
+                "low_tariff_price": self.low_tariff_price,
+                "high_tariff_price": self.high_tariff_price,
+            },
+        }
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed storage write; bursts of changes of all views share one write."""
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save immediately (e.g. before unload)."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_archive_payload(self, raw_data: dict[str, Any]) -> None:
+        """Append the payload's schedules to the archive in the background."""
+
+        async def _archive() -> None:
+            try:
+                added = await self.hass.async_add_executor_job(self.archive.append, raw_data)
+                _LOGGER.debug("PayloadStore: Archived %d new day schedules", added)
+            except Exception as err:
+                _LOGGER.warning("PayloadStore: Failed to archive schedules: %s", err)
+
+        task = self.hass.async_create_task(_archive())
+        self._archive_tasks.add(task)
+        task.add_done_callback(self._archive_tasks.discard)
+
+
+def get_payload_store(hass: HomeAssistant, ean: str) -> PayloadStore:
+    """Return the shared payload store of an EAN.
+
+    The store is dropped again, after flushing it, when its last view is removed.
+    """
+    stores: dict[str, PayloadStore] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_PAYLOAD_STORES, {})
+    ean_short = ean_suffix(ean)
+    if ean_short not in stores:
+        stores[ean_short] = PayloadStore(hass, ean)
+    return stores[ean_short]
@@ -9,11 +9,12 @@ import voluptuous as vol
 
 from homeassistant.components.sensor import (
     PLATFORM_SCHEMA,
+    SensorDeviceClass,
     SensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
 import homeassistant.helpers.config_validation as cv
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
@@ -21,9 +22,20 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, DATA_COORDINATOR
-from .coordinator import CezHdoCoordinator, CezHdoData
+from .coordinator import CezHdoCoordinator, CezHdoData, async_get_yaml_coordinator
 from . import downloader
-from .const import mask_ean, ean_short, sanitize_signal
+from .const import (
+    CONF_COUNTDOWN_MODE,
+    COUNTDOWN_MODE_DURATION,
+    COUNTDOWN_MODE_TIMESTAMP,
+    COUNTDOWN_MODES,
+    CONF_SCHEDULE_FORMAT,
+    SCHEDULE_FORMAT_COMPACT,
+    SCHEDULE_FORMAT_LIST,
+    SCHEDULE_FORMATS,
+    ean_short,
+    sanitize_signal,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +46,8 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_EAN): cv.string,
         vol.Optional(CONF_SIGNAL): cv.string,
+        vol.Optional(CONF_COUNTDOWN_MODE, default=COUNTDOWN_MODE_DURATION): vol.In(COUNTDOWN_MODES),
+        vol.Optional(CONF_SCHEDULE_FORMAT, default=SCHEDULE_FORMAT_LIST): vol.In(SCHEDULE_FORMATS),
     }
 )
 
@@ -102,6 +116,8 @@ async def async_setup_entry(
     ean = entry_data.get("ean")
     signal = entry_data.get("signal")
     entity_suffix = entry_data.get("entity_suffix")
+    countdown_mode = entry_data.get(CONF_COUNTDOWN_MODE, COUNTDOWN_MODE_DURATION)
+    schedule_format = entry_data.get(CONF_SCHEDULE_FORMAT, SCHEDULE_FORMAT_LIST)
 
     if not coordinator or not ean:
         _LOGGER.error("Coordinator or EAN not found for entry %s", entry.entry_id)
@@ -112,12 +128,12 @@ async def async_setup_entry(
     entities = [
         LowTariffStart(coordinator, ean, entry_id, signal, entity_suffix),
         LowTariffEnd(coordinator, ean, entry_id, signal, entity_suffix),
-        LowTariffDuration(coordinator, ean, entry_id, signal, entity_suffix),
+        LowTariffDuration(coordinator, ean, entry_id, signal, entity_suffix, countdown_mode),
         HighTariffStart(coordinator, ean, entry_id, signal, entity_suffix),
         HighTariffEnd(coordinator, ean, entry_id, signal, entity_suffix),
-        HighTariffDuration(coordinator, ean, entry_id, signal, entity_suffix),
+        HighTariffDuration(coordinator, ean, entry_id, signal, entity_suffix, countdown_mode),
         CurrentPrice(coordinator, ean, entry_id, signal, entity_suffix),
-        HdoSchedule(coordinator, ean, entry_id, signal, entity_suffix),
+        HdoSchedule(coordinator, ean, entry_id, signal, entity_suffix, schedule_format),
         CezHdoRawData(coordinator, ean, entry_id, signal, entity_suffix),
         DataValidUntil(coordinator, ean, entry_id, signal, entity_suffix),
         DataAgeDays(coordinator, ean, entry_id, signal, entity_suffix),
@@ -135,6 +151,8 @@ async def async_setup_platform(
     """Set up the CEZ HDO sensor platform from YAML (async)."""
     ean = config[CONF_EAN]
     signal = config.get(CONF_SIGNAL)
+    countdown_mode = config[CONF_COUNTDOWN_MODE]
+    schedule_format = config[CONF_SCHEDULE_FORMAT]
 
     # Clean up old entities if EAN changed
     from .registry_cleanup import async_cleanup_entity_registry_if_ean_changed
@@ -142,18 +160,18 @@ async def async_setup_platform(
     await async_cleanup_entity_registry_if_ean_changed(hass, ean)
 
     # Create or get coordinator
-    coordinator = await _async_get_coordinator(hass, ean, signal)
+    coordinator = await async_get_yaml_coordinator(hass, ean, signal)
 
     # Create entities
     entities = [
         LowTariffStart(coordinator, ean),
         LowTariffEnd(coordinator, ean),
-        LowTariffDuration(coordinator, ean),
+        LowTariffDuration(coordinator, ean, countdown_mode=countdown_mode),
         HighTariffStart(coordinator, ean),
         HighTariffEnd(coordinator, ean),
-        HighTariffDuration(coordinator, ean),
+        HighTariffDuration(coordinator, ean, countdown_mode=countdown_mode),
         CurrentPrice(coordinator, ean),
-        HdoSchedule(coordinator, ean),
+        HdoSchedule(coordinator, ean, schedule_format=schedule_format),
         CezHdoRawData(coordinator, ean),
     ]
     async_add_entities(entities, False)
@@ -169,32 +187,12 @@ def setup_platform(
     _LOGGER.warning("Synchronous setup_platform is deprecated. Use async_setup_platform instead.")
 
 
-async def _async_get_coordinator(hass: HomeAssistant, ean: str, signal: str | None) -> CezHdoCoordinator:
-    """Get or create coordinator instance."""
-    # Check if coordinator already exists
-    if DOMAIN in hass.data and DATA_COORDINATOR in hass.data[DOMAIN]:
-        coordinator = hass.data[DOMAIN][DATA_COORDINATOR]
-        _LOGGER.debug("Using existing coordinator")
-        return coordinator
-
-    # Create new coordinator
-    coordinator = CezHdoCoordinator(hass, ean, signal)
-
-    # Initialize - this loads cache and triggers first refresh
-    # Use async_initialize() for YAML platforms (not async_config_entry_first_refresh)
-    await coordinator.async_initialize()
-
-    # Store in hass.data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][DATA_COORDINATOR] = coordinator
-
-    _LOGGER.debug("Created new coordinator for EAN: %s", mask_ean(ean))
-    return coordinator
-
-
 class CezHdoSensor(CoordinatorEntity[CezHdoCoordinator], SensorEntity):
     """Base class for CEZ HDO sensors using CoordinatorEntity."""
 
+    # Coordinator data fields this entity depends on; empty means any change
+    _watched_fields: frozenset[str] = frozenset()
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -263,15 +261,63 @@ class CezHdoSensor(CoordinatorEntity[CezHdoCoordinator], SensorEntity):
         """Return the icon of the sensor."""
         return "mdi:home-clock"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a watched field changed in the coordinator update."""
+        changed = self.coordinator.changed_fields
+        if self._watched_fields and "last_update_success" not in changed and self._watched_fields.isdisjoint(changed):
+            return
+        super()._handle_coordinator_update()
+
     @property
     def data(self) -> CezHdoData:
         """Get coordinator data."""
         return self.coordinator.data
 
 
+class CezHdoCountdownSensor(CezHdoSensor):
+    """Base class for remaining-time sensors.
+
+    In the default duration mode the state is an ``HH:MM`` string that needs
+    minute-aligned updates. In timestamp mode the state is the end of the
+    current window and the remaining time is computed by the frontend, so the
+    state only changes at tariff switches.
+    """
+
+    # Coordinator field with the remaining time, shown in duration mode
+    _duration_field: str
+    # Coordinator field with the end of the window, watched in timestamp mode
+    _ends_at_field: str
+
+    def __init__(
+        self,
+        coordinator: CezHdoCoordinator,
+        ean: str,
+        name: str,
+        entry_id: str | None = None,
+        signal: str | None = None,
+        entity_suffix: str | None = None,
+        countdown_mode: str = COUNTDOWN_MODE_DURATION,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, ean, name, entry_id, signal, entity_suffix)
+        self._timestamp_mode = countdown_mode == COUNTDOWN_MODE_TIMESTAMP
+        if self._timestamp_mode:
+            self._attr_device_class = SensorDeviceClass.TIMESTAMP
+            self._watched_fields = frozenset({self._ends_at_field})
+
+    async def async_added_to_hass(self) -> None:
+        """Request minute updates from the coordinator while the entity exists."""
+        await super().async_added_to_hass()
+        if not self._timestamp_mode:
+            self.async_on_remove(self.coordinator.async_add_countdown_listener(self._duration_field))
+
+
 class LowTariffStart(CezHdoSensor):
     """Sensor for low tariff start time."""
 
+    _watched_fields = frozenset({"low_tariff_start"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -293,6 +339,8 @@ class LowTariffStart(CezHdoSensor):
 class LowTariffEnd(CezHdoSensor):
     """Sensor for low tariff end time."""
 
+    _watched_fields = frozenset({"low_tariff_end"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -315,9 +363,13 @@ class LowTariffEnd(CezHdoSensor):
         return None
 
 
-class LowTariffDuration(CezHdoSensor):
+class LowTariffDuration(CezHdoCountdownSensor):
     """Sensor for low tariff duration."""
 
+    _watched_fields = frozenset({"low_tariff_duration"})
+    _duration_field = "low_tariff_duration"
+    _ends_at_field = "low_tariff_ends_at"
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -325,16 +377,19 @@ class LowTariffDuration(CezHdoSensor):
         entry_id: str | None = None,
         signal: str | None = None,
         entity_suffix: str | None = None,
+        countdown_mode: str = COUNTDOWN_MODE_DURATION,
     ) -> None:
-        super().__init__(coordinator, ean, "LowTariffDuration", entry_id, signal, entity_suffix)
+        super().__init__(coordinator, ean, "LowTariffDuration", entry_id, signal, entity_suffix, countdown_mode)
 
     @property
     def icon(self) -> str:
         return "mdi:timer"
 
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> datetime | str | None:
         """Return the state of the sensor."""
+        if self._timestamp_mode:
+            return self.data.low_tariff_ends_at
         if self.data.low_tariff_duration and self.data.low_tariff_duration.total_seconds() > 0:
             return downloader.format_duration(self.data.low_tariff_duration)
         # Return "00:00" when low tariff is not active
@@ -344,6 +399,8 @@ class LowTariffDuration(CezHdoSensor):
 class HighTariffStart(CezHdoSensor):
     """Sensor for high tariff start time."""
 
+    _watched_fields = frozenset({"high_tariff_start"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -365,6 +422,8 @@ class HighTariffStart(CezHdoSensor):
 class HighTariffEnd(CezHdoSensor):
     """Sensor for high tariff end time."""
 
+    _watched_fields = frozenset({"high_tariff_end"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -387,9 +446,13 @@ class HighTariffEnd(CezHdoSensor):
         return None
 
 
-class HighTariffDuration(CezHdoSensor):
+class HighTariffDuration(CezHdoCountdownSensor):
     """Sensor for high tariff duration."""
 
+    _watched_fields = frozenset({"high_tariff_duration"})
+    _duration_field = "high_tariff_duration"
+    _ends_at_field = "high_tariff_ends_at"
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -397,16 +460,19 @@ class HighTariffDuration(CezHdoSensor):
         entry_id: str | None = None,
         signal: str | None = None,
         entity_suffix: str | None = None,
+        countdown_mode: str = COUNTDOWN_MODE_DURATION,
     ) -> None:
-        super().__init__(coordinator, ean, "HighTariffDuration", entry_id, signal, entity_suffix)
+        super().__init__(coordinator, ean, "HighTariffDuration", entry_id, signal, entity_suffix, countdown_mode)
 
     @property
     def icon(self) -> str:
         return "mdi:timer"
 
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> datetime | str | None:
         """Return the state of the sensor."""
+        if self._timestamp_mode:
+            return self.data.high_tariff_ends_at
         if self.data.high_tariff_duration and self.data.high_tariff_duration.total_seconds() > 0:
             return downloader.format_duration(self.data.high_tariff_duration)
         # Return "00:00" when high tariff is not active
@@ -416,6 +482,8 @@ class HighTariffDuration(CezHdoSensor):
 class CurrentPrice(CezHdoSensor):
     """Sensor for current electricity price based on active tariff."""
 
+    _watched_fields = frozenset({"low_tariff_active", "low_tariff_price", "high_tariff_price"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -456,6 +524,10 @@ class CurrentPrice(CezHdoSensor):
 class CezHdoRawData(CezHdoSensor):
     """Sensor for raw HDO JSON data and timestamp."""
 
+    _watched_fields = frozenset({"raw_data", "last_update"})
+    # The payload is large - keep it out of the recorder (see the get_schedule service)
+    _unrecorded_attributes = frozenset({"raw_json"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -485,6 +557,10 @@ class CezHdoRawData(CezHdoSensor):
 class HdoSchedule(CezHdoSensor):
     """Sensor providing HDO schedule data for graphs (ApexCharts compatible)."""
 
+    _watched_fields = frozenset({"schedule", "today", "last_update", "low_tariff_price", "high_tariff_price"})
+    # Seven days of intervals - keep them out of the recorder (see the get_schedule service)
+    _unrecorded_attributes = frozenset({"schedule", "schedule_compact"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -492,8 +568,10 @@ class HdoSchedule(CezHdoSensor):
         entry_id: str | None = None,
         signal: str | None = None,
         entity_suffix: str | None = None,
+        schedule_format: str = SCHEDULE_FORMAT_LIST,
     ) -> None:
         super().__init__(coordinator, ean, "HdoSchedule", entry_id, signal, entity_suffix)
+        self._compact = schedule_format == SCHEDULE_FORMAT_COMPACT
 
     @property
     def icon(self) -> str:
@@ -508,9 +586,18 @@ class HdoSchedule(CezHdoSensor):
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Return schedule data suitable for ApexCharts timeline graph."""
+        """Return schedule data suitable for ApexCharts timeline graph.
+
+        In compact format the interval list is replaced by ``schedule_compact``:
+        ``{"version": 1, "start": "YYYY-MM-DD", "timezone": ..., "days": [[NT, VT, NT, ...], ...]}``
+        with run lengths in minutes, each day starting with NT at 00:00.
+        """
+        if self._compact:
+            schedule = {"schedule_compact": self.coordinator.compact_schedule()}
+        else:
+            schedule = {"schedule": self.data.schedule}
         return {
-            "schedule": self.data.schedule,
+            **schedule,
             "days": 7,
             "signal": self.coordinator.signal,
             "last_update": self.data.last_update.isoformat() if self.data.last_update else None,
@@ -522,6 +609,8 @@ class HdoSchedule(CezHdoSensor):
 class DataValidUntil(CezHdoSensor):
     """Sensor showing datetime when cached data expires."""
 
+    _watched_fields = frozenset({"data_valid_until"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -556,6 +645,8 @@ class DataValidUntil(CezHdoSensor):
 class DataAgeDays(CezHdoSensor):
     """Sensor showing how many days old the cached data is."""
 
+    _watched_fields = frozenset({"data_age_days"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -583,6 +674,8 @@ class DataAgeDays(CezHdoSensor):
 class DaysUntilExpiry(CezHdoSensor):
     """Sensor showing days until cached data expires."""
 
+    _watched_fields = frozenset({"days_until_expiry"})
+
     def __init__(
         self,
         coordinator: CezHdoCoordinator,
@@ -0,0 +1,124 @@
+"""Long-term statistics of the ČEZ HDO schedule."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMeanType, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import slugify
+
+from . import downloader
+from .const import DOMAIN, ean_suffix
+
+_LOGGER = logging.getLogger(__name__)
+
+PRICE_UNIT = "Kč/kWh"
+
+# Statistics rows are hourly, aligned to whole UTC hours
+HOUR_SECONDS = 3600
+
+
+def statistic_id(kind: str, ean: str, signal: str | None) -> str:
+    """Return external statistic ID, e.g. ``cez_hdo:nt_share_967606_ptv2``."""
+    object_id = slugify(f"{kind}_{ean_suffix(ean)}_{signal or 'default'}")
+    return f"{DOMAIN}:{object_id}"
+
+
+def hourly_statistics(
+    timeline: downloader.TariffTimeline, low_price: float, high_price: float, now: datetime | None = None
+) -> tuple[list[StatisticData], list[StatisticData]]:
+    """Compute hourly NT share (%) and mean price rows for the whole payload.
+
+    Hours are aligned in UTC as required by the recorder and their NT time is
+    looked up on the epoch timeline, so DST days have 23 or 25 correct hours.
+    Price rows start at the current hour: past hours were billed with the
+    prices valid then, which must not be overwritten by today's prices.
+
+    Returns:
+        Tuple of (NT share rows, price rows).
+    """
+    share_rows: list[StatisticData] = []
+    price_rows: list[StatisticData] = []
+    horizon = timeline.horizon()
+    if horizon is None:
+        return share_rows, price_rows
+
+    horizon_start, horizon_end = horizon
+    hour_ts = -(-horizon_start // HOUR_SECONDS) * HOUR_SECONDS
+    now_ts = (now or datetime.now(tz=timezone.utc)).timestamp()
+    current_hour_ts = now_ts // HOUR_SECONDS * HOUR_SECONDS
+
+    while hour_ts + HOUR_SECONDS <= horizon_end:
+        nt_seconds = timeline.low_seconds(hour_ts, hour_ts + HOUR_SECONDS)
+        share = nt_seconds / HOUR_SECONDS
+        hour = datetime.fromtimestamp(hour_ts, tz=timezone.utc)
+        share_rows.append(
+            StatisticData(
+                start=hour,
+                mean=round(share * 100, 2),
+                min=0.0 if nt_seconds < HOUR_SECONDS else 100.0,
+                max=100.0 if nt_seconds else 0.0,
+            )
+        )
+        if hour_ts >= current_hour_ts:
+            price_rows.append(
+                StatisticData(
+                    start=hour,
+                    mean=round(share * low_price + (1 - share) * high_price, 4),
+                    min=low_price if nt_seconds else high_price,
+                    max=high_price if nt_seconds < HOUR_SECONDS else low_price,
+                )
+            )
+        hour_ts += HOUR_SECONDS
+    return share_rows, price_rows
+
+
+@callback
+def async_import_statistics(
+    hass: HomeAssistant,
+    ean: str,
+    signal: str | None,
+    timeline: downloader.TariffTimeline,
+    low_price: float,
+    high_price: float,
+) -> None:
+    """Write hourly NT share and price statistics of the payload in bulk."""
+    if "recorder" not in hass.config.components:
+        return
+
+    share_rows, price_rows = hourly_statistics(timeline, low_price, high_price)
+    if not share_rows:
+        return
+
+    name_suffix = f"({ean_suffix(ean)}{f', {signal}' if signal else ''})"
+    async_add_external_statistics(
+        hass,
+        StatisticMetaData(
+            mean_type=StatisticMeanType.ARITHMETIC,
+            has_sum=False,
+            name=f"CEZ HDO low tariff share {name_suffix}",
+            source=DOMAIN,
+            statistic_id=statistic_id("nt_share", ean, signal),
+            unit_class=None,
+            unit_of_measurement="%",
+        ),
+        share_rows,
+    )
+    if (low_price or high_price) and price_rows:
+        async_add_external_statistics(
+            hass,
+            StatisticMetaData(
+                mean_type=StatisticMeanType.ARITHMETIC,
+                has_sum=False,
+                name=f"CEZ HDO price {name_suffix}",
+                source=DOMAIN,
+                statistic_id=statistic_id("price", ean, signal),
+                unit_class=None,
+                unit_of_measurement=PRICE_UNIT,
+            ),
+            price_rows,
+        )
+    _LOGGER.debug("CEZ HDO: Imported %d hourly statistics rows for %s", len(share_rows), name_suffix)
@@ -0,0 +1,156 @@
+"""Domain-wide timer wheel batching the deadlines of all ČEZ HDO coordinators."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+from collections.abc import Callable, Hashable
+from datetime import datetime, timezone
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key for hass.data[DOMAIN] - the shared timer wheel
+DATA_TIMER_WHEEL = "timer_wheel"
+
+# Width of one wheel slot; deadlines are rounded up to it, never fired early
+SLOT_SECONDS = 1
+
+TimerAction = Callable[[datetime], None]
+
+
+class TimerWheel:
+    """Hashed timer wheel for tariff boundaries, countdown ticks and expiry checks.
+
+    Deadlines are hashed into one-second slots and every slot keeps the timers
+    of all coordinators due in it. Only the earliest non-empty slot has an
+    event-loop timer armed, and all its timers run in one batch, so the
+    coordinators switching tariff at the same minute wake the loop once.
+
+    Timers are keyed by (owner, name): scheduling a name again replaces its
+    previous deadline, and async_cancel_owner() drops all timers of an
+    unloaded instance.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty wheel."""
+        self.hass = hass
+        self._slots: dict[int, dict[tuple[Hashable, str], TimerAction]] = {}
+        self._timer_slots: dict[tuple[Hashable, str], int] = {}
+        # Min-heap of slot numbers; may hold stale entries of emptied slots
+        self._slot_heap: list[int] = []
+        self._armed_slot: int | None = None
+        self._unsub: Callable[[], None] | None = None
+        self._firing: bool = False
+
+    def __len__(self) -> int:
+        """Return the number of pending timers."""
+        return len(self._timer_slots)
+
+    @callback
+    def async_schedule(self, owner: Hashable, name: str, when: datetime, action: TimerAction) -> None:
+        """Run action(now) at the aware datetime, replacing the owner's timer of the same name."""
+        key = (owner, name)
+        self._remove(key)
+        slot = math.ceil(when.timestamp() / SLOT_SECONDS)
+        timers = self._slots.get(slot)
+        if timers is None:
+            timers = self._slots[slot] = {}
+            heapq.heappush(self._slot_heap, slot)
+        timers[key] = action
+        self._timer_slots[key] = slot
+        # While a batch runs, the next slot is armed after it
+        if not self._firing and (self._armed_slot is None or slot < self._armed_slot):
+            self._arm(slot)
+
+    def is_scheduled(self, owner: Hashable, name: str) -> bool:
+        """Return True if the owner has a pending timer of the name."""
+        return (owner, name) in self._timer_slots
+
+    @callback
+    def async_cancel(self, owner: Hashable, name: str) -> None:
+        """Cancel one timer of the owner (no-op if not scheduled)."""
+        self._remove((owner, name))
+        self._disarm_if_idle()
+
+    @callback
+    def async_cancel_owner(self, owner: Hashable) -> None:
+        """Cancel all timers of the owner, e.g. when its config entry unloads."""
+        for key in [key for key in self._timer_slots if key[0] == owner]:
+            self._remove(key)
+        self._disarm_if_idle()
+
+    def _remove(self, key: tuple[Hashable, str]) -> None:
+        slot = self._timer_slots.pop(key, None)
+        if slot is None:
+            return
+        timers = self._slots[slot]
+        del timers[key]
+        if not timers:
+            # The heap entry is skipped lazily when it comes up
+            del self._slots[slot]
+
+    def _arm(self, slot: int) -> None:
+        """Arm the event-loop timer for the slot."""
+        if self._unsub is not None:
+            self._unsub()
+        self._armed_slot = slot
+        self._unsub = async_track_point_in_utc_time(
+            self.hass, self._async_fire, datetime.fromtimestamp(slot * SLOT_SECONDS, tz=timezone.utc)
+        )
+
+    def _arm_next(self) -> None:
+        """Arm the earliest non-empty slot, if any."""
+        self._armed_slot = None
+        while self._slot_heap:
+            slot = self._slot_heap[0]
+            if slot in self._slots:
+                self._arm(slot)
+                return
+            heapq.heappop(self._slot_heap)
+
+    def _disarm_if_idle(self) -> None:
+        if not self._timer_slots and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+            self._armed_slot = None
+            self._slot_heap.clear()
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Run every timer of all slots that are due, in one batch."""
+        self._unsub = None
+        due_slot = max(self._armed_slot or 0, math.floor(now.timestamp() / SLOT_SECONDS))
+        batch: list[tuple[tuple[Hashable, str], TimerAction]] = []
+        while self._slot_heap and self._slot_heap[0] <= due_slot:
+            slot = heapq.heappop(self._slot_heap)
+            for key, action in self._slots.pop(slot, {}).items():
+                del self._timer_slots[key]
+                batch.append((key, action))
+
+        # Actions may schedule their next deadline; arm after the batch
+        self._firing = True
+        try:
+            for key, action in batch:
+                try:
+                    action(now)
+                except Exception:
+                    _LOGGER.exception("TimerWheel: Timer %s of %s failed", key[1], key[0])
+        finally:
+            self._firing = False
+        self._arm_next()
+        _LOGGER.debug("TimerWheel: Fired %d timers, %d pending", len(batch), len(self._timer_slots))
+
+
+def get_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Return the timer wheel shared by all coordinators."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    wheel: TimerWheel | None = domain_data.get(DATA_TIMER_WHEEL)
+    if wheel is None:
+        wheel = domain_data[DATA_TIMER_WHEEL] = TimerWheel(hass)
+    return wheel
@@ -0,0 +1,76 @@
+"""HTTP API of the ČEZ HDO integration."""
+
+from __future__ import annotations
+
+import logging
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.http import KEY_HASS
+
+from .const import SCHEDULE_FORMAT_COMPACT, SCHEDULE_FORMAT_LIST, SCHEDULE_FORMATS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return True if an If-None-Match header matches the (strong) entity tag."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class CezHdoScheduleView(HomeAssistantView):
+    """Serve the graph schedule as JSON with ETag revalidation.
+
+    ``GET /api/cez_hdo/schedule?entity_id=...`` (or ``?ean=...&signal=...``),
+    optionally with ``format=compact`` for the run-length encoding.
+    Dashboards polling the endpoint get ``304 Not Modified`` until the
+    payload, the first day or the prices change.
+    """
+
+    url = "/api/cez_hdo/schedule"
+    name = "api:cez_hdo:schedule"
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the schedule of one instance."""
+        from . import coordinator_for_entity, find_coordinator
+
+        hass = request.app[KEY_HASS]
+        query = request.query
+        schedule_format = query.get("format", SCHEDULE_FORMAT_LIST)
+        if schedule_format not in SCHEDULE_FORMATS:
+            return self.json_message(f"Unknown format {schedule_format}", HTTPStatus.BAD_REQUEST)
+
+        try:
+            if "entity_id" in query:
+                coordinator = coordinator_for_entity(hass, query["entity_id"])
+            else:
+                coordinator = find_coordinator(hass, query.get("ean"), query.get("signal"))
+        except ServiceValidationError as err:
+            return self.json_message(str(err), HTTPStatus.NOT_FOUND)
+
+        etag = f'"{coordinator.schedule_etag}-{schedule_format}"'
+        # Revalidate on every load; unchanged schedules cost only the headers
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if _etag_matches(request.headers.get("If-None-Match", ""), etag):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        data = coordinator.data
+        body: dict[str, Any] = {
+            "signal": coordinator.signal,
+            "last_update": data.last_update.isoformat() if data.last_update else None,
+            "low_tariff_price": data.low_tariff_price,
+            "high_tariff_price": data.high_tariff_price,
+        }
+        if schedule_format == SCHEDULE_FORMAT_COMPACT:
+            body["schedule_compact"] = coordinator.compact_schedule()
+        else:
+            body["schedule"] = data.schedule
+        return self.json(body, headers=headers)
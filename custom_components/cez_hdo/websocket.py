@@ -0,0 +1,92 @@
+"""Websocket API of the ČEZ HDO integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+_LOGGER = logging.getLogger(__name__)
+
+# Coordinator fields whose change may alter the pushed schedule
+SCHEDULE_FIELDS = frozenset({"schedule", "today", "low_tariff_price", "high_tariff_price"})
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands of the integration."""
+    websocket_api.async_register_command(hass, ws_subscribe_schedule)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "cez_hdo/subscribe_schedule",
+        vol.Exclusive("entity_id", "target"): cv.entity_id,
+        vol.Exclusive("ean", "target"): cv.string,
+        vol.Optional("signal"): cv.string,
+    }
+)
+@callback
+def ws_subscribe_schedule(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the graph schedule of one instance.
+
+    The first event carries all days (``"full": true``), later events only the
+    days whose encoding changed and the days that rolled out of the window.
+    Days are encoded by downloader.encode_schedule_day().
+    """
+    from . import coordinator_for_entity, find_coordinator
+
+    try:
+        if "entity_id" in msg:
+            coordinator = coordinator_for_entity(hass, msg["entity_id"])
+        else:
+            coordinator = find_coordinator(hass, msg.get("ean"), msg.get("signal"))
+    except ServiceValidationError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(err))
+        return
+
+    sent_days: dict[str, dict[str, Any]] = {}
+    sent_prices: tuple[float, float] | None = None
+
+    @callback
+    def _async_send_changes() -> None:
+        nonlocal sent_prices
+        days = coordinator.encoded_schedule()
+        prices = (coordinator.data.low_tariff_price, coordinator.data.high_tariff_price)
+        changed = {day: encoded for day, encoded in days.items() if sent_days.get(day) != encoded}
+        removed = [day for day in sent_days if day not in days]
+        if sent_prices is not None and not changed and not removed and prices == sent_prices:
+            return
+
+        event: dict[str, Any] = {
+            "days": changed,
+            "removed": removed,
+            "low_tariff_price": prices[0],
+            "high_tariff_price": prices[1],
+        }
+        if sent_prices is None:
+            event["full"] = True
+            event["signal"] = coordinator.signal
+        sent_days.clear()
+        sent_days.update(days)
+        sent_prices = prices
+        connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    @callback
+    def _async_coordinator_updated() -> None:
+        if not SCHEDULE_FIELDS.isdisjoint(coordinator.changed_fields):
+            _async_send_changes()
+
+    connection.subscriptions[msg["id"]] = coordinator.async_add_listener(_async_coordinator_updated)
+    connection.send_result(msg["id"])
+    _async_send_changes()
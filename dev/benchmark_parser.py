@@ -0,0 +1,119 @@
+"""Benchmark of the CEZ HDO payload parser.
+
+Compares the strptime-based parsing with the fast-path tokenizer and the
+memoized parser on a realistic payload (8 days, 3 signals per day).
+
+Usage:
+    python dev/benchmark_parser.py
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import timeit
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+DOWNLOADER_PATH = Path(__file__).resolve().parent.parent / "custom_components" / "cez_hdo" / "downloader.py"
+
+# Load downloader.py directly so the Home Assistant package __init__ is not imported.
+_spec = importlib.util.spec_from_file_location("cez_hdo_downloader", DOWNLOADER_PATH)
+assert _spec is not None and _spec.loader is not None
+downloader = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(downloader)
+
+SIGNAL_CASY = {
+    "PTV2": "00:00-06:00; 13:00-15:00; 20:00-24:00",
+    "PTV3": "00:00-07:15; 8:15-9:15; 17:00-24:00",
+    "A1B4DP06": "01:00-05:00; 17:30-19:45",
+}
+
+
+def build_payload(days: int = 8) -> dict:
+    """Build a payload shaped like the CEZ API response."""
+    start = date.today() - timedelta(days=1)
+    signals = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        for name, casy in SIGNAL_CASY.items():
+            signals.append(
+                {
+                    "signal": name,
+                    "den": day.strftime("%A"),
+                    "datum": f"{day.day}.{day.month}.{day.year}",
+                    "casy": casy,
+                }
+            )
+    return {"data": {"signals": signals, "amm": False, "switchClock": False}}
+
+
+def baseline_normalize_datum(datum_str: str) -> str:
+    """Reference implementation using split/strip and strptime."""
+    s = str(datum_str).strip()
+    parts = [p.strip() for p in s.split(".")]
+    if len(parts) == 3 and all(p.isdigit() for p in parts):
+        day, month, year = parts
+        return f"{int(day):02d}.{int(month):02d}.{int(year):04d}"
+    return datetime.strptime(s, "%Y-%m-%d").strftime("%d.%m.%Y")
+
+
+def baseline_parse_time(time_str: str) -> time:
+    """Reference implementation using strptime."""
+    if time_str.strip() == "24:00":
+        return datetime.strptime("00:00", "%H:%M").time()
+    return datetime.strptime(time_str, "%H:%M").time()
+
+
+def baseline_parse_time_periods(casy_string: str) -> list[tuple[time, time]]:
+    """Reference implementation of the casy tokenizer."""
+    periods = []
+    for time_range in [p.strip() for p in casy_string.split(";") if p.strip()]:
+        start_str, end_str = time_range.split("-", 1)
+        periods.append((baseline_parse_time(start_str.strip()), baseline_parse_time(end_str.strip())))
+    return periods
+
+
+def baseline_parse(payload: dict) -> list:
+    """Parse every signal entry the way the old per-lookup scan did."""
+    return [
+        (baseline_normalize_datum(s["datum"]), baseline_parse_time_periods(s["casy"]))
+        for s in payload["data"]["signals"]
+    ]
+
+
+def fast_parse_cold(payload: dict) -> list:
+    """Parse every signal entry with the fast path and empty caches."""
+    downloader.clear_parse_caches()
+    return [
+        (downloader.normalize_datum(s["datum"]), downloader.parse_time_periods(s["casy"]))
+        for s in payload["data"]["signals"]
+    ]
+
+
+def fast_parse_warm(payload: dict) -> list:
+    """Parse every signal entry with the fast path and warm caches."""
+    return [
+        (downloader.normalize_datum(s["datum"]), downloader.parse_time_periods(s["casy"]))
+        for s in payload["data"]["signals"]
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print per-payload timings."""
+    payload = build_payload()
+    assert baseline_parse(payload) == fast_parse_cold(payload) == fast_parse_warm(payload)
+
+    number = 2000
+    print(f"Payload: {len(payload['data']['signals'])} signal entries, {number} iterations")
+    for label, func in (
+        ("strptime baseline", baseline_parse),
+        ("fast path (cold cache)", fast_parse_cold),
+        ("fast path (warm cache)", fast_parse_warm),
+        ("SignalIndex build", downloader.build_signal_index),
+    ):
+        seconds = min(timeit.repeat(lambda f=func: f(payload), number=number, repeat=3))
+        print(f"{label:<24} {seconds / number * 1e6:10.1f} µs/payload")
+
+
+if __name__ == "__main__":
+    main()
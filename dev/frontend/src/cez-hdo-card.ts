@@ -24,6 +24,12 @@ interface HomeAssistant {
   locale?: {
     language: string;
   };
+  connection?: {
+    subscribeMessage: <T>(
+      callback: (message: T) => void,
+      subscribeMessage: Record<string, unknown>,
+    ) => Promise<() => Promise<void>>;
+  };
 }
 
 interface EntityConfig {
@@ -59,6 +65,20 @@ interface ScheduleItem {
   tariff: string;
 }
 
+// Day of the cez_hdo/subscribe_schedule websocket API (minutes since the Unix epoch)
+interface EncodedDay {
+  start: number;
+  end: number;
+  low: boolean;
+  switches: number[];
+}
+
+interface ScheduleEvent {
+  full?: boolean;
+  days: Record<string, EncodedDay>;
+  removed: string[];
+}
+
 // Entity prefixes for dynamic discovery (new format: cez_hdo_{type}_{ean4}_{signal})
 const ENTITY_PREFIXES: Record<keyof EntityConfig, { domain: string; prefix: string }> = {
   low_tariff: { domain: 'binary_sensor', prefix: 'cez_hdo_lowtariffactive_' },
@@ -91,6 +111,10 @@ const DEFAULT_ENTITIES: Required<EntityConfig> = {
 export class CezHdoCard extends LitElement {
   @property({ attribute: false }) hass!: HomeAssistant;
   @state() private config!: CardConfig;
+  private _minuteTimer?: number;
+  @state() private _wsDays?: Record<string, EncodedDay>;
+  private _scheduleUnsub?: Promise<() => Promise<void>>;
+  private _subscribedEntity?: string;
 
   static getConfigElement(): HTMLElement {
     return document.createElement('cez-hdo-card-editor');
@@ -107,6 +131,77 @@ export class CezHdoCard extends LitElement {
     };
   }
 
+  connectedCallback(): void {
+    super.connectedCallback();
+    // Remaining time of timestamp-mode sensors is computed here, refresh it every minute
+    this._minuteTimer = window.setInterval(() => this.requestUpdate(), 60000);
+  }
+
+  disconnectedCallback(): void {
+    if (this._minuteTimer !== undefined) {
+      window.clearInterval(this._minuteTimer);
+      this._minuteTimer = undefined;
+    }
+    this._unsubscribeSchedule();
+    super.disconnectedCallback();
+  }
+
+  updated(): void {
+    const entityId = this.config?.show_schedule ? this.resolveEntity('schedule') : undefined;
+    if (entityId !== this._subscribedEntity) {
+      this._unsubscribeSchedule();
+      if (entityId) this._subscribeSchedule(entityId);
+    }
+  }
+
+  /**
+   * Subscribe to schedule deltas - the full schedule is sent once, then only changed days
+   */
+  private _subscribeSchedule(entityId: string): void {
+    this._subscribedEntity = entityId;
+    if (!this.hass?.connection) return;
+    this._scheduleUnsub = this.hass.connection.subscribeMessage<ScheduleEvent>(
+      (event) => {
+        const days = event.full ? {} : { ...this._wsDays };
+        event.removed.forEach((day) => delete days[day]);
+        this._wsDays = { ...days, ...event.days };
+      },
+      { type: 'cez_hdo/subscribe_schedule', entity_id: entityId },
+    );
+    // Older integration versions lack the command - keep using the sensor attribute
+    this._scheduleUnsub.catch(() => {
+      this._scheduleUnsub = undefined;
+    });
+  }
+
+  private _unsubscribeSchedule(): void {
+    this._scheduleUnsub?.then((unsub) => unsub()).catch(() => undefined);
+    this._scheduleUnsub = undefined;
+    this._subscribedEntity = undefined;
+    if (this._wsDays) this._wsDays = undefined;
+  }
+
+  /**
+   * Expand websocket schedule days into the same items as the sensor attribute
+   */
+  private _decodeSchedule(days: Record<string, EncodedDay>): ScheduleItem[] {
+    const items: ScheduleItem[] = [];
+    Object.keys(days).sort().forEach((key) => {
+      const day = days[key];
+      const bounds = [day.start, ...day.switches, day.end];
+      let low = day.low;
+      for (let i = 0; i < bounds.length - 1; i++) {
+        items.push({
+          start: new Date(bounds[i] * 60000).toISOString(),
+          end: new Date(bounds[i + 1] * 60000).toISOString(),
+          tariff: low ? 'NT' : 'VT',
+        });
+        low = !low;
+      }
+    });
+    return items;
+  }
+
   setConfig(config: CardConfig): void {
     if (!config.entities) {
       config = {
@@ -165,6 +260,20 @@ export class CezHdoCard extends LitElement {
     return entity ? entity.state : 'unavailable';
   }
 
+  /**
+   * Get remaining time as HH:MM - timestamp-mode sensors hold the end of the window
+   */
+  private getRemainingTime(entityId: string | undefined): string {
+    const entity = entityId && this.hass ? this.hass.states[entityId] : undefined;
+    if (!entity || entity.attributes.device_class !== 'timestamp') {
+      return this.getEntityState(entityId);
+    }
+    const end = Date.parse(entity.state);
+    if (Number.isNaN(end)) return '00:00';
+    const minutes = Math.max(0, Math.floor((end - Date.now()) / 60000));
+    return `${String(Math.floor(minutes / 60)).padStart(2, '0')}:${String(minutes % 60).padStart(2, '0')}`;
+  }
+
   private isEntityOn(entityId: string | undefined): boolean {
     return this.getEntityState(entityId) === 'on';
   }
@@ -213,10 +322,10 @@ export class CezHdoCard extends LitElement {
     const highTariffActive = this.isEntityOn(resolvedEntities.high_tariff);
     const lowStart = this.getEntityState(resolvedEntities.low_start);
     const lowEnd = this.getEntityState(resolvedEntities.low_end);
-    const lowDuration = this.getEntityState(resolvedEntities.low_duration);
+    const lowDuration = this.getRemainingTime(resolvedEntities.low_duration);
     const highStart = this.getEntityState(resolvedEntities.high_start);
     const highEnd = this.getEntityState(resolvedEntities.high_end);
-    const highDuration = this.getEntityState(resolvedEntities.high_duration);
+    const highDuration = this.getRemainingTime(resolvedEntities.high_duration);
 
     const title = this.config.title || 'ČEZ HDO';
     const showTimes = this.config.show_times !== false;
@@ -307,11 +416,13 @@ export class CezHdoCard extends LitElement {
     const scheduleEntity = this.resolveEntity('schedule');
     const scheduleState = scheduleEntity ? this.hass.states[scheduleEntity] : undefined;
 
-    if (!scheduleState || !scheduleState.attributes.schedule) {
+    if (!this._wsDays && (!scheduleState || !scheduleState.attributes.schedule)) {
       return html`<div class="schedule-error">${t.scheduleNotAvailable}</div>`;
     }
 
-    const schedule = scheduleState.attributes.schedule as ScheduleItem[];
+    const schedule = this._wsDays
+      ? this._decodeSchedule(this._wsDays)
+      : (scheduleState!.attributes.schedule as ScheduleItem[]);
     const days: Record<string, { label: string; items: ScheduleItem[] }> = {};
 
     // Get locale for date formatting
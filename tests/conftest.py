@@ -0,0 +1,45 @@
+"""Shared stubs and payload builders for the ČEZ HDO tests."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+class StubConfig:
+    """Stand-in for hass.config resolving paths under a directory."""
+
+    def __init__(self, config_dir: Path) -> None:
+        self.config_dir = config_dir
+
+    def path(self, *parts: str) -> str:
+        return str(self.config_dir.joinpath(*parts))
+
+
+class StubHass:
+    """Bare stand-in for HomeAssistant with the data dict and config paths."""
+
+    def __init__(self, config_dir: Path) -> None:
+        self.data: dict[str, Any] = {}
+        self.config = StubConfig(config_dir)
+
+
+def signals_payload(*schedules: tuple[date, str, str]) -> dict[str, Any]:
+    """Build a portal response from (day, signal, casy) schedules."""
+    return {
+        "data": {
+            "signals": [
+                {"signal": signal, "datum": day.strftime("%d.%m.%Y"), "casy": casy}
+                for day, signal, casy in schedules
+            ]
+        }
+    }
+
+
+@pytest.fixture
+def hass(tmp_path: Path) -> StubHass:
+    """Return a stub hass keeping its config directory in tmp_path."""
+    return StubHass(tmp_path)
@@ -0,0 +1,108 @@
+"""Tests for the append-only schedule archive."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+from custom_components.cez_hdo import downloader
+from custom_components.cez_hdo.archive import DATA_ARCHIVES, ScheduleArchive, async_release_archive, get_archive
+from custom_components.cez_hdo.const import DOMAIN
+from tests.conftest import StubHass, signals_payload
+
+DAY = date(2026, 3, 2)
+TODAY = date(2026, 3, 3)
+SCHEDULE_A = "00:00-06:00; 20:00-24:00"
+SCHEDULE_B = "01:00-07:00; 13:00-15:00"
+
+
+def test_append_round_trip(tmp_path: Path) -> None:
+    archive = ScheduleArchive(tmp_path / "archive")
+    payload = signals_payload((DAY, "PTV1", SCHEDULE_A), (DAY, "PTV2", SCHEDULE_B), (TODAY, "PTV1", SCHEDULE_B))
+
+    assert archive.append(payload, today=TODAY) == 3
+    assert archive.append(payload, today=TODAY) == 0
+
+    assert archive.rows_for_day(DAY) == [("PTV1", SCHEDULE_A), ("PTV2", SCHEDULE_B)]
+    assert archive.days == [DAY, TODAY]
+    assert list(archive.iter_range(DAY, TODAY)) == [
+        (DAY, "PTV1", SCHEDULE_A),
+        (DAY, "PTV2", SCHEDULE_B),
+        (TODAY, "PTV1", SCHEDULE_B),
+    ]
+
+    # A fresh instance rebuilds the same index from the block headers
+    reopened = ScheduleArchive(tmp_path / "archive")
+    assert reopened.rows_for_day(DAY) == [("PTV1", SCHEDULE_A), ("PTV2", SCHEDULE_B)]
+    assert reopened.days == [DAY, TODAY]
+
+
+def test_timeline_for_matches_the_archived_payload(tmp_path: Path) -> None:
+    archive = ScheduleArchive(tmp_path / "archive")
+    payload = signals_payload((DAY, "PTV1", SCHEDULE_A), (DAY, "PTV2", SCHEDULE_B))
+    archive.append(payload, today=TODAY)
+
+    assert archive.timeline_for(DAY, "PTV1").boundaries == downloader.compile_timeline(payload, "PTV1").boundaries
+    assert archive.timeline_for(DAY, "PTV2").boundaries == downloader.compile_timeline(payload, "PTV2").boundaries
+
+
+def test_revision_back_to_an_older_schedule_is_archived(tmp_path: Path) -> None:
+    archive = ScheduleArchive(tmp_path / "archive")
+
+    assert archive.append(signals_payload((DAY, "PTV1", SCHEDULE_A)), today=TODAY) == 1
+    assert archive.append(signals_payload((DAY, "PTV1", SCHEDULE_B)), today=TODAY) == 1
+    assert archive.timeline_for(DAY).boundaries == downloader.compile_timeline(
+        signals_payload((DAY, "PTV1", SCHEDULE_B))
+    ).boundaries
+
+    # A -> B -> A: the schedule differs from the latest revision, so it is archived again
+    assert archive.append(signals_payload((DAY, "PTV1", SCHEDULE_A)), today=TODAY) == 1
+    assert archive.append(signals_payload((DAY, "PTV1", SCHEDULE_A)), today=TODAY) == 0
+
+    assert archive.rows_for_day(DAY) == [("PTV1", SCHEDULE_A), ("PTV1", SCHEDULE_B), ("PTV1", SCHEDULE_A)]
+    assert archive.timeline_for(DAY).boundaries == downloader.compile_timeline(
+        signals_payload((DAY, "PTV1", SCHEDULE_A))
+    ).boundaries
+
+
+def test_torn_tail_is_dropped(tmp_path: Path) -> None:
+    path = tmp_path / "archive"
+    ScheduleArchive(path).append(signals_payload((DAY, "PTV1", SCHEDULE_A)), today=TODAY)
+    size = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(b"HDOA\x00\x01")
+
+    archive = ScheduleArchive(path)
+
+    assert archive.rows_for_day(DAY) == [("PTV1", SCHEDULE_A)]
+    assert path.stat().st_size == size
+    assert archive.append(signals_payload((TODAY, "PTV1", SCHEDULE_B)), today=TODAY) == 1
+    assert ScheduleArchive(path).days == [DAY, TODAY]
+
+
+def test_compact_drops_expired_days_and_keeps_revisions(tmp_path: Path) -> None:
+    archive = ScheduleArchive(tmp_path / "archive", retention_days=10)
+    old_day = DAY - timedelta(days=30)
+    archive.append(signals_payload((old_day, "PTV1", SCHEDULE_A)), today=old_day)
+    archive.append(signals_payload((DAY, "PTV1", SCHEDULE_A)), today=old_day)
+    archive.append(signals_payload((DAY, "PTV1", SCHEDULE_B)), today=old_day)
+
+    archive.compact(TODAY)
+
+    assert archive.days == [DAY]
+    assert archive.rows_for_day(DAY) == [("PTV1", SCHEDULE_A), ("PTV1", SCHEDULE_B)]
+    # The latest revision (B) decides the tariff; the expired day is no longer archived
+    assert archive.tariff_at(datetime.combine(DAY, time(6, 30), tzinfo=downloader.CEZ_TIMEZONE)) is True
+    assert archive.tariff_at(datetime.combine(DAY, time(21, 0), tzinfo=downloader.CEZ_TIMEZONE)) is False
+    assert archive.tariff_at(datetime.combine(old_day, time(2, 0), tzinfo=downloader.CEZ_TIMEZONE)) is None
+
+
+def test_get_archive_is_shared_per_ean(hass: StubHass, tmp_path: Path) -> None:
+    archive = get_archive(hass, "859182400123456789")
+
+    assert get_archive(hass, "859182400123456789") is archive
+    assert archive.path == tmp_path / ".storage" / "cez_hdo_archive.456789"
+
+    async_release_archive(hass, "859182400123456789")
+    assert hass.data[DOMAIN][DATA_ARCHIVES] == {}
+    assert get_archive(hass, "859182400123456789") is not archive
@@ -0,0 +1,83 @@
+"""Tests for the NT/VT switches of a compiled tariff timeline."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+
+from custom_components.cez_hdo.downloader import CEZ_TIMEZONE, compile_timeline
+from tests.conftest import signals_payload
+
+FIRST_DAY = date(2026, 3, 1)
+SECOND_DAY = date(2026, 3, 2)
+
+
+def _epoch(day: date, hour: int, minute: int = 0) -> float:
+    return datetime.combine(day, time(hour, minute), tzinfo=CEZ_TIMEZONE).timestamp()
+
+
+def test_windows_inside_the_horizon_switch_both_ways() -> None:
+    timeline = compile_timeline(signals_payload((FIRST_DAY, "PTV1", "13:00-15:00; 17:30-19:45")))
+
+    assert timeline.transitions() == [
+        (_epoch(FIRST_DAY, 13), True),
+        (_epoch(FIRST_DAY, 15), False),
+        (_epoch(FIRST_DAY, 17, 30), True),
+        (_epoch(FIRST_DAY, 19, 45), False),
+    ]
+
+
+def test_edges_at_the_horizon_midnights_are_left_out() -> None:
+    schedule = "00:00-06:00; 20:00-24:00"
+    timeline = compile_timeline(signals_payload((FIRST_DAY, "PTV1", schedule), (SECOND_DAY, "PTV1", schedule)))
+
+    # The windows around the midnight between the days merge into one, and the
+    # first and the last midnight only cut the payload, they are no switches
+    assert timeline.transitions() == [
+        (_epoch(FIRST_DAY, 6), False),
+        (_epoch(FIRST_DAY, 20), True),
+        (_epoch(SECOND_DAY, 6), False),
+        (_epoch(SECOND_DAY, 20), True),
+    ]
+
+
+def test_transitions_agree_with_the_tariff() -> None:
+    timeline = compile_timeline(
+        signals_payload(
+            (FIRST_DAY, "PTV1", "00:00-06:00; 13:00-15:00; 20:00-24:00"),
+            (SECOND_DAY, "PTV1", "00:00-07:15; 8:15-9:15; 17:00-24:00"),
+        )
+    )
+
+    transitions = timeline.transitions()
+
+    assert transitions
+    assert [ts for ts, _low in transitions] == sorted(ts for ts, _low in transitions)
+    for ts, low_starts in transitions:
+        assert timeline.is_low_tariff(ts) is low_starts
+        assert timeline.is_low_tariff(ts - 1) is not low_starts
+
+
+def test_preferred_signal_selects_the_switches() -> None:
+    payload = signals_payload((FIRST_DAY, "PTV1", "13:00-15:00"), (FIRST_DAY, "PTV2", "01:00-05:00"))
+
+    assert compile_timeline(payload, "PTV2").transitions() == [
+        (_epoch(FIRST_DAY, 1), True),
+        (_epoch(FIRST_DAY, 5), False),
+    ]
+
+
+def test_dst_day_switches_at_local_times() -> None:
+    # Prague moves the clocks forward at 02:00 on 29.03.2026
+    dst_day = date(2026, 3, 29)
+    timeline = compile_timeline(signals_payload((dst_day, "PTV1", "00:00-06:00; 13:00-15:00")))
+
+    transitions = timeline.transitions()
+
+    assert transitions[0] == (_epoch(dst_day, 6), False)
+    assert transitions[0][0] - _epoch(dst_day, 0) == 5 * 3600
+    assert transitions[1:] == [(_epoch(dst_day, 13), True), (_epoch(dst_day, 15), False)]
+
+
+def test_empty_payload_has_no_switches() -> None:
+    assert compile_timeline({}).transitions() == []
+    assert compile_timeline(signals_payload((FIRST_DAY, "PTV1", ""))).transitions() == []
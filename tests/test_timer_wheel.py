@@ -0,0 +1,171 @@
+"""Tests for the domain-wide timer wheel."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from custom_components.cez_hdo import timer_wheel
+from custom_components.cez_hdo.const import DOMAIN
+from custom_components.cez_hdo.timer_wheel import DATA_TIMER_WHEEL, TimerWheel, get_timer_wheel
+from tests.conftest import StubHass
+
+START = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class LoopTimers:
+    """Record the event-loop timers armed by the wheel instead of scheduling them."""
+
+    def __init__(self) -> None:
+        self.armed: list[tuple[object, datetime]] = []
+
+    def track(self, hass, action, point):
+        entry = (action, point)
+        self.armed.append(entry)
+        return lambda: self.armed.remove(entry)
+
+    def fire(self) -> datetime:
+        """Fire the single armed timer at its point in time."""
+        assert len(self.armed) == 1
+        action, point = self.armed.pop()
+        action(point)
+        return point
+
+
+@pytest.fixture
+def loop_timers(monkeypatch: pytest.MonkeyPatch) -> LoopTimers:
+    timers = LoopTimers()
+    monkeypatch.setattr(timer_wheel, "async_track_point_in_utc_time", timers.track)
+    return timers
+
+
+def test_same_slot_timers_fire_in_one_batch(hass: StubHass, loop_timers: LoopTimers) -> None:
+    wheel = TimerWheel(hass)
+    fired: list[tuple[str, datetime]] = []
+    wheel.async_schedule("a", "boundary", START + timedelta(seconds=10.2), lambda now: fired.append(("a", now)))
+    wheel.async_schedule("b", "boundary", START + timedelta(seconds=10.7), lambda now: fired.append(("b", now)))
+
+    assert len(wheel) == 2
+    assert len(loop_timers.armed) == 1
+
+    point = loop_timers.fire()
+
+    # Deadlines are rounded up to the slot, never fired early
+    assert point == START + timedelta(seconds=11)
+    assert fired == [("a", point), ("b", point)]
+    assert len(wheel) == 0
+    assert loop_timers.armed == []
+
+
+def test_only_earliest_slot_is_armed(hass: StubHass, loop_timers: LoopTimers) -> None:
+    wheel = TimerWheel(hass)
+    fired: list[str] = []
+    wheel.async_schedule("a", "late", START + timedelta(seconds=20), lambda now: fired.append("late"))
+    wheel.async_schedule("b", "early", START + timedelta(seconds=10), lambda now: fired.append("early"))
+
+    assert [point for _action, point in loop_timers.armed] == [START + timedelta(seconds=10)]
+
+    loop_timers.fire()
+    assert fired == ["early"]
+    assert [point for _action, point in loop_timers.armed] == [START + timedelta(seconds=20)]
+
+    loop_timers.fire()
+    assert fired == ["early", "late"]
+    assert loop_timers.armed == []
+
+
+def test_scheduling_a_name_again_replaces_its_deadline(hass: StubHass, loop_timers: LoopTimers) -> None:
+    wheel = TimerWheel(hass)
+    fired: list[datetime] = []
+    wheel.async_schedule("a", "tick", START + timedelta(seconds=10), fired.append)
+    wheel.async_schedule("a", "tick", START + timedelta(seconds=30), fired.append)
+
+    assert len(wheel) == 1
+    assert wheel.is_scheduled("a", "tick")
+
+    # The emptied slot may still fire, but runs nothing and re-arms the next one
+    loop_timers.fire()
+    assert fired == []
+    loop_timers.fire()
+    assert fired == [START + timedelta(seconds=30)]
+    assert not wheel.is_scheduled("a", "tick")
+
+
+def test_cancel_owner_keeps_other_owners(hass: StubHass, loop_timers: LoopTimers) -> None:
+    wheel = TimerWheel(hass)
+    fired: list[str] = []
+    wheel.async_schedule("a", "boundary", START + timedelta(seconds=10), lambda now: fired.append("a"))
+    wheel.async_schedule("a", "tick", START + timedelta(seconds=15), lambda now: fired.append("a"))
+    wheel.async_schedule("b", "boundary", START + timedelta(seconds=10), lambda now: fired.append("b"))
+
+    wheel.async_cancel_owner("a")
+
+    assert len(wheel) == 1
+    assert not wheel.is_scheduled("a", "boundary")
+    loop_timers.fire()
+    assert fired == ["b"]
+    assert loop_timers.armed == []
+
+
+def test_cancelling_the_last_timer_disarms(hass: StubHass, loop_timers: LoopTimers) -> None:
+    wheel = TimerWheel(hass)
+    wheel.async_schedule("a", "tick", START + timedelta(seconds=10), lambda now: None)
+
+    wheel.async_cancel("a", "tick")
+    wheel.async_cancel("a", "missing")
+
+    assert len(wheel) == 0
+    assert loop_timers.armed == []
+
+
+def test_actions_reschedule_after_the_batch(hass: StubHass, loop_timers: LoopTimers) -> None:
+    wheel = TimerWheel(hass)
+    fired: list[str] = []
+
+    def tick(now: datetime) -> None:
+        fired.append("tick")
+        wheel.async_schedule("a", "tick", now + timedelta(seconds=5), tick)
+
+    wheel.async_schedule("a", "tick", START + timedelta(seconds=10), tick)
+    wheel.async_schedule("b", "expiry", START + timedelta(seconds=20), lambda now: fired.append("expiry"))
+
+    loop_timers.fire()
+
+    # The rescheduled tick is earlier than the pending expiry, so it is armed next
+    assert fired == ["tick"]
+    assert [point for _action, point in loop_timers.armed] == [START + timedelta(seconds=15)]
+    loop_timers.fire()
+    assert fired == ["tick", "tick"]
+
+    # The tick rescheduled to 20 s shares the expiry's slot and runs in its batch
+    loop_timers.fire()
+    assert fired == ["tick", "tick", "expiry", "tick"]
+    assert [point for _action, point in loop_timers.armed] == [START + timedelta(seconds=25)]
+
+
+def test_failing_action_does_not_stop_the_batch(
+    hass: StubHass, loop_timers: LoopTimers, caplog: pytest.LogCaptureFixture
+) -> None:
+    wheel = TimerWheel(hass)
+    fired: list[str] = []
+
+    def broken(now: datetime) -> None:
+        raise RuntimeError("boom")
+
+    wheel.async_schedule("a", "broken", START + timedelta(seconds=10), broken)
+    wheel.async_schedule("b", "boundary", START + timedelta(seconds=10), lambda now: fired.append("b"))
+
+    loop_timers.fire()
+
+    assert fired == ["b"]
+    assert "Timer broken of a failed" in caplog.text
+
+
+def test_get_timer_wheel_is_shared_per_hass(hass: StubHass, loop_timers: LoopTimers, tmp_path: Path) -> None:
+    wheel = get_timer_wheel(hass)
+
+    assert get_timer_wheel(hass) is wheel
+    assert hass.data[DOMAIN][DATA_TIMER_WHEEL] is wheel
+    assert get_timer_wheel(StubHass(tmp_path)) is not wheel